@@ -0,0 +1,10 @@
+"""
+ORBIT benchmark suite
+
+Headless performance benchmarks for the universe generator, chunk I/O,
+viewport queries and catalog operations.
+
+Usage:
+    python -m benchmarks run [--quick] [--only generation,viewport] [--output results.json]
+    python -m benchmarks compare old.json new.json
+"""
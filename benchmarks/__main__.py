@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+ORBIT benchmark runner
+
+Kullanım:
+    python -m benchmarks run [--quick] [--only generation,chunks,viewport,catalog]
+                             [--seed 1234] [--output bench_results.json]
+    python -m benchmarks compare <eski.json> <yeni.json>
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Depo kökünü path'e ekle (python -m benchmarks depo kökünden çalıştırılır)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from .common import DEFAULT_SEED, log
+from . import bench_generation, bench_chunks, bench_viewport, bench_catalog
+
+SUITES = {
+    "generation": bench_generation,
+    "chunks": bench_chunks,
+    "viewport": bench_viewport,
+    "catalog": bench_catalog,
+}
+
+
+def git_revision():
+    """Current commit hash, if the benchmarks are run from a git checkout"""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent.parent,
+            stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def run_suites(args):
+    names = args.only.split(",") if args.only else list(SUITES)
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        log(f"Unknown suite(s): {', '.join(unknown)} (available: {', '.join(SUITES)})")
+        return 2
+
+    import pygame
+
+    results = []
+    for name in names:
+        log(f"[{name}]")
+        results.extend(SUITES[name].run(args.seed, quick=args.quick))
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(),
+            "commit": git_revision(),
+            "seed": args.seed,
+            "quick": args.quick,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    log(f"Results written to {os.path.abspath(args.output)}")
+    return 0
+
+
+def compare_reports(args):
+    with open(args.old, 'r', encoding='utf-8') as f:
+        old = {r["name"]: r for r in json.load(f)["results"]}
+    with open(args.new, 'r', encoding='utf-8') as f:
+        new = {r["name"]: r for r in json.load(f)["results"]}
+
+    print(f"{'benchmark':<36} {'old (ms)':>12} {'new (ms)':>12} {'change':>9}")
+    for name in sorted(set(old) | set(new)):
+        if name not in old or name not in new:
+            side = "new" if name in new else "old"
+            print(f"{name:<36} {'(only in ' + side + ')':>35}")
+            continue
+        old_ms = old[name]["median_s"] * 1000
+        new_ms = new[name]["median_s"] * 1000
+        change = ((new_ms - old_ms) / old_ms * 100) if old_ms > 0 else 0.0
+        print(f"{name:<36} {old_ms:12.3f} {new_ms:12.3f} {change:+8.1f}%")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="ORBIT benchmarks")
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="Run benchmark suites")
+    run_parser.add_argument("--quick", action="store_true", help="Smaller sizes, fewer repeats")
+    run_parser.add_argument("--only", help="Comma separated suites: " + ",".join(SUITES))
+    run_parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed")
+    run_parser.add_argument("--output", default="bench_results.json", help="JSON results file")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        return compare_reports(args)
+    if args.command is None:
+        args = run_parser.parse_args([])
+    return run_suites(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Catalog operation latency by catalog size"""
+
+import random
+import contextlib
+import os
+
+from .common import Workspace, create_game, generate_universe, measure, summarize, log
+
+UNIVERSE_SIZE = 500
+CATALOG_SIZES = [100, 1000, 10000]
+QUICK_CATALOG_SIZES = [100, 1000]
+
+
+def build_catalog(objects, count):
+    """Synthetic catalog with `count` entries built from real universe objects"""
+    catalog = []
+    for i in range(count):
+        obj = objects[i % len(objects)]
+        catalog.append({
+            "name": f"{obj['name']}_{i}",
+            "type": obj.get('type'),
+            "x": obj['x'],
+            "y": obj['y'],
+            "prop": obj.get('prop'),
+            "resources": obj.get('resources', {}),
+            "saved_at": {"ship_x": obj['x'], "ship_y": obj['y'], "timestamp": "2025-01-01T00:00:00"}
+        })
+    return catalog
+
+
+def run(seed, quick=False):
+    catalog_sizes = QUICK_CATALOG_SIZES if quick else CATALOG_SIZES
+    repeat = 5 if quick else 20
+    results = []
+
+    with Workspace():
+        game = create_game()
+        name = "catalog_bench"
+        result = generate_universe(game, name, UNIVERSE_SIZE, "normal", seed)
+        objects = [obj for chunk in result["chunk_objects"].values() for obj in chunk]
+
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            game.setup_session_structure(name, name)
+        game.current_session_name = name
+        random.seed(seed)
+        game.start_mission(1)
+        game.matrix_objects = objects[:50]
+
+        for catalog_size in catalog_sizes:
+            catalog = build_catalog(objects, catalog_size)
+
+            def reset_catalog():
+                # Catalog lives in memory; replace it and its snapshot (cats.json)
+                game.save_catalog(catalog)
+                game.catalog_lines = []
+
+            target = game.matrix_objects[0]['name']
+            lookup_name = catalog[-1]['name']
+            operations = {
+                "save": lambda: game.save_celestial_to_catalog(target),
+                "save_all": game.save_all_matrix_objects_to_catalog,
+                "list": game.list_catalog,
+                "resume": game.show_catalog_resume,
+                "lookup": lambda: game.teleport_to_catalog_object(lookup_name),
+            }
+
+            for op_name, op in operations.items():
+                samples = measure(op, repeat, setup=reset_catalog)
+                summary = summarize(samples)
+                log(f"  catalog {op_name:>8} @ {catalog_size:>6}: {summary['median_s'] * 1e3:9.2f} ms")
+                results.append({
+                    "name": f"catalog/{op_name}/{catalog_size}",
+                    "params": {"operation": op_name, "catalog_size": catalog_size, "seed": seed},
+                    **summary,
+                })
+
+    return results
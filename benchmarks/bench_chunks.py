@@ -0,0 +1,68 @@
+"""Chunk decode latency by universe format"""
+
+import json
+import contextlib
+import os
+
+from .common import Workspace, create_game, generate_universe, measure, summarize, log
+
+SIZE = 1000
+QUICK_SIZE = 500
+
+
+def write_legacy_universe(name, size, chunk_objects):
+    """Write the same objects in the old single-file format (universes/<name>.json)"""
+    objects = []
+    for chunk in chunk_objects.values():
+        for obj in chunk:
+            objects.append({"x": obj["x"], "y": obj["y"], "type": obj["type"], "name": obj["name"]})
+    with open(f"universes/{name}.json", 'w', encoding='utf-8') as f:
+        json.dump({"size": size, "objects": objects}, f, indent=2)
+    return len(objects)
+
+
+def run(seed, quick=False):
+    size = QUICK_SIZE if quick else SIZE
+    repeat = 3 if quick else 10
+    results = []
+
+    with Workspace():
+        game = create_game()
+        name = "chunk_bench"
+        result = generate_universe(game, name, size, "normal", seed)
+        chunk_coords = sorted(result["chunk_objects"].keys())
+        manager = game.chunk_manager
+
+        # Chunk-based format: cold load of every chunk file
+        def load_all_chunks():
+            for chunk_x, chunk_y in chunk_coords:
+                manager.load_chunk(chunk_x, chunk_y, name)
+
+        samples = measure(load_all_chunks, repeat, setup=manager.clear)
+        per_chunk = [s / len(chunk_coords) for s in samples]
+        summary = summarize(per_chunk, chunks=len(chunk_coords))
+        log(f"  chunk decode   chunk-based: {summary['median_s'] * 1e6:9.1f} us/chunk")
+        results.append({
+            "name": "chunk_decode/chunk-based",
+            "params": {"format": "chunk-based", "size": size, "seed": seed},
+            **summary,
+        })
+
+        # Old single-file format: the whole universe is decoded at once
+        legacy_name = "legacy_bench"
+        object_count = write_legacy_universe(legacy_name, size, result["chunk_objects"])
+
+        def load_legacy():
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                game.load_universe(f"universes/{legacy_name}.json")
+
+        samples = measure(load_legacy, repeat)
+        summary = summarize(samples, objects=object_count)
+        log(f"  chunk decode   single-file: {summary['median_s'] * 1e3:9.1f} ms/universe")
+        results.append({
+            "name": "chunk_decode/single-file",
+            "params": {"format": "single-file", "size": size, "seed": seed},
+            **summary,
+        })
+
+    return results
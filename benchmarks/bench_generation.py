@@ -0,0 +1,49 @@
+"""Universe generation throughput by size and preset"""
+
+import time
+
+from .common import (
+    Workspace, create_game, generate_universe, count_generated_objects,
+    summarize, log,
+)
+
+SIZES = [200, 500, 1000]
+QUICK_SIZES = [200, 500]
+PRESETS = ["sparse", "normal", "dense"]
+
+
+def run(seed, quick=False):
+    sizes = QUICK_SIZES if quick else SIZES
+    repeat = 1 if quick else 3
+    results = []
+
+    with Workspace():
+        game = create_game()
+        for preset in PRESETS:
+            for size in sizes:
+                samples = []
+                object_count = 0
+                chunk_count = 0
+                for i in range(repeat):
+                    name = f"gen_{preset}_{size}_{i}"
+                    start = time.perf_counter()
+                    result = generate_universe(game, name, size, preset, seed)
+                    samples.append(time.perf_counter() - start)
+                    object_count = count_generated_objects(result)
+                    chunk_count = len(result["chunk_objects"])
+
+                summary = summarize(
+                    samples,
+                    objects=object_count,
+                    chunks=chunk_count,
+                    objects_per_s=object_count / min(samples) if min(samples) > 0 else 0.0,
+                )
+                log(f"  generation {preset:>6} {size:>5}: {summary['median_s'] * 1000:9.1f} ms, "
+                    f"{object_count} objects")
+                results.append({
+                    "name": f"generation/{preset}/{size}",
+                    "params": {"preset": preset, "size": size, "seed": seed},
+                    **summary,
+                })
+
+    return results
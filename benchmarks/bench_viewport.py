@@ -0,0 +1,56 @@
+"""Viewport query latency (get_objects_in_area) by matrix size"""
+
+import random
+
+from .common import Workspace, create_game, generate_universe, measure, summarize, log
+
+SIZE = 1000
+QUICK_SIZE = 500
+MATRIX_SIZES = [20, 50, 100]
+
+
+def run(seed, quick=False):
+    size = QUICK_SIZE if quick else SIZE
+    queries = 50 if quick else 200
+    results = []
+
+    with Workspace():
+        game = create_game()
+        name = "viewport_bench"
+        generate_universe(game, name, size, "normal", seed)
+        manager = game.chunk_manager
+
+        for matrix_size in MATRIX_SIZES:
+            rng = random.Random(seed + matrix_size)
+            half = matrix_size // 2
+            origins = [
+                (rng.randint(0, size - 1) - half, rng.randint(0, size - 1) - half)
+                for _ in range(queries)
+            ]
+
+            for mode in ("cold", "warm"):
+                samples = []
+                for start_x, start_y in origins:
+                    def query():
+                        manager.get_objects_in_area(
+                            start_x, start_y,
+                            start_x + matrix_size - 1, start_y + matrix_size - 1,
+                            name
+                        )
+                    if mode == "warm":
+                        query()  # chunk'ları önceden yükle
+                        setup = None
+                    else:
+                        setup = manager.clear
+                    samples.extend(measure(query, 1, setup=setup))
+
+                summary = summarize(samples)
+                log(f"  viewport {matrix_size:>3}x{matrix_size:<3} {mode}: "
+                    f"{summary['median_s'] * 1e6:9.1f} us/query")
+                results.append({
+                    "name": f"viewport/{matrix_size}/{mode}",
+                    "params": {"matrix_size": matrix_size, "mode": mode, "size": size, "seed": seed},
+                    **summary,
+                })
+
+    return results
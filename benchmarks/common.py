@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+import statistics
+import contextlib
+
+# Pygame'i pencere açmadan çalıştır
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+DEFAULT_SEED = 1234
+
+
+class Workspace:
+    """Temporary working directory holding universes/ and sessions/"""
+
+    def __init__(self):
+        self.path = None
+        self.previous_cwd = None
+
+    def __enter__(self):
+        self.previous_cwd = os.getcwd()
+        self.path = tempfile.mkdtemp(prefix="orbit-bench-")
+        os.chdir(self.path)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        os.chdir(self.previous_cwd)
+        shutil.rmtree(self.path, ignore_errors=True)
+        return False
+
+
+def create_game():
+    """Create a headless game instance (display uses the dummy SDL driver)"""
+    from orbit import SpaceGamePygame
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        game = SpaceGamePygame()
+    return game
+
+
+def generate_universe(game, name, size, preset="normal", seed=DEFAULT_SEED):
+    """Generate a chunk-based universe with a fixed seed and make it current"""
+    random.seed(seed)
+    game.universe_size = size
+    game.chunk_manager.universe_size = size
+    result = game.create_advanced_universe(name, size, size, preset)
+    game.current_universe_name = name
+    return result
+
+
+def count_generated_objects(result):
+    return sum(len(objects) for objects in result["chunk_objects"].values())
+
+
+def measure(func, repeat, setup=None):
+    """Run func `repeat` times and return the wall-clock samples in seconds"""
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples, **extra):
+    """Summary statistics of timing samples (seconds)"""
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    summary = {
+        "n": len(samples),
+        "min_s": ordered[0],
+        "median_s": statistics.median(ordered),
+        "mean_s": statistics.mean(ordered),
+        "p95_s": ordered[p95_index],
+        "stdev_s": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+    summary.update(extra)
+    return summary
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
@@ -18,16 +18,17 @@ import time
 import random
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 import math
+import itertools
 
 # Import modules
 from .modules import (
-    Colors, Direction, CelestialType, StarType, BlackHoleClass,
-    PlanetType, ResourceType, ResourceRichness,
-    CelestialObject, Star, BlackHole, Planet, AsteroidBelt,
-    Ship, ChunkManager, UniverseConstants, LocaleManager
+    Colors, Direction, CelestialType, ResourceRichness, CelestialObject,
+    Ship, ChunkManager, UniverseConstants, LocaleManager,
+    UniverseGenerator, TextCache, MatrixRenderer, CatalogStore, StatsManifest,
+    ResourceIndex, SpatialIndex, Query, MapIndex, MapSnapshot, OccupancyRaster
 )
 
 # Pygame başlat
@@ -41,6 +42,9 @@ pygame.init()
 
 # Main game class
 class SpaceGamePygame:
+    # Bağımsız yeniden çizilen ekran panelleri (çizim sırasıyla)
+    PANELS = ("console", "matrix", "dashboard", "probe", "command")
+    
     def __init__(self):
         # Initialize locale manager
         self.locale = LocaleManager("en")  # Default to English
@@ -191,6 +195,16 @@ class SpaceGamePygame:
             self.font_mono = pygame.font.Font(None, 12)
             print("Sistem font'u kullanılıyor!")
         
+        # Render edilmiş metin surface'leri için ortak LRU önbellek
+        self.text_cache = TextCache()
+        
+        # Matris hücreleri için palet indeksli renderer
+        self.matrix_renderer = MatrixRenderer()
+        
+        # Yön hattı + gösterge overlay şeridi önbelleği
+        self.direction_overlay = None
+        self.direction_overlay_key = None
+        
         # Oyun durumu
         self.running = True
         self.universe_size = 500
@@ -200,17 +214,29 @@ class SpaceGamePygame:
         # Grid durumu
         self.grid_enabled = False  # Varsayılan olarak kapalı
         
+        # Statik katman önbellekleri (grid çizgileri ve koordinat etiketleri)
+        self.grid_layer = None
+        self.grid_layer_key = None
+        self.label_layer = None
+        self.label_layer_key = None
+        
         # Radar alarm sistemi
         self.radar_alarm = False  # Gök cismi alarmı
-        self.alarm_blink_timer = 0  # Yanıp sönme timer'ı
-        self.coord_blink_timer = 0  # Koordinat yanıp sönme timer'ı
+        self.blink_interval_ms = 250  # Yanıp sönme yarım periyodu (eskiden 15 frame @ 60 FPS)
+        
+        # Dirty-rect render: sadece değişen paneller yeniden çizilir
+        self.dirty_panels = set(self.PANELS)
+        self.panel_signatures = {}
+        self.max_fps = 60  # Animasyon varken frame cap; boştayken event.wait ile beklenir
+        self.catalog_store = None  # Aktif oturumun bellekteki katalogu
+        self.map_index = None  # Aktif oturumun maps/index.json özeti
         
         # Chunk Manager
         self.chunk_manager = ChunkManager(self.universe_size, 100)
         self.current_universe_name = "uzay"
         self.mission_started = False
-        self.last_position_update = datetime.now()
         self.matrix_objects = []  # Matrix'teki gök cisimleri
+        self.matrix_objects_by_name = (None, {})  # (kaynak liste, isim -> cisim)
         
         # UI alanları - Yeni 3 bölümlü düzen
         self.left_width = int(self.screen_width * 0.30)      # Sol %30 - Linux konsolu
@@ -232,11 +258,13 @@ class SpaceGamePygame:
         
         # Komut satırı yüksekliği
         self.command_height = 50
+        self.current_command = ""
         
-        # Konsol için
+        # Konsol için - (metin, renk, wrap edilmiş satırlar)
         self.console_lines = []
         self.max_console_lines = 50  # Daha fazla satır
         self.console_scroll = 0
+        self.console_wrap_width = self.get_console_wrap_width()
         
         # Matrix görüntü için
         self.matrix_lines = []
@@ -263,7 +291,20 @@ class SpaceGamePygame:
         self.points_per_10_minutes = 100  # 10 dakikada 100 nokta
         self.seconds_per_point = 6  # 1 noktaya 6 saniye
         self.speed_factor = 1.0  # Hız çarpanı (1.0 = normal hız)
-        self.last_position_update = datetime.now()
+        
+        # Sabit adımlı simülasyon saati
+        self.time_warp = 1.0  # Simülasyon zamanı / gerçek zaman
+        self.max_sim_steps_per_frame = 5000
+        self.sim_accumulator = 0.0
+        self.last_sim_time = time.monotonic()
+        
+        # find sorgusu sonuçları (sayfa sayfa tüketilen iterator)
+        self.find_results = None
+        self.find_result_count = 0
+        self.find_page_size = 20
+        
+        # Map yükleme / teleport sonrası chunk'lar arka planda okunurken çizilen önizleme
+        self.viewport_preview = None
         
         # Matris yeniden render için
         self.last_matrix_center_x = 0
@@ -283,18 +324,83 @@ class SpaceGamePygame:
     def clear_screen(self):
         """Ekranı temizle - Yeni tasarım için"""
         self.screen.fill(Colors.BLACK)
+        self.mark_dirty(*self.PANELS)
+    
+    def get_panel_rect(self, panel: str) -> pygame.Rect:
+        """Panelin ekrandaki alanı (komut satırı tüm panellerin altında)"""
+        content_height = self.screen_height - self.command_height
+        right_x = self.left_width + self.center_width
+        if panel == "console":
+            return pygame.Rect(0, 0, self.left_width, content_height)
+        if panel == "matrix":
+            return pygame.Rect(self.left_width, 0, self.center_width, content_height)
+        if panel == "dashboard":
+            return pygame.Rect(right_x, 0, self.right_width, self.dashboard_height)
+        if panel == "probe":
+            return pygame.Rect(right_x, self.dashboard_height, self.right_width,
+                               content_height - self.dashboard_height)
+        return pygame.Rect(0, content_height, self.screen_width, self.command_height)
+    
+    def mark_dirty(self, *panels):
+        """Panelleri bir sonraki frame'de yeniden çizilmek üzere işaretle"""
+        self.dirty_panels.update(panels or self.PANELS)
+    
+    def is_blink_visible(self) -> bool:
+        """Yanıp sönen öğelerin görünür fazı (frame sayısından bağımsız)"""
+        return (pygame.time.get_ticks() // self.blink_interval_ms) % 2 == 0
+    
+    def get_panel_signature(self, panel: str):
+        """Zamanla veya oyun durumuyla değişen panellerin imzası - değişirse panel kirlenir"""
+        ship = self.ship if self.mission_started else None
+        if panel == "matrix":
+            if not ship:
+                return None
+            return (ship.x, ship.y, ship.direction, self.engine_on, self.grid_enabled,
+                    self.matrix_size, self.current_universe_name)
+        if panel == "dashboard":
+            if not ship:
+                return None
+            blinking = not self.engine_on or self.radar_alarm
+            return (self.get_mission_time(), ship.x, ship.y, ship.direction, ship.speed,
+                    self.speed_factor, self.time_warp, ship.energy, self.engine_on, self.radar_alarm,
+                    self.is_blink_visible() if blinking else None)
+        if panel == "command":
+            return (self.current_command, ship and ship.direction, ship and ship.is_moving,
+                    int(time.time() * 2) % 2)
+        return None
+    
+    def render_dirty_panels(self):
+        """Kirli panelleri kendi alanlarına kırparak çiz ve sadece o alanları ekrana gönder"""
+        panel_painters = (
+            ("console", self.print_console),            # Sol - Konsol (wrap ile)
+            ("matrix", self.print_matrix_display),      # Orta - Grid
+            ("dashboard", self.print_dashboard_panel),  # Sağ üst - Dashboard
+            ("probe", self.print_probe_panel),          # Sağ alt - Catalogs
+            ("command", self.print_command_line),       # Alt - Komut satırı
+        )
         
-        # Sol panel arka planı (siyah - Linux konsolu)
-        left_rect = pygame.Rect(0, 0, self.left_width, self.screen_height)
-        pygame.draw.rect(self.screen, Colors.BLACK, left_rect)
+        updated_rects = []
+        for panel, painter in panel_painters:
+            # İmza kontrolü sırayla yapılır: matrix çizimi radar_alarm'ı günceller, dashboard onu kullanır
+            signature = self.get_panel_signature(panel)
+            if signature != self.panel_signatures.get(panel):
+                self.panel_signatures[panel] = signature
+                self.dirty_panels.add(panel)
+            
+            if panel not in self.dirty_panels:
+                continue
+            
+            rect = self.get_panel_rect(panel)
+            self.screen.set_clip(rect)
+            self.screen.fill(Colors.BLACK, rect)
+            painter()
+            updated_rects.append(rect)
         
-        # Orta panel arka planı (siyah - Grid)
-        center_rect = pygame.Rect(self.left_width, 0, self.center_width, self.screen_height)
-        pygame.draw.rect(self.screen, Colors.BLACK, center_rect)
+        self.screen.set_clip(None)
+        self.dirty_panels.clear()
         
-        # Sağ panel arka planı (siyah - Dashboard/Radar/Sonda)
-        right_rect = pygame.Rect(self.left_width + self.center_width, 0, self.right_width, self.screen_height)
-        pygame.draw.rect(self.screen, Colors.BLACK, right_rect)
+        if updated_rects:
+            pygame.display.update(updated_rects)
     
     def print_header(self):
         """Başlık çiz - kaldırıldı"""
@@ -302,6 +408,10 @@ class SpaceGamePygame:
     
     
     
+    def render_text(self, font, text, color):
+        """Metni önbellekten render et - aynı (font, metin, renk) tekrar rasterize edilmez"""
+        return self.text_cache.render(font, text, color)
+    
     def add_command_output(self, text: str, color=Colors.WHITE):
         """Komut çıktısına satır ekle"""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -311,22 +421,36 @@ class SpaceGamePygame:
     
     def add_console_line(self, text: str, color=Colors.WHITE):
         """Linux konsoluna yeni satır ekle (zaman damgası olmadan)"""
-        self.console_lines.append((text, color))
-        if len(self.console_lines) > self.max_console_lines * 2:
-            self.console_lines = self.console_lines[-self.max_console_lines:]
+        self.append_console_entry(text, color)
     
     def add_command_line(self, command: str):
         """Komut satırını yeşil renkte ve saat ile ekle"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.console_lines.append((f"[{timestamp}] > {command}", Colors.GREEN))
+        self.append_console_entry(f"[{timestamp}] > {command}", Colors.GREEN)
+    
+    def append_console_entry(self, text: str, color):
+        """Konsol satırını eklerken bir kez wrap et - (metin, renk, wrap edilmiş satırlar)"""
+        self.console_lines.append((text, color, self.wrap_text(text, self.get_console_wrap_width())))
+        self.mark_dirty("console")
         if len(self.console_lines) > self.max_console_lines * 2:
             self.console_lines = self.console_lines[-self.max_console_lines:]
     
+    def get_console_wrap_width(self):
+        """Konsol satırlarının wrap genişliği - sağ taraftan 20px boşluk"""
+        return self.left_width - 20
+    
+    def rewrap_console(self):
+        """Panel genişliği değiştiğinde tüm konsol satırlarını yeniden wrap et"""
+        self.console_wrap_width = self.get_console_wrap_width()
+        self.console_lines = [(text, color, self.wrap_text(text, self.console_wrap_width))
+                              for text, color, _ in self.console_lines]
+    
     def add_catalog_line(self, text: str, color=Colors.WHITE):
         """Catalog alanına yeni satır ekle"""
         if not hasattr(self, 'catalog_lines'):
             self.catalog_lines = []
         self.catalog_lines.append((text, color))
+        self.mark_dirty("probe")
         if len(self.catalog_lines) > 50:  # Maksimum 50 satır
             self.catalog_lines = self.catalog_lines[-50:]
     
@@ -350,32 +474,28 @@ class SpaceGamePygame:
             end_index = len(self.console_lines) - self.console_scroll
             visible_lines = self.console_lines[start_index:end_index]
         
-        line_offset = 0
-        for i, (line, color) in enumerate(visible_lines):
-            if y_start + (i + line_offset) * 16 < self.console_height - 60:  # Komut satırı için yer bırak
-                # Text wrap için satırı böl
-                max_width = self.left_width - 20  # Sağ taraftan 20px boşluk
-                wrapped_lines = self.wrap_text(line, max_width)
-                
-                # Her wrapped satırı çiz
-                for j, wrapped_line in enumerate(wrapped_lines):
-                    current_y = y_start + (i + line_offset + j) * 16
-                    if current_y < self.console_height - 60:
-                        text_surface = self.font_mono.render(wrapped_line, True, color)
-                        self.screen.blit(text_surface, (10, current_y))
-                
-                # Wrap text olduğunda satırlar arasında boşluk bırak
-                if len(wrapped_lines) > 1:
-                    line_offset += len(wrapped_lines) - 1
+        # Panel genişliği değiştiyse satırlar bir kez yeniden wrap edilir
+        if self.console_wrap_width != self.get_console_wrap_width():
+            self.rewrap_console()
+        
+        # Satırlar eklenirken wrap edildi - burada sadece görünür satırlar blit edilir
+        row = 0
+        for line, color, wrapped_lines in visible_lines:
+            for wrapped_line in wrapped_lines:
+                current_y = y_start + row * 16
+                if current_y >= self.console_height - 60:  # Komut satırı için yer bırak
+                    return
+                text_surface = self.render_text(self.font_mono, wrapped_line, color)
+                self.screen.blit(text_surface, (10, current_y))
+                row += 1
     
-    def wrap_text(self, text, max_width):
-        """Text'i belirtilen genişliğe göre wrap yap"""
+    def wrap_text(self, text, max_width, font=None):
+        """Text'i belirtilen genişliğe göre wrap yap - surface render etmeden font.size ile ölçer"""
         if not text:
             return [""]
         
-        # Font ile text genişliğini hesapla
-        test_surface = self.font_mono.render(text, True, Colors.WHITE)
-        if test_surface.get_width() <= max_width:
+        font = font or self.font_mono
+        if font.size(text)[0] <= max_width:
             return [text]
         
         # Text'i wrap yap
@@ -385,8 +505,7 @@ class SpaceGamePygame:
         
         for word in words:
             test_line = current_line + (" " if current_line else "") + word
-            test_surface = self.font_mono.render(test_line, True, Colors.WHITE)
-            if test_surface.get_width() <= max_width:
+            if font.size(test_line)[0] <= max_width:
                 current_line = test_line
             else:
                 if current_line:
@@ -433,12 +552,12 @@ class SpaceGamePygame:
         pygame.draw.rect(self.screen, Colors.BLACK, matrix_rect)
         pygame.draw.rect(self.screen, Colors.GREEN, matrix_rect, 2)  # Matris alanı etrafında yeşil çizgi
         
-        # Grid çizgileri - grid_enabled durumuna göre
-        if self.grid_enabled:
-            self.draw_grid(matrix_rect)
-        
         # 40x40 görsel matris çiz
         self.draw_visual_matrix(matrix_rect)
+        
+        # Grid çizgileri - grid_enabled durumuna göre (hücrelerin üstüne, yoksa hücreler örter)
+        if self.grid_enabled:
+            self.draw_grid(matrix_rect)
     
     def print_dashboard_panel(self):
         """Sağ üst - Dashboard paneli"""
@@ -455,22 +574,18 @@ class SpaceGamePygame:
         
         # Zaman ve Dashboard başlığı
         mission_time = self.get_mission_time()
-        time_surface = self.font_xlarge.render(mission_time, True, Colors.WHITE)
+        time_surface = self.render_text(self.font_xlarge, mission_time, Colors.WHITE)
         self.screen.blit(time_surface, (x_start, y_start))
         
-        dashboard_title = self.font_large.render("DashBoard", True, Colors.WHITE)
+        dashboard_title = self.render_text(self.font_large, "DashBoard", Colors.WHITE)
         self.screen.blit(dashboard_title, (x_start, y_start + 30))
         
         # Koordinatlar - Hareket durumuna göre renk ve yanıp sönme
         if not self.engine_on:
             # Engine off - Kırmızı ve yanıp sönsün
-            self.coord_blink_timer += 1
-            if self.coord_blink_timer > 30:  # 30 frame'de bir yanıp söner
-                self.coord_blink_timer = 0
-            
-            if self.coord_blink_timer < 15:  # İlk 15 frame görünür
+            if self.is_blink_visible():
                 coord_text = f"{self.ship.x} : {self.ship.y}"
-                coord_surface = self.font_large.render(coord_text, True, Colors.RED)
+                coord_surface = self.render_text(self.font_large, coord_text, Colors.RED)
                 self.screen.blit(coord_surface, (x_start, y_start + 60))
         else:
             # Engine on - Yöne göre renk
@@ -479,11 +594,11 @@ class SpaceGamePygame:
                 x_text = f"{self.ship.x}"
                 y_text = f"{self.ship.y}"
                 
-                x_surface = self.font_large.render(x_text, True, Colors.DARK_GRAY)
-                y_surface = self.font_large.render(y_text, True, Colors.GREEN)
+                x_surface = self.render_text(self.font_large, x_text, Colors.DARK_GRAY)
+                y_surface = self.render_text(self.font_large, y_text, Colors.GREEN)
                 
                 # " : " ayırıcısı
-                separator_surface = self.font_large.render(" : ", True, Colors.WHITE)
+                separator_surface = self.render_text(self.font_large, " : ", Colors.WHITE)
                 
                 # Pozisyonları hesapla
                 x_width = x_surface.get_width()
@@ -497,11 +612,11 @@ class SpaceGamePygame:
                 x_text = f"{self.ship.x}"
                 y_text = f"{self.ship.y}"
                 
-                x_surface = self.font_large.render(x_text, True, Colors.GREEN)
-                y_surface = self.font_large.render(y_text, True, Colors.DARK_GRAY)
+                x_surface = self.render_text(self.font_large, x_text, Colors.GREEN)
+                y_surface = self.render_text(self.font_large, y_text, Colors.DARK_GRAY)
                 
                 # " : " ayırıcısı
-                separator_surface = self.font_large.render(" : ", True, Colors.WHITE)
+                separator_surface = self.render_text(self.font_large, " : ", Colors.WHITE)
                 
                 # Pozisyonları hesapla
                 x_width = x_surface.get_width()
@@ -516,36 +631,33 @@ class SpaceGamePygame:
         # Hız bilgisi (sarı) - Saniye/Nokta
         effective_speed = self.ship.speed / self.speed_factor
         speed_text = f"{effective_speed:.2f} sn/nokta"
-        speed_surface = self.font_medium.render(speed_text, True, Colors.YELLOW)
+        if self.time_warp != 1.0:
+            speed_text += f" x{self.time_warp:g}"
+        speed_surface = self.render_text(self.font_medium, speed_text, Colors.YELLOW)
         self.screen.blit(speed_surface, (x_start, y_start + 85))
         
         # 24 saat hız bilgisi (yeşil)
         if hasattr(self, 'required_24h_speed') and self.required_24h_speed > 0:
             required_speed_text = f"24h: {self.required_seconds_per_point:.2f} sn/nokta"
-            required_speed_surface = self.font_medium.render(required_speed_text, True, Colors.GREEN)
+            required_speed_surface = self.render_text(self.font_medium, required_speed_text, Colors.GREEN)
             self.screen.blit(required_speed_surface, (x_start, y_start + 105))
         
         # Enerji bilgisi (sarı)
         energy_text = f"{self.ship.energy} Nokta"
-        energy_surface = self.font_medium.render(energy_text, True, Colors.YELLOW)
+        energy_surface = self.render_text(self.font_medium, energy_text, Colors.YELLOW)
         self.screen.blit(energy_surface, (x_start, y_start + 160))
         
         energy_percent = (self.ship.energy / self.ship.max_energy) * 100
         energy_percent_text = f"(%{energy_percent:.1f})"
-        energy_percent_surface = self.font_medium.render(energy_percent_text, True, Colors.YELLOW)
+        energy_percent_surface = self.render_text(self.font_medium, energy_percent_text, Colors.YELLOW)
         self.screen.blit(energy_percent_surface, (x_start, y_start + 180))
         
         # Alert sistemi - Dashboard'ın sonuna eklendi
         if self.radar_alarm:
-            # Yanıp sönme efekti için timer
-            self.alarm_blink_timer += 1
-            if self.alarm_blink_timer > 30:  # 30 frame'de bir yanıp söner
-                self.alarm_blink_timer = 0
-            
             # Yanıp sönme kontrolü
-            if self.alarm_blink_timer < 15:  # İlk 15 frame görünür
+            if self.is_blink_visible():
                 alert_text = "[ALERT] CELESTIAL OBJECTS"
-                alert_surface = self.font_medium.render(alert_text, True, Colors.RED)
+                alert_surface = self.render_text(self.font_medium, alert_text, Colors.RED)
                 self.screen.blit(alert_surface, (x_start, y_start + 200))
     
     
@@ -564,7 +676,7 @@ class SpaceGamePygame:
         x_start = catalogs_x + 10
         
         # Catalogs başlığı
-        catalogs_title = self.font_large.render("Catalogs", True, Colors.WHITE)
+        catalogs_title = self.render_text(self.font_large, "Catalogs", Colors.WHITE)
         self.screen.blit(catalogs_title, (x_start, y_start))
         
         # Catalog çıktılarını göster
@@ -573,13 +685,13 @@ class SpaceGamePygame:
             for text, color in self.catalog_lines[-20:]:  # Son 20 satırı göster
                 if y_offset > catalogs_y + self.probe_height - 20:
                     break
-                text_surface = self.font_small.render(text, True, color)
+                text_surface = self.render_text(self.font_small, text, color)
                 self.screen.blit(text_surface, (x_start, y_offset))
                 y_offset += 16
         else:
             # Sadece "Ready" yazısı göster
             ready_text = self.locale.get("catalog.ready")
-            ready_surface = self.font_medium.render(ready_text, True, Colors.GREEN)
+            ready_surface = self.render_text(self.font_medium, ready_text, Colors.GREEN)
             self.screen.blit(ready_surface, (x_start, y_start + 40))
     
     def get_direction_text(self):
@@ -651,43 +763,34 @@ class SpaceGamePygame:
             self.direction_indicator_x = self.matrix_start_x + self.matrix_size - 1
             self.direction_indicator_y = self.ship.y
     
-    def get_direction_line_cells(self):
-        """Gemi'nin yönündeki tüm hücreleri döndür"""
-        cells = []
-        
-        if self.ship.direction in [Direction.UP, Direction.DOWN]:
-            # Yukarı/Aşağı - En üstteki aynı Y'deki tüm X'ler (yatay çizgi)
-            for x in range(self.matrix_start_x, self.matrix_start_x + self.matrix_size):
-                cells.append((x, self.direction_indicator_y))
-        elif self.ship.direction == Direction.RIGHT:
-            # Sağa - Aynı X'deki tüm Y'ler (dikey çizgi - sağ kenar)
-            for y in range(self.matrix_start_y, self.matrix_start_y + self.matrix_size):
-                cells.append((self.direction_indicator_x, y))
-        elif self.ship.direction == Direction.LEFT:
-            # Sola - Aynı X'deki tüm Y'ler (dikey çizgi - sol kenar)
-            for y in range(self.matrix_start_y, self.matrix_start_y + self.matrix_size):
-                cells.append((self.direction_indicator_x, y))
-        
-        return cells
-    
     def draw_grid(self, matrix_rect):
-        """Grid çizgilerini çiz - grid_enabled durumuna göre"""
+        """Grid çizgilerini çiz - grid_enabled durumuna göre (önbellekteki katmandan tek blit)"""
         if not self.grid_enabled:
             return
-            
+        
+        # Grid sadece matris ve hücre boyutuna bağlı
+        layer_key = (self.matrix_size, self.cell_size)
+        if self.grid_layer_key != layer_key:
+            self.grid_layer = self.build_grid_layer(matrix_rect.width, matrix_rect.height)
+            self.grid_layer_key = layer_key
+        
+        self.screen.blit(self.grid_layer, matrix_rect.topleft)
+    
+    def build_grid_layer(self, width, height):
+        """Grid çizgilerini şeffaf bir off-screen surface'e çiz"""
+        layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        
         # Dikey çizgiler
         for i in range(1, self.matrix_size):
-            x_pos = matrix_rect.left + i * self.cell_size
-            pygame.draw.line(self.screen, Colors.LIGHT_GRAY, 
-                           (x_pos, matrix_rect.top), 
-                           (x_pos, matrix_rect.bottom), 1)
+            x_pos = i * self.cell_size
+            pygame.draw.line(layer, Colors.LIGHT_GRAY, (x_pos, 0), (x_pos, height), 1)
         
         # Yatay çizgiler
         for j in range(1, self.matrix_size):
-            y_pos = matrix_rect.top + j * self.cell_size
-            pygame.draw.line(self.screen, Colors.LIGHT_GRAY, 
-                           (matrix_rect.left, y_pos), 
-                           (matrix_rect.right, y_pos), 1)
+            y_pos = j * self.cell_size
+            pygame.draw.line(layer, Colors.LIGHT_GRAY, (0, y_pos), (width, y_pos), 1)
+        
+        return layer
     
     def draw_visual_matrix(self, matrix_rect):
         """Chunk-based dinamik matris çiz"""
@@ -710,6 +813,9 @@ class SpaceGamePygame:
             
             # Chunk'ları güncelle
             self.chunk_manager.unload_distant_chunks(self.ship.x, self.ship.y)
+            
+            # Önizleme eski alan içindi - bu frame onunla çizilmeden bitirilir
+            self.update_viewport_preview()
         
         # Yön göstergesini hesapla - Sadece engine on ise
         if self.engine_on:
@@ -728,169 +834,321 @@ class SpaceGamePygame:
         self.draw_coordinate_labels(matrix_rect)
         
         # Matrix alanındaki tüm gök cisimlerini bir seferde yükle (verimli)
-        self.matrix_objects = self.chunk_manager.get_objects_in_area(
-            self.matrix_start_x, self.matrix_start_y,
-            self.matrix_start_x + self.matrix_size - 1,
-            self.matrix_start_y + self.matrix_size - 1,
-            self.current_universe_name
-        )
-        
+        if self.viewport_preview is not None:
+            # Chunk'lar arka planda okunuyor - diske dokunmadan önizleme cisimleri kullanılır
+            self.matrix_objects = self.viewport_preview["objects"]
+        else:
+            self.matrix_objects = self.chunk_manager.get_objects_in_area(
+                self.matrix_start_x, self.matrix_start_y,
+                self.matrix_start_x + self.matrix_size - 1,
+                self.matrix_start_y + self.matrix_size - 1,
+                self.current_universe_name
+            )
         
-        # Gök cisimlerini koordinat bazlı dictionary'ye çevir (hızlı arama)
-        objects_by_coord = {}
-        for obj in self.matrix_objects:
-            coord_key = (obj['x'], obj['y'])
-            objects_by_coord[coord_key] = obj
         
         # Radar alarm kontrolü - Matrix'te gök cismi var mı?
         self.radar_alarm = len(self.matrix_objects) > 0
         
-        # Her hücreyi kontrol et ve çiz
-        for i in range(self.matrix_size):
-            for j in range(self.matrix_size):
-                # Gerçek koordinatları hesapla (i=yatay=X, j=dikey=Y)
-                real_x = self.matrix_start_x + i  # i = yatay = X ekseni
-                real_y = self.matrix_start_y + j  # j = dikey = Y ekseni
-                
-                # Hücre rengini belirle
-                color = Colors.BLACK
-                border_color = Colors.DARK_GRAY
-                bottom_line_color = Colors.DARK_GRAY
-                
-                # Gemi pozisyonu (merkez) - kırmızı dolu
-                if real_x == self.ship.x and real_y == self.ship.y:
-                    color = Colors.RED  # İçini tamamen kırmızı doldur
-                    border_color = Colors.RED
-                    bottom_line_color = Colors.RED
-                # Yön hattındaki hücreler - sadece engine on ise
-                elif self.engine_on and (real_x, real_y) in self.get_direction_line_cells():
-                    if not self.direction_line_passed:
-                        bottom_line_color = Colors.GREEN  # Henüz geçilmedi - yeşil
-                    else:
-                        bottom_line_color = Colors.TURQUOISE  # Geçildi - turkuaz
-                # Bu hücrede gök cismi var mı kontrol et (hızlı dictionary arama)
-                elif (real_x, real_y) in objects_by_coord:
-                    obj = objects_by_coord[(real_x, real_y)]
-                    obj_type = obj.get('type', 'unknown')
-                    
-                    # Gök cismi türüne göre renk belirle
-                    if obj_type == 'sun':
-                        color = Colors.YELLOW  # Sarı
-                    elif obj_type == 'black_hole':
-                        color = Colors.DARK_GRAY  # Koyu gri
-                    elif obj_type == 'asteroid_belt':
-                        color = Colors.LIGHT_GRAY  # Açık gri
-                    elif obj_type == 'planet':
-                        color = Colors.NAVY  # Navy
-                    elif obj_type == 'comet':
-                        color = Colors.WHITE  # Beyaz
-                    else:
-                        color = Colors.YELLOW  # Varsayılan
-                
-                # Hücreyi çiz
-                cell_rect = pygame.Rect(
-                    matrix_rect.left + i * self.cell_size,
-                    matrix_rect.top + j * self.cell_size,
-                    self.cell_size,
-                    self.cell_size
-                )
-                pygame.draw.rect(self.screen, color, cell_rect)
-                
-                # Hücre sınırları kaldırıldı - sadece siyah ekran
-                
-                # Yön hattı çizgisi - Yön bazlı
-                if bottom_line_color != Colors.DARK_GRAY:
-                    if self.ship.direction in [Direction.UP, Direction.DOWN]:
-                        # Yukarı/Aşağı - Yatay çizgi (alt kenar)
-                        pygame.draw.line(self.screen, bottom_line_color, 
-                                       (cell_rect.left, cell_rect.bottom-1), 
-                                       (cell_rect.right, cell_rect.bottom-1), 2)
-                    elif self.ship.direction == Direction.RIGHT:
-                        # Sağa - Dikey çizgi (sağ kenar)
-                        pygame.draw.line(self.screen, bottom_line_color, 
-                                       (cell_rect.right-1, cell_rect.top), 
-                                       (cell_rect.right-1, cell_rect.bottom), 2)
-                    elif self.ship.direction == Direction.LEFT:
-                        # Sola - Dikey çizgi (sol kenar)
-                        pygame.draw.line(self.screen, bottom_line_color, 
-                                       (cell_rect.left, cell_rect.top), 
-                                       (cell_rect.left, cell_rect.bottom), 2)
-                
-                # Yön göstergesi için + işareti çiz (sadece engine on ve son hücrede)
-                if self.engine_on and real_x == self.direction_indicator_x and real_y == self.direction_indicator_y:
-                    center_x = cell_rect.centerx
-                    center_y = cell_rect.centery
-                    cross_size = self.cell_size // 4
-                    
-                    # + işareti çiz (yeşil)
-                    pygame.draw.line(self.screen, Colors.GREEN, 
-                                   (center_x - cross_size, center_y), 
-                                   (center_x + cross_size, center_y), 3)
-                    pygame.draw.line(self.screen, Colors.GREEN, 
-                                   (center_x, center_y - cross_size), 
-                                   (center_x, center_y + cross_size), 3)
+        # Hücreler 8-bit palet indeksli buffer'da tutulur ve tek blit ile ölçeklenir
+        renderer = self.matrix_renderer
+        origin = (self.matrix_start_x, self.matrix_start_y)
+        shift = renderer.get_shift(self.matrix_size, self.cell_size, origin)
+        if shift is not None and max(abs(shift[0]), abs(shift[1])) < self.matrix_render_threshold:
+            # Küçük kayma - matrisi kaydır, sadece yeni açılan şeridi çiz
+            exposed = renderer.scroll(*shift)
+            renderer.paint_rasters(self.get_chunk_raster, self.chunk_manager.chunk_size, exposed)
+            renderer.draw(self.screen, matrix_rect, exposed)
+        else:
+            # İlk çizim, teleport veya threshold'u aşan sıçrama - tüm matrisi yeniden çiz
+            renderer.begin(self.matrix_size, self.cell_size, origin)
+            renderer.paint_rasters(self.get_chunk_raster, self.chunk_manager.chunk_size)
+            renderer.draw(self.screen, matrix_rect)
+        
+        # Gemi pozisyonu (merkez) - kırmızı dolu
+        pygame.draw.rect(self.screen, Colors.RED, self.get_cell_rect(matrix_rect, self.ship.x, self.ship.y))
+        
+        # Yön hattı ve + işareti - önbellekteki overlay şeridi tek blit ile
+        if self.engine_on:
+            self.draw_direction_overlay(matrix_rect)
+    
+    def get_chunk_raster(self, chunk_x: int, chunk_y: int):
+        """Aktif evrendeki chunk'ın doluluk raster'ı (yıldız/gezegen diskleri, kuşak halkaları)"""
+        preview = self.viewport_preview
+        if preview is not None and (chunk_x, chunk_y) not in preview["ready"]:
+            # Chunk henüz okunmadı - önizleme cisimlerinden geçici raster
+            raster = preview["rasters"].get((chunk_x, chunk_y))
+            if raster is None:
+                size = self.chunk_manager.chunk_size
+                min_x, min_y = chunk_x * size, chunk_y * size
+                objects = []
+                for obj in preview["shapes"]:
+                    extent = OccupancyRaster.extent(obj)
+                    if (obj['x'] + extent >= min_x and obj['x'] - extent < min_x + size and
+                        obj['y'] + extent >= min_y and obj['y'] - extent < min_y + size):
+                        objects.append(obj)
+                raster = OccupancyRaster(chunk_x, chunk_y, size, objects)
+                preview["rasters"][(chunk_x, chunk_y)] = raster
+            return raster
+        return self.chunk_manager.get_raster(chunk_x, chunk_y, self.current_universe_name)
+    
+    def start_viewport_preview(self, shapes, on_ready=None):
+        """Matris alanının chunk'larını arka planda oku, okunana kadar matrisi shapes ile çiz
+        
+        on_ready, alanın tüm chunk'ları hazır olduğunda (canlı veriye geçişte) çağrılır.
+        """
+        end_x = self.matrix_start_x + self.matrix_size - 1
+        end_y = self.matrix_start_y + self.matrix_size - 1
+        chunks = self.chunk_manager.prefetch_area(self.matrix_start_x, self.matrix_start_y,
+                                                  end_x, end_y, self.current_universe_name)
+        # Yeni önizleme öncekinin yerini alır - eski alanın bekleyen kontrolleri artık geçersiz
+        self.viewport_preview = {
+            "universe": self.current_universe_name,
+            "area": (self.matrix_start_x, self.matrix_start_y, self.matrix_size),
+            "shapes": shapes,
+            "objects": [obj for obj in shapes
+                        if self.matrix_start_x <= obj['x'] <= end_x and self.matrix_start_y <= obj['y'] <= end_y],
+            "chunks": chunks,
+            "ready": set(),
+            "rasters": {},
+            "on_ready": on_ready
+        }
+        self.matrix_renderer.invalidate()
+        self.mark_dirty("matrix")
+        self.update_viewport_preview()
+    
+    def update_viewport_preview(self):
+        """Okunan chunk'ları önizlemeden canlı veriye geçir"""
+        preview = self.viewport_preview
+        if preview is None:
+            return
+        
+        if (preview["universe"] != self.current_universe_name or
+                preview["area"] != (self.matrix_start_x, self.matrix_start_y, self.matrix_size)):
+            # Matris kaydı - önizleme yeni alanı kapsamıyor
+            self.finish_viewport_preview()
+            return
+        
+        arrived = [chunk for chunk in preview["chunks"] if chunk not in preview["ready"]
+                   and self.chunk_manager.is_raster_ready(chunk[0], chunk[1], preview["universe"])]
+        if arrived:
+            preview["ready"].update(arrived)
+            self.matrix_renderer.invalidate()
+            self.mark_dirty("matrix")
+        
+        if len(preview["ready"]) == len(preview["chunks"]):
+            self.viewport_preview = None
+            if preview["on_ready"] is not None:
+                preview["on_ready"]()
+    
+    def finish_viewport_preview(self):
+        """Önizlemeyi bitir - kalan chunk'lar senkron okunur (matris cisimleri tam olmalıysa)"""
+        preview = self.viewport_preview
+        if preview is None:
+            return
+        self.viewport_preview = None
+        self.matrix_renderer.invalidate()
+        self.mark_dirty("matrix")
+        if preview["universe"] == self.current_universe_name:
+            self.matrix_objects = self.chunk_manager.get_objects_in_area(
+                self.matrix_start_x, self.matrix_start_y,
+                self.matrix_start_x + self.matrix_size - 1,
+                self.matrix_start_y + self.matrix_size - 1,
+                self.current_universe_name
+            )
+            if preview["on_ready"] is not None:
+                preview["on_ready"]()
+    
+    def get_viewport_points(self):
+        """Matris alanındaki cisimlerin uzamsal indeksteki noktaları (chunk okumadan)"""
+        half = self.matrix_size / 2
+        center_x = self.matrix_start_x + half
+        center_y = self.matrix_start_y + half
+        end_x = self.matrix_start_x + self.matrix_size - 1
+        end_y = self.matrix_start_y + self.matrix_size - 1
+        index = self.chunk_manager.get_spatial_index(self.current_universe_name)
+        return [point for _, point in index.within(center_x, center_y, half * math.sqrt(2))
+                if self.matrix_start_x <= point['x'] <= end_x and self.matrix_start_y <= point['y'] <= end_y]
+    
+    def draw_direction_overlay(self, matrix_rect):
+        """Yön hattı overlay'ini matrisin üstüne çiz"""
+        horizontal = self.ship.direction in [Direction.UP, Direction.DOWN]
+        if horizontal:
+            # Yatay hat: direction_indicator_y satırı, + işareti direction_indicator_x sütununda
+            line_index = self.direction_indicator_y - self.matrix_start_y
+            indicator_index = self.direction_indicator_x - self.matrix_start_x
+        else:
+            # Dikey hat: direction_indicator_x sütunu, + işareti direction_indicator_y satırında
+            line_index = self.direction_indicator_x - self.matrix_start_x
+            indicator_index = self.direction_indicator_y - self.matrix_start_y
+        
+        if not 0 <= line_index < self.matrix_size:
+            return
+        
+        # Şerit sadece yön, hattın geçilme durumu, matris/hücre boyutu veya gösterge konumu değişince yeniden çizilir
+        overlay_key = (self.ship.direction, self.direction_line_passed, self.matrix_size,
+                       self.cell_size, indicator_index)
+        if self.direction_overlay_key != overlay_key:
+            self.direction_overlay = self.build_direction_overlay(indicator_index)
+            self.direction_overlay_key = overlay_key
+        
+        if horizontal:
+            position = (matrix_rect.left, matrix_rect.top + line_index * self.cell_size)
+        else:
+            position = (matrix_rect.left + line_index * self.cell_size, matrix_rect.top)
+        self.screen.blit(self.direction_overlay, position)
+        
+        # Gemi hattın üzerindeyse gemi hücresi hattın önünde kalır
+        ship_index = (self.ship.y - self.matrix_start_y) if horizontal else (self.ship.x - self.matrix_start_x)
+        if ship_index == line_index:
+            pygame.draw.rect(self.screen, Colors.RED,
+                             self.get_cell_rect(matrix_rect, self.ship.x, self.ship.y))
+    
+    def build_direction_overlay(self, indicator_index):
+        """Yön hattı şeridini (bir satır veya sütun hücre) off-screen surface'e çiz"""
+        cell = self.cell_size
+        length = self.matrix_size * cell
+        horizontal = self.ship.direction in [Direction.UP, Direction.DOWN]
+        size = (length, cell) if horizontal else (cell, length)
+        
+        # Hattaki hücreler gök cismi göstermez - şerit siyah ile başlar
+        layer = pygame.Surface(size, pygame.SRCALPHA)
+        layer.fill(Colors.BLACK)
+        
+        line_color = Colors.TURQUOISE if self.direction_line_passed else Colors.GREEN
+        if horizontal:
+            # Yukarı/Aşağı - Yatay çizgi (alt kenar)
+            pygame.draw.line(layer, line_color, (0, cell - 1), (length, cell - 1), 2)
+        elif self.ship.direction == Direction.RIGHT:
+            # Sağa - Dikey çizgi (sağ kenar)
+            pygame.draw.line(layer, line_color, (cell - 1, 0), (cell - 1, length), 2)
+        elif self.ship.direction == Direction.LEFT:
+            # Sola - Dikey çizgi (sol kenar)
+            pygame.draw.line(layer, line_color, (0, 0), (0, length), 2)
+        
+        # Yön göstergesi için + işareti (hattın son hücresinde)
+        if 0 <= indicator_index < self.matrix_size:
+            offset = indicator_index * cell + cell // 2
+            center_x, center_y = (offset, cell // 2) if horizontal else (cell // 2, offset)
+            cross_size = cell // 4
+            
+            # + işareti çiz (yeşil)
+            pygame.draw.line(layer, Colors.GREEN, 
+                           (center_x - cross_size, center_y), 
+                           (center_x + cross_size, center_y), 3)
+            pygame.draw.line(layer, Colors.GREEN, 
+                           (center_x, center_y - cross_size), 
+                           (center_x, center_y + cross_size), 3)
+        
+        return layer
+    
+    def get_cell_rect(self, matrix_rect, real_x, real_y):
+        """Gerçek koordinattaki matris hücresinin ekran alanı"""
+        return pygame.Rect(
+            matrix_rect.left + (real_x - self.matrix_start_x) * self.cell_size,
+            matrix_rect.top + (real_y - self.matrix_start_y) * self.cell_size,
+            self.cell_size,
+            self.cell_size
+        )
     
     def draw_coordinate_labels(self, matrix_rect):
-        """Koordinat etiketlerini orta alana fit ederek çiz"""
+        """Koordinat etiketlerini orta alana fit ederek çiz (önbellekteki katmandan tek blit)"""
+        # Etiketler sadece matris orijini veya boyutu değişince yeniden render edilir
+        layer_key = (self.matrix_start_x, self.matrix_start_y, self.matrix_size, self.cell_size,
+                     tuple(matrix_rect))
+        if self.label_layer_key != layer_key:
+            self.label_layer = self.build_label_layer(matrix_rect)
+            self.label_layer_key = layer_key
+        
+        self.screen.blit(self.label_layer, (self.left_width, 0))
+    
+    def build_label_layer(self, matrix_rect):
+        """Koordinat etiketlerini orta panel boyutunda şeffaf bir surface'e çiz"""
+        layer = pygame.Surface((self.center_width, self.matrix_height), pygame.SRCALPHA)
+        
+        # Katman orta panelin sol üst köşesinden başlar
+        local_rect = matrix_rect.move(-self.left_width, 0)
+        
         # X ekseni etiketleri (alt) - Matrix alanının dışında
         for i in range(0, self.matrix_size, 5):  # Her 5 hücrede bir
             real_x = self.matrix_start_x + i
             label_text = str(real_x)
-            label_surface = self.font_small.render(label_text, True, Colors.WHITE)
+            label_surface = self.render_text(self.font_small, label_text, Colors.WHITE)
             
             # Matrix alanının dışında, alt kenarda
-            x_pos = matrix_rect.left + i * self.cell_size + (self.cell_size // 2)
-            y_pos = matrix_rect.bottom + 15  # Matrix alanının dışında, alt kenardan 15 pixel aşağı
+            x_pos = local_rect.left + i * self.cell_size + (self.cell_size // 2)
+            y_pos = local_rect.bottom + 15  # Matrix alanının dışında, alt kenardan 15 pixel aşağı
             
             # Orta panel sınırları içinde kal
-            if x_pos + label_surface.get_width() <= matrix_rect.right + 30:
+            if x_pos + label_surface.get_width() <= local_rect.right + 30:
                 text_rect = label_surface.get_rect(center=(x_pos, y_pos))
-                self.screen.blit(label_surface, text_rect)
+                layer.blit(label_surface, text_rect)
         
         # Y ekseni etiketleri (sol) - Matrix alanının dışında
         for j in range(0, self.matrix_size, 5):  # Her 5 hücrede bir
             real_y = self.matrix_start_y + j
             label_text = str(real_y)
-            label_surface = self.font_small.render(label_text, True, Colors.WHITE)
+            label_surface = self.render_text(self.font_small, label_text, Colors.WHITE)
             
             # Matrix alanının dışında, sol kenarda
-            x_pos = matrix_rect.left - 15  # Matrix alanının dışında, sol kenardan 15 pixel sola
-            y_pos = matrix_rect.top + j * self.cell_size + (self.cell_size // 2)
+            x_pos = local_rect.left - 15  # Matrix alanının dışında, sol kenardan 15 pixel sola
+            y_pos = local_rect.top + j * self.cell_size + (self.cell_size // 2)
             
             # Orta panel sınırları içinde kal
-            if y_pos + label_surface.get_height() <= matrix_rect.bottom + 30:
+            if y_pos + label_surface.get_height() <= local_rect.bottom + 30:
                 text_rect = label_surface.get_rect(right=x_pos, centery=y_pos)
-                self.screen.blit(label_surface, text_rect)
+                layer.blit(label_surface, text_rect)
+        
+        return layer
     
     def get_objects_in_range(self, x: int, y: int, range_distance: int) -> List[dict]:
         """Chunk-based: Belirli bir noktadan belirli mesafede olan cisimleri bul"""
-        # Chunk-based arama
-        min_x = int(x - range_distance)
-        max_x = int(x + range_distance)
-        min_y = int(y - range_distance)
-        max_y = int(y + range_distance)
-        
-        view_objects = self.chunk_manager.get_objects_in_area(
-            min_x, min_y, max_x, max_y, self.current_universe_name
-        )
-        
-        # Mesafe kontrolü
+        # Uzamsal indeks (KD-tree) mesafeyi çözer; sadece isabet eden cisimlerin chunk'ları okunur
+        spatial_index = self.chunk_manager.get_spatial_index(self.current_universe_name)
         objects_in_range = []
-        for obj in view_objects:
-            distance = ((obj['x'] - x) ** 2 + (obj['y'] - y) ** 2) ** 0.5
-            if distance <= range_distance:
+        for distance, point in spatial_index.within(x, y, range_distance):
+            obj = self.chunk_manager.get_object_record(point, self.current_universe_name)
+            if obj is not None:
                 objects_in_range.append(obj)
         return objects_in_range
     
+    def find_nearest_objects(self, limit=1, obj_type=None, prop=None, radius=None):
+        """Gemiye en yakın gök cisimlerini uzamsal indeksten listele"""
+        if not os.path.exists(f"universes/{self.current_universe_name}/metadata.json"):
+            self.add_console_line("HATA: Uzamsal indeks sadece chunk-based evrenlerde kullanılabilir", Colors.RED)
+            return
+        
+        spatial_index = self.chunk_manager.get_spatial_index(self.current_universe_name)
+        if radius is None:
+            results = spatial_index.nearest(self.ship.x, self.ship.y, limit, obj_type, prop)
+        else:
+            results = spatial_index.within(self.ship.x, self.ship.y, radius, obj_type, prop)[:limit]
+        
+        filter_text = " ".join(part for part in (obj_type, prop) if part) or "gök cismi"
+        self.add_console_line(f"=== EN YAKIN {filter_text.upper()} ({self.ship.x},{self.ship.y}) ===", Colors.CYAN)
+        if not results:
+            self.add_console_line("Sonuç bulunamadı.", Colors.YELLOW)
+            return
+        
+        for rank, (distance, point) in enumerate(results, 1):
+            self.add_console_line(f"{rank}. {point['name']} ({point['type']}/{point['prop']}) "
+                                  f"@ ({point['x']},{point['y']}) mesafe: {distance:.1f}")
+    
     def scan_coordinates(self, x: int, y: int):
         """Belirli koordinatlarda cisim taraması yap"""
         objects_found = []
         
         # 10 nokta içindeki tüm cisimleri bul
-        for obj in self.celestial_objects:
-            distance = ((obj.x - x) ** 2 + (obj.y - y) ** 2) ** 0.5
-            if distance <= 10:
-                objects_found.append((obj, distance))
+        if self.celestial_objects:
+            # Eski format (tek dosya) evren
+            for obj in self.celestial_objects:
+                distance = ((obj.x - x) ** 2 + (obj.y - y) ** 2) ** 0.5
+                if distance <= 10:
+                    objects_found.append((obj, distance))
+        else:
+            # Chunk-based: tarama diski chunk raster'larında aranır - cismin herhangi bir hücresi yeterli
+            for data in self.chunk_manager.get_objects_in_radius(x, y, 10, self.current_universe_name):
+                obj = CelestialObject.from_dict(data)
+                objects_found.append((obj, ((obj.x - x) ** 2 + (obj.y - y) ** 2) ** 0.5))
         
         # Sonuçları kırmızı renkte göster
         if objects_found:
@@ -951,7 +1209,17 @@ class SpaceGamePygame:
         self.add_matrix_line(f"MATRİS MERKEZİ: ({x}, {y})", Colors.CYAN)
         self.add_matrix_line(f"MATRİS ALANI: ({self.matrix_start_x}, {self.matrix_start_y}) - ({self.matrix_start_x + self.matrix_size - 1}, {self.matrix_start_y + self.matrix_size - 1})", Colors.CYAN)
         
-        # Çarpışma kontrolü
+        if self.celestial_objects:
+            # Eski format (tek dosya) evren - cisimler zaten bellekte
+            self.report_teleport_collisions(x, y)
+        else:
+            # Hedef alan uzamsal indeksten hemen çizilir, chunk'lar arka planda okunur;
+            # çarpışma kontrolü geminin chunk'ları geldiğinde yapılır
+            self.start_viewport_preview(self.get_viewport_points(),
+                                        lambda: self.report_teleport_collisions(x, y))
+    
+    def report_teleport_collisions(self, x: int, y: int):
+        """Teleport noktasındaki çarpışmaları bildir"""
         collisions = self.check_collision(x, y)
         if collisions:
             self.add_matrix_line("ALERT: Teleportasyon sonrası çarpışma!", Colors.RED)
@@ -996,14 +1264,19 @@ class SpaceGamePygame:
             prompt_text = "orbit@başlatma:$ "
         
         # Prompt'u çiz
-        prompt_surface = self.font_medium.render(prompt_text, True, Colors.GREEN)
+        prompt_surface = self.render_text(self.font_medium, prompt_text, Colors.GREEN)
         self.screen.blit(prompt_surface, (10, y_pos))
         
+        # Mevcut komutu göster (prompt'un yanında)
+        command_x = 10 + prompt_surface.get_width()
+        if self.current_command:
+            command_surface = self.render_text(self.font_medium, self.current_command, Colors.WHITE)
+            self.screen.blit(command_surface, (command_x, y_pos))
+        
         # Yanıp sönen cursor
-        current_time = datetime.now()
-        if int(current_time.microsecond / 500000) % 2:  # Her 0.5 saniyede bir yanıp söner
-            cursor_x = 10 + prompt_surface.get_width()
-            cursor_surface = self.font_medium.render("_", True, Colors.WHITE)
+        if int(time.time() * 2) % 2:  # Her 0.5 saniyede bir yanıp söner
+            cursor_x = command_x + (self.font_medium.size(self.current_command)[0] if self.current_command else 0)
+            cursor_surface = self.render_text(self.font_medium, "_", Colors.WHITE)
             self.screen.blit(cursor_surface, (cursor_x, y_pos))
         
     
@@ -1056,21 +1329,32 @@ class SpaceGamePygame:
         # ship.speed artık doğrudan saniye/nokta değeri
         self.required_24h_speed = self.required_seconds_per_point
     
+    def get_matrix_object(self, name):
+        """Matrix'teki cismi adıyla bul - isim haritası matrix_objects değişince yeniden kurulur"""
+        if self.matrix_objects_by_name[0] is not self.matrix_objects:
+            by_name = {}
+            for obj in self.matrix_objects:
+                by_name.setdefault(obj.get('name'), obj)
+            self.matrix_objects_by_name = (self.matrix_objects, by_name)
+        return self.matrix_objects_by_name[1].get(name)
+    
     def save_celestial_to_catalog(self, celestial_name):
         """Save celestial object to catalog"""
+        # Preview objects carry geometry only - catalog entries need the chunk records
+        self.finish_viewport_preview()
+        
         # Find celestial object in current matrix objects
-        celestial_obj = None
-        for obj in self.matrix_objects:
-            if obj.get('name') == celestial_name:
-                celestial_obj = obj
-                break
+        celestial_obj = self.get_matrix_object(celestial_name)
         
         if not celestial_obj:
             self.add_catalog_line(f"ERROR: Celestial object '{celestial_name}' not found in matrix!", Colors.RED)
             return
         
-        # Load existing catalog
-        catalog = self.load_catalog()
+        # Oturum katalogu bellekte - kayıt journal'a tek satır olarak eklenir
+        store = self.get_catalog_store()
+        if store is None:
+            self.add_console_line("ERROR: No active session!", Colors.RED)
+            return
         
         # Create catalog entry
         catalog_entry = {
@@ -1088,25 +1372,30 @@ class SpaceGamePygame:
         }
         
         # Add to catalog
-        catalog.append(catalog_entry)
-        
-        # Save catalog
-        self.save_catalog(catalog)
+        try:
+            store.add(catalog_entry)
+        except OSError as e:
+            self.add_console_line(f"Error saving catalog: {e}", Colors.RED)
+            return
         
         self.add_catalog_line(self.locale.get("catalog.saved", name=celestial_name), Colors.CYAN)
         self.add_catalog_line(self.locale.get("catalog.saved_position", x=self.ship.x, y=self.ship.y), Colors.WHITE)
     
     def save_all_matrix_objects_to_catalog(self):
         """Save all matrix objects to catalog"""
+        self.finish_viewport_preview()
         if not self.matrix_objects:
             self.add_catalog_line("ERROR: No celestial objects in matrix!", Colors.RED)
             return
         
-        # Load existing catalog
-        catalog = self.load_catalog()
+        store = self.get_catalog_store()
+        if store is None:
+            self.add_console_line("ERROR: No active session!", Colors.RED)
+            return
         
-        # Get existing names to avoid duplicates
-        existing_names = {entry.get('name') for entry in catalog}
+        # Duplicates are checked against the catalog's name index
+        existing_names = set()
+        new_entries = []
         
         saved_count = 0
         skipped_count = 0
@@ -1115,7 +1404,7 @@ class SpaceGamePygame:
             obj_name = obj.get('name')
             
             # Skip if already exists
-            if obj_name in existing_names:
+            if obj_name in store or obj_name in existing_names:
                 skipped_count += 1
                 continue
             
@@ -1135,15 +1424,38 @@ class SpaceGamePygame:
             }
             
             # Add to catalog
-            catalog.append(catalog_entry)
+            new_entries.append(catalog_entry)
             existing_names.add(obj_name)
             saved_count += 1
         
-        # Save catalog
-        self.save_catalog(catalog)
+        # Save catalog - tek journal yazımı
+        try:
+            store.extend(new_entries)
+        except OSError as e:
+            self.add_console_line(f"Error saving catalog: {e}", Colors.RED)
+            return
         
         self.add_catalog_line(self.locale.get("catalog.all_saved", count=saved_count), Colors.CYAN)
     
+    def delete_catalog_entry(self, celestial_name):
+        """Delete catalog entries by name"""
+        store = self.get_catalog_store()
+        if store is None:
+            self.add_console_line("ERROR: No active session!", Colors.RED)
+            return
+        
+        # Silme journal'a tek satır olarak eklenir
+        try:
+            removed = store.remove(celestial_name)
+        except OSError as e:
+            self.add_console_line(f"Error saving catalog: {e}", Colors.RED)
+            return
+        
+        if not removed:
+            self.add_catalog_line(self.locale.get("catalog.not_found", name=celestial_name), Colors.RED)
+            return
+        self.add_catalog_line(self.locale.get("catalog.deleted", name=celestial_name, count=removed), Colors.CYAN)
+    
     def list_catalog(self):
         """List catalog contents"""
         catalog = self.load_catalog()
@@ -1166,58 +1478,39 @@ class SpaceGamePygame:
     
     def show_catalog_resume(self):
         """Show catalog resume (statistics)"""
-        catalog = self.load_catalog()
+        store = self.get_catalog_store()
         
-        if not catalog:
+        if not store:
             self.add_catalog_line(self.locale.get("catalog.list_empty"), Colors.CYAN)
             return
         
         self.add_catalog_line(self.locale.get("catalog.stats_title"), Colors.CYAN)
         
-        # Count by type
-        type_counts = {}
-        prop_counts = {}
-        resource_counts = {}
-        
-        for entry in catalog:
-            obj_type = entry.get('type', 'unknown')
-            prop = entry.get('prop', 'unknown')
-            
-            type_counts[obj_type] = type_counts.get(obj_type, 0) + 1
-            prop_counts[prop] = prop_counts.get(prop, 0) + 1
-            
-            resources = entry.get('resources', {})
-            for resource_type in resources.keys():
-                resource_counts[resource_type] = resource_counts.get(resource_type, 0) + 1
-        
-        # Show type statistics
-        self.add_catalog_line(self.locale.get("catalog.stats_by_type"), Colors.YELLOW)
-        for obj_type, count in sorted(type_counts.items()):
-            self.add_catalog_line(f"  {obj_type}: {count}", Colors.WHITE)
-        
-        # Show prop statistics
-        self.add_catalog_line(self.locale.get("catalog.stats_by_prop"), Colors.YELLOW)
-        for prop, count in sorted(prop_counts.items()):
-            self.add_catalog_line(f"  {prop}: {count}", Colors.WHITE)
+        # Sayımlar katalog indekslerinden, paydalar evrenin özetinden okunur
+        universe_summary = self.get_universe_summary()
+        sections = (
+            ("catalog.stats_by_type", store.index.counts('by_type'), universe_summary["types"]),
+            ("catalog.stats_by_prop", store.index.counts('by_prop'), universe_summary["props"]),
+            ("catalog.stats_resources", store.index.counts('by_resource'), universe_summary["resources"]),
+        )
         
-        # Show resource statistics
-        if resource_counts:
-            self.add_catalog_line(self.locale.get("catalog.stats_resources"), Colors.YELLOW)
-            for resource_type, count in sorted(resource_counts.items()):
-                self.add_catalog_line(f"  {resource_type}: {count}", Colors.WHITE)
+        for title_key, catalog_counts, total_counts in sections:
+            if not catalog_counts:
+                continue
+            self.add_catalog_line(self.locale.get(title_key), Colors.YELLOW)
+            for key, count in sorted(catalog_counts.items()):
+                total_count = total_counts.get(key, 0)
+                percentage = (count / total_count * 100) if total_count > 0 else 0
+                self.add_catalog_line(f"  {key}: {count} - {total_count} ({percentage:.1f}%)", Colors.WHITE)
         
         self.add_catalog_line(self.locale.get("catalog.stats_end"), Colors.CYAN)
     
     def teleport_to_catalog_object(self, celestial_name):
         """Teleport to catalog object"""
-        catalog = self.load_catalog()
+        store = self.get_catalog_store()
         
-        # Find celestial object in catalog
-        celestial_obj = None
-        for entry in catalog:
-            if entry['name'] == celestial_name:
-                celestial_obj = entry
-                break
+        # Find celestial object in catalog - name index
+        celestial_obj = store.get(celestial_name) if store is not None else None
         
         if not celestial_obj:
             self.add_catalog_line(self.locale.get("catalog.not_found", name=celestial_name), Colors.RED)
@@ -1227,25 +1520,28 @@ class SpaceGamePygame:
         self.teleport_ship(celestial_obj['x'], celestial_obj['y'])
         self.add_catalog_line(self.locale.get("catalog.teleported", name=celestial_name, x=celestial_obj['x'], y=celestial_obj['y']), Colors.CYAN)
     
+    def get_catalog_store(self):
+        """Aktif oturumun katalogu - oturum başına bir kez diskten okunur, sonra bellekte tutulur"""
+        if not getattr(self, 'current_session_name', None) or not getattr(self, 'current_universe_name', None):
+            return None
+        
+        session_dir = f"sessions/{self.current_universe_name}/{self.current_session_name}"
+        if self.catalog_store is None or self.catalog_store.directory != session_dir:
+            store = CatalogStore(session_dir)
+            try:
+                store.load()
+            except Exception as e:
+                self.add_console_line(f"Error loading catalog: {e}", Colors.RED)
+            self.catalog_store = store
+        return self.catalog_store
+    
     def load_catalog(self):
-        """Load catalog from session cats.json"""
-        try:
-            if not hasattr(self, 'current_session_name') or not self.current_session_name:
-                return []
-            if not hasattr(self, 'current_universe_name') or not self.current_universe_name:
-                return []
-            
-            catalog_path = f"sessions/{self.current_universe_name}/{self.current_session_name}/cats.json"
-            with open(catalog_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return []
-        except Exception as e:
-            self.add_console_line(f"Error loading catalog: {e}", Colors.RED)
-            return []
+        """Session katalog kayıtları (bellekteki liste - değiştirmeyin, store üzerinden ekleyin)"""
+        store = self.get_catalog_store()
+        return store.entries if store is not None else []
     
     def save_catalog(self, catalog):
-        """Save catalog to session cats.json"""
+        """Tüm katalogu değiştir ve snapshot olarak yaz (cats.json)"""
         try:
             if not hasattr(self, 'current_session_name') or not self.current_session_name:
                 self.add_console_line("ERROR: No active session!", Colors.RED)
@@ -1254,9 +1550,7 @@ class SpaceGamePygame:
                 self.add_console_line("ERROR: No active universe!", Colors.RED)
                 return
             
-            catalog_path = f"sessions/{self.current_universe_name}/{self.current_session_name}/cats.json"
-            with open(catalog_path, 'w', encoding='utf-8') as f:
-                json.dump(catalog, f, indent=2, ensure_ascii=False)
+            self.get_catalog_store().replace(catalog)
         except Exception as e:
             self.add_console_line(f"Error saving catalog: {e}", Colors.RED)
     
@@ -1284,119 +1578,12 @@ class SpaceGamePygame:
         except Exception as e:
             self.add_console_line(f"Error creating session structure: {e}", Colors.RED)
     
-    def print_catalog_statistics(self, x_start, y_start):
-        """Print catalog statistics"""
-        catalog = self.load_catalog()
-        
-        if not catalog:
-            # Katalog yokken hiçbir şey gösterme
-            return
-        
-        # Evrendeki toplam gök cismi sayılarını hesapla
-        total_objects = self.get_total_universe_objects()
-        
-        # Count by type
-        type_counts = {}
-        prop_counts = {}
-        resource_counts = {}
-        
-        for entry in catalog:
-            obj_type = entry.get('type', 'unknown')
-            prop = entry.get('prop', 'unknown')
-            
-            # None değerleri 'unknown' olarak değiştir
-            if obj_type is None:
-                obj_type = 'unknown'
-            if prop is None:
-                prop = 'unknown'
-            
-            # Count by type
-            type_counts[obj_type] = type_counts.get(obj_type, 0) + 1
-            
-            # Count by prop
-            prop_counts[prop] = prop_counts.get(prop, 0) + 1
-            
-            # Count resources
-            resources = entry.get('resources', {})
-            for resource_type, resource_data in resources.items():
-                if isinstance(resource_data, dict):
-                    resource_counts[resource_type] = resource_counts.get(resource_type, 0) + 1
-        
-        # Display statistics
-        y_offset = y_start
-        
-        # 1. TİPLER (Types)
-        type_title = self.font_medium.render("TYPES:", True, Colors.WHITE)
-        self.screen.blit(type_title, (x_start, y_offset))
-        y_offset += 25
-        
-        for obj_type, catalog_count in sorted(type_counts.items()):
-            total_count = total_objects.get(obj_type, 0)
-            percentage = (catalog_count / total_count * 100) if total_count > 0 else 0
-            type_text = f"{obj_type}: {catalog_count} - {total_count} ({percentage:.1f}%)"
-            type_surface = self.font_large.render(type_text, True, Colors.CYAN)
-            self.screen.blit(type_surface, (x_start, y_offset))
-            y_offset += 18
-        
-        y_offset += 15
-        
-        # 2. ALT TİPLER (Props)
-        prop_title = self.font_medium.render("PROPS:", True, Colors.WHITE)
-        self.screen.blit(prop_title, (x_start, y_offset))
-        y_offset += 25
-        
-        for prop, catalog_count in sorted(prop_counts.items()):
-            # Bu prop'un evrendeki toplam sayısını hesapla
-            total_count = 0
-            for chunk_coord in self.chunk_manager.loaded_chunks:
-                chunk_objects = self.chunk_manager.chunks.get(chunk_coord, [])
-                for obj in chunk_objects:
-                    if obj.get('prop') == prop:
-                        total_count += 1
-            
-            percentage = (catalog_count / total_count * 100) if total_count > 0 else 0
-            prop_text = f"{prop}: {catalog_count} - {total_count} ({percentage:.1f}%)"
-            prop_surface = self.font_large.render(prop_text, True, Colors.YELLOW)
-            self.screen.blit(prop_surface, (x_start, y_offset))
-            y_offset += 18
-        
-        y_offset += 15
-        
-        # 3. RESOURCES
-        resource_title = self.font_medium.render("RESOURCES:", True, Colors.WHITE)
-        self.screen.blit(resource_title, (x_start, y_offset))
-        y_offset += 25
-        
-        for resource_type, catalog_count in sorted(resource_counts.items()):
-            # Bu resource'un evrendeki toplam sayısını hesapla
-            total_count = 0
-            for chunk_coord in self.chunk_manager.loaded_chunks:
-                chunk_objects = self.chunk_manager.chunks.get(chunk_coord, [])
-                for obj in chunk_objects:
-                    resources = obj.get('resources', {})
-                    if resource_type in resources:
-                        total_count += 1
-            
-            percentage = (catalog_count / total_count * 100) if total_count > 0 else 0
-            resource_text = f"{resource_type}: {catalog_count} - {total_count} ({percentage:.1f}%)"
-            resource_surface = self.font_large.render(resource_text, True, Colors.GREEN)
-            self.screen.blit(resource_surface, (x_start, y_offset))
-            y_offset += 18
-    
-    def get_total_universe_objects(self):
-        """Evrendeki toplam gök cismi sayılarını hesapla"""
-        total_counts = {}
-        
-        # Tüm yüklenmiş chunk'ları tara
-        for chunk_coord in self.chunk_manager.loaded_chunks:
-            chunk_objects = self.chunk_manager.chunks.get(chunk_coord, [])
-            for obj in chunk_objects:
-                obj_type = obj.get('type', 'unknown')
-                if obj_type is None:
-                    obj_type = 'unknown'
-                total_counts[obj_type] = total_counts.get(obj_type, 0) + 1
-        
-        return total_counts
+    def get_universe_summary(self):
+        """Evrendeki gök cismi sayıları (tip, prop, kaynak, zenginlik) - evrenin stats.json manifestinden"""
+        if self.current_universe_name and os.path.exists(f"universes/{self.current_universe_name}/metadata.json"):
+            return self.chunk_manager.get_stats(self.current_universe_name).total
+        # Eski format evrenler: yüklü chunk özetlerinin toplamı
+        return self.chunk_manager.loaded_summary
     
     def get_next_position(self):
         """Bir sonraki pozisyonu hesapla"""
@@ -1419,68 +1606,208 @@ class SpaceGamePygame:
         return x, y
     
     def update_ship_position(self):
-        """Gemi pozisyonunu güncelle - ship.speed saniyede bir"""
-        if not self.ship or not self.ship.is_moving:
+        """Simülasyonu sabit adımlarla ilerlet - render FPS'inden bağımsız
+        
+        Geçen gerçek süre (time.monotonic) time_warp ile çarpılıp biriktirilir;
+        biriken süre her effective_speed doldurduğunda gemi bir nokta ilerler.
+        Bir frame'de birden fazla adım atılabilir, takılmalardan sonra yetişilir.
+        """
+        now = time.monotonic()
+        frame_time = now - self.last_sim_time
+        self.last_sim_time = now
+        
+        if not self.ship or not self.mission_started:
             return
         
-        now = datetime.now()
-        time_diff = (now - self.last_position_update).total_seconds()  # saniye cinsinden
+        sim_time = frame_time * self.time_warp
+        
+        # Görev saati simülasyon zamanıyla akar
+        if self.time_warp != 1.0 and self.ship.mission_start_time:
+            self.ship.mission_start_time -= timedelta(seconds=sim_time - frame_time)
+        
+        if not self.ship.is_moving:
+            return
         
-        # ship.speed saniyede bir pozisyon güncelle (speed_factor ile çarpılmış)
         effective_speed = self.ship.speed / self.speed_factor
-        if time_diff >= effective_speed:
-            # Enerji tüketimi - Her nokta değişikliğinde 1 birim enerji
-            energy_cost_per_point = 1
-            self.ship.energy -= energy_cost_per_point
-            
-            if self.ship.energy <= 0:
-                self.add_matrix_line("ALERT: Enerji bitti! Motor durduruldu.")
-                self.stop_engine()
-                return
-            
-            # Pozisyon güncelleme
-            old_x, old_y = self.ship.x, self.ship.y
-            
-            if self.ship.direction == Direction.UP:
-                self.ship.y -= 1
-            elif self.ship.direction == Direction.DOWN:
-                self.ship.y += 1
-            elif self.ship.direction == Direction.LEFT:
-                self.ship.x -= 1
-            else:  # RIGHT
-                self.ship.x += 1
-            
-            # Sınır kontrolü
-            if (self.ship.x < 0 or self.ship.x >= self.universe_size or 
-                self.ship.y < 0 or self.ship.y >= self.universe_size):
-                self.add_matrix_line("ALERT: Evren sınırına ulaşıldı!")
-                self.ship.x = max(0, min(self.ship.x, self.universe_size - 1))
-                self.ship.y = max(0, min(self.ship.y, self.universe_size - 1))
-                self.stop_engine()
-                return
-            
-            # Çarpışma kontrolü
-            collisions = self.check_collision(self.ship.x, self.ship.y)
-            if collisions:
-                self.add_matrix_line("ALERT: Çarpışma!")
-                for obj in collisions:
-                    self.add_matrix_line(f"  - {obj.name} ({obj.obj_type.value}) ile çarpışıldı!")
-                self.stop_engine()
+        self.sim_accumulator += sim_time
+        
+        steps = 0
+        while self.sim_accumulator >= effective_speed:
+            if steps >= self.max_sim_steps_per_frame:
+                # Yetişilemeyecek kadar geride kalındı - fazlası atılır
+                self.sim_accumulator = 0.0
+                break
+            self.sim_accumulator -= effective_speed
+            steps += 1
+            if not self.advance_ship():
                 return
-            
-            # Pozisyon güncelleme zamanını sıfırla
-            self.last_position_update = now
-            
-            # Matrix görüntüye pozisyon bilgisi ekle
+        
+        if steps:
+            # Matrix görüntüye pozisyon bilgisi ekle (frame başına bir satır)
             self.add_matrix_line(f"{self.ship.x} {self.ship.y} Pozisyon güncellendi - {self.ship.direction.value.upper()}")
     
+    def advance_ship(self) -> bool:
+        """Gemiyi bir nokta ilerlet - motor durduysa False döner"""
+        # Enerji tüketimi - Her nokta değişikliğinde 1 birim enerji
+        energy_cost_per_point = 1
+        self.ship.energy -= energy_cost_per_point
+        
+        if self.ship.energy <= 0:
+            self.add_matrix_line("ALERT: Enerji bitti! Motor durduruldu.")
+            self.stop_engine()
+            return False
+        
+        # Pozisyon güncelleme
+        if self.ship.direction == Direction.UP:
+            self.ship.y -= 1
+        elif self.ship.direction == Direction.DOWN:
+            self.ship.y += 1
+        elif self.ship.direction == Direction.LEFT:
+            self.ship.x -= 1
+        else:  # RIGHT
+            self.ship.x += 1
+        
+        # Sınır kontrolü
+        if (self.ship.x < 0 or self.ship.x >= self.universe_size or 
+            self.ship.y < 0 or self.ship.y >= self.universe_size):
+            self.add_matrix_line("ALERT: Evren sınırına ulaşıldı!")
+            self.ship.x = max(0, min(self.ship.x, self.universe_size - 1))
+            self.ship.y = max(0, min(self.ship.y, self.universe_size - 1))
+            self.stop_engine()
+            return False
+        
+        # Çarpışma kontrolü
+        collisions = self.check_collision(self.ship.x, self.ship.y)
+        if collisions:
+            self.add_matrix_line("ALERT: Çarpışma!")
+            for obj in collisions:
+                self.add_matrix_line(f"  - {obj.name} ({obj.obj_type.value}) ile çarpışıldı!")
+            self.stop_engine()
+            return False
+        
+        return True
+    
+    def parse_duration(self, text: str) -> float:
+        """Süre metnini saniyeye çevir: 90, 45s, 30m, 2h, 1d, 1h30m"""
+        units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+        text = text.strip().lower()
+        if not text:
+            raise ValueError(text)
+        if text[-1].isdigit():
+            text += "s"
+        
+        total = 0.0
+        number = ""
+        for char in text:
+            if char.isdigit() or char == ".":
+                number += char
+            elif char in units and number:
+                total += float(number) * units[char]
+                number = ""
+            else:
+                raise ValueError(text)
+        if number:
+            raise ValueError(text)
+        return total
+    
+    def warp_ship(self, duration: float):
+        """Simülasyonu duration saniye ileri sar - adım adım ilerletmeden, kesin sonuçla
+        
+        Zamanın izin verdiği adım sayısı, enerji ve evren sınırı ile sınırlanır;
+        yol üzerindeki ilk gök cismi ChunkManager.cast_ray ile sadece geçilen
+        chunk'larda aranır. Enerji toplu düşülür. Sonuç update_ship_position'ın
+        aynı süre boyunca adım adım vereceği sonuçla aynıdır.
+        """
+        old_x, old_y = self.ship.x, self.ship.y
+        
+        # Görev saati simülasyon zamanıyla akar
+        if self.ship.mission_start_time:
+            self.ship.mission_start_time -= timedelta(seconds=duration)
+        
+        if not self.ship.is_moving:
+            self.add_console_line(f"Zaman {self.format_time(duration)} ileri sarıldı (motor kapalı).", Colors.YELLOW)
+            return
+        
+        effective_speed = self.ship.speed / self.speed_factor
+        total_time = self.sim_accumulator + duration
+        time_steps = int(total_time // effective_speed)
+        
+        dx, dy = {
+            Direction.UP: (0, -1), Direction.DOWN: (0, 1),
+            Direction.LEFT: (-1, 0), Direction.RIGHT: (1, 0),
+        }[self.ship.direction]
+        
+        # Her deneme 1 enerji harcar; enerji 0'a düştüğü deneme hareket etmez
+        energy_attempt = max(self.ship.energy, 1)
+        # Sınırın dışına çıkan deneme
+        if dx > 0:
+            boundary_attempt = self.universe_size - self.ship.x
+        elif dx < 0:
+            boundary_attempt = self.ship.x + 1
+        elif dy > 0:
+            boundary_attempt = self.universe_size - self.ship.y
+        else:
+            boundary_attempt = self.ship.y + 1
+        
+        # Yol sadece gerçekten gidilebilecek mesafe kadar taranır
+        search_limit = min(time_steps, energy_attempt - 1, boundary_attempt - 1)
+        if self.celestial_objects:
+            # Eski format (tek dosya) evren - yol üzerindeki cisimler listeden bulunur
+            collision_attempt, collisions = None, []
+            for obj in self.celestial_objects:
+                distance = (obj.x - self.ship.x) * dx + (obj.y - self.ship.y) * dy
+                on_path = (obj.y == self.ship.y) if dx else (obj.x == self.ship.x)
+                if on_path and 0 < distance <= search_limit:
+                    if collision_attempt is None or distance < collision_attempt:
+                        collision_attempt, collisions = distance, [obj]
+                    elif distance == collision_attempt:
+                        collisions.append(obj)
+        else:
+            collision_attempt, hits = self.chunk_manager.cast_ray(
+                self.ship.x, self.ship.y, dx, dy, search_limit, self.current_universe_name)
+            collisions = [CelestialObject.from_dict(obj) for obj in hits]
+        
+        attempts = min(time_steps, energy_attempt, boundary_attempt, collision_attempt or time_steps)
+        self.ship.energy -= attempts
+        
+        if attempts == energy_attempt:
+            moves, reason = attempts - 1, "energy"
+        elif attempts == boundary_attempt:
+            moves, reason = attempts - 1, "boundary"
+        elif collision_attempt is not None and attempts == collision_attempt:
+            moves, reason = attempts, "collision"
+        else:
+            moves, reason = attempts, None
+        
+        self.ship.x += dx * moves
+        self.ship.y += dy * moves
+        
+        self.add_console_line(f"WARP: {self.format_time(duration)} ileri sarıldı, {moves} nokta ilerlendi.", Colors.MAGENTA)
+        self.add_matrix_line(f"WARP: ({old_x}, {old_y}) → ({self.ship.x}, {self.ship.y})", Colors.MAGENTA)
+        self.add_matrix_line(f"ENERJİ TÜKETİMİ: {attempts} birim", Colors.MAGENTA)
+        
+        if reason is None:
+            self.sim_accumulator = total_time - attempts * effective_speed
+            return
+        
+        if reason == "energy":
+            self.add_matrix_line("ALERT: Enerji bitti! Motor durduruldu.")
+        elif reason == "boundary":
+            self.add_matrix_line("ALERT: Evren sınırına ulaşıldı!")
+        else:
+            self.add_matrix_line("ALERT: Çarpışma!")
+            for obj in collisions:
+                self.add_matrix_line(f"  - {obj.name} ({obj.obj_type.value}) ile çarpışıldı!")
+        self.stop_engine()
+    
     def check_collision(self, x: int, y: int) -> List[CelestialObject]:
-        """Çarpışma kontrolü"""
-        collisions = []
-        for obj in self.celestial_objects:
-            if obj.x == x and obj.y == y:
-                collisions.append(obj)
-        return collisions
+        """Çarpışma kontrolü - chunk-based evrende hücre indeksinde tek hash sorgusu"""
+        if self.celestial_objects:
+            # Eski format (tek dosya) evren
+            return [obj for obj in self.celestial_objects if obj.x == x and obj.y == y]
+        
+        return [CelestialObject.from_dict(obj)
+                for obj in self.chunk_manager.get_objects_at(x, y, self.current_universe_name)]
     
     def process_command(self, command: str):
         """Komutu işle"""
@@ -1490,6 +1817,10 @@ class SpaceGamePygame:
         
         cmd = parts[0].lower()
         
+        # Komutlar oyun durumunun her yerini değiştirebilir - tüm paneller ve matris yeniden çizilir
+        self.mark_dirty()
+        self.matrix_renderer.invalidate()
+        
         # Komut formatını göster (yeşil renkte ve saat ile)
         self.add_command_line(command)
         
@@ -1722,6 +2053,53 @@ class SpaceGamePygame:
                 self.add_console_line("HATA: Geçersiz yüzde değeri!", Colors.RED)
                 return
         
+        elif cmd == "warp":
+            if not self.ship:
+                self.add_console_line("HATA: Önce görev başlatılmalı!", Colors.RED)
+                return
+            
+            if len(parts) < 2:
+                self.add_console_line("HATA: Kullanım: warp <süre> (örn: warp 90s, warp 30m, warp 2h, warp 1h30m)", Colors.RED)
+                return
+            
+            try:
+                duration = self.parse_duration(parts[1])
+            except ValueError:
+                self.add_console_line("HATA: Geçersiz süre! (örn: warp 90s, warp 30m, warp 2h)", Colors.RED)
+                return
+            
+            if duration <= 0:
+                self.add_console_line("HATA: Süre pozitif olmalı!", Colors.RED)
+                return
+            
+            self.warp_ship(duration)
+            return  # Aşağıdaki komut zincirinin else'ine ("Bilinmeyen komut") düşmez
+        
+        elif cmd in ["timewarp", "tw"]:
+            if not self.ship:
+                self.add_console_line("HATA: Önce görev başlatılmalı!", Colors.RED)
+                return
+            
+            if len(parts) < 2:
+                self.add_console_line(f"Zaman çarpanı: x{self.time_warp:g}", Colors.CYAN)
+                self.add_console_line("Kullanım: timewarp <çarpan> (0.1-1000, örn: timewarp 10)", Colors.WHITE)
+                return
+            
+            try:
+                warp = float(parts[1])
+            except ValueError:
+                self.add_console_line("HATA: Geçersiz zaman çarpanı!", Colors.RED)
+                return
+            
+            if not 0.1 <= warp <= 1000:
+                self.add_console_line("HATA: Zaman çarpanı 0.1-1000 arasında olmalı!", Colors.RED)
+                return
+            
+            self.time_warp = warp
+            effective_speed = self.ship.speed / self.speed_factor / warp
+            self.add_console_line(f"Zaman çarpanı: x{warp:g} ({effective_speed:.3f} gerçek saniye/nokta)", Colors.GREEN)
+            return  # Aşağıdaki komut zincirinin else'ine ("Bilinmeyen komut") düşmez
+        
         elif cmd in ["refresh", "r"]:
             if not self.ship:
                 self.add_console_line("HATA: Önce görev başlatılmalı!")
@@ -1771,6 +2149,96 @@ class SpaceGamePygame:
                 status = "açık" if self.grid_enabled else "kapalı"
                 self.add_console_line(f"Grid durumu: {status}")
         
+        elif cmd == "find":
+            if not self.ship:
+                self.add_console_line("HATA: Önce görev başlatılmalı!", Colors.RED)
+                return
+            
+            if len(parts) < 2:
+                self.add_console_line("HATA: Kullanım: find <alan=değer ...> [within <mesafe>] [limit <n>] [sort <alan>]", Colors.RED)
+                self.add_console_line("Örnek: find type=planet prop=rocky res=Au richness=rich within 300 limit 20 sort score")
+                self.add_console_line("Sonraki sayfa: find --more (-m)")
+                return
+            
+            if parts[1].lower() in ["--more", "-m"]:
+                self.show_find_page()
+                return
+            
+            try:
+                query = Query.parse(parts[1:])
+            except ValueError as e:
+                self.add_console_line(f"HATA: {e}", Colors.RED)
+                return
+            
+            self.run_find_query(query)
+            return  # Aşağıdaki komut zincirinin else'ine ("Bilinmeyen komut") düşmez
+        
+        elif cmd == "near":
+            if not self.ship:
+                self.add_console_line("HATA: Önce görev başlatılmalı!", Colors.RED)
+                return
+            
+            # near [tip] [prop] [adet] [--within <mesafe>]
+            args = parts[1:]
+            radius = None
+            if "--within" in args:
+                within_index = args.index("--within")
+                try:
+                    radius = int(args[within_index + 1])
+                except (IndexError, ValueError):
+                    self.add_console_line("HATA: Kullanım: near [tip] [prop] [adet] [--within <mesafe>]", Colors.RED)
+                    return
+                del args[within_index:within_index + 2]
+            
+            limit = 1 if radius is None else 20
+            if args and args[-1].isdigit():
+                limit = max(1, int(args.pop()))
+            
+            obj_type = Query.TYPE_ALIASES.get(args[0].lower(), args[0].lower()) if args else None
+            if obj_type in ("all", "*"):
+                obj_type = None
+            prop = args[1] if len(args) > 1 else None
+            self.find_nearest_objects(limit, obj_type, prop, radius)
+            return  # Aşağıdaki komut zincirinin else'ine ("Bilinmeyen komut") düşmez
+        
+        elif cmd in ["res", "resource"]:
+            if not self.mission_started:
+                self.add_console_line("HATA: Önce bir evren yükleyin (go komutu)", Colors.RED)
+                return
+            
+            if len(parts) < 3 or parts[1].lower() not in ["--top", "-t", "--near", "-n"]:
+                self.add_console_line("HATA: Kullanım: res --top <kaynak> [adet] [--richness poor/normal/rich]", Colors.RED)
+                self.add_console_line("         res --near <kaynak> [adet] [--richness poor/normal/rich]")
+                self.add_console_line("Örnek: res --top Uranium 20, res --near Au --richness rich")
+                return
+            
+            args = parts[2:]
+            richness = None
+            if "--richness" in args:
+                richness_index = args.index("--richness")
+                if richness_index + 1 >= len(args):
+                    self.add_console_line("HATA: Zenginlik gerekli! (poor/normal/rich)", Colors.RED)
+                    return
+                richness = args[richness_index + 1].lower()
+                del args[richness_index:richness_index + 2]
+                if richness not in [r.value for r in ResourceRichness]:
+                    self.add_console_line("HATA: Geçersiz zenginlik! (poor/normal/rich)", Colors.RED)
+                    return
+            
+            try:
+                limit = int(args[1]) if len(args) > 1 else (20 if parts[1].lower() in ["--top", "-t"] else 1)
+            except ValueError:
+                self.add_console_line("HATA: Geçersiz adet!", Colors.RED)
+                return
+            
+            if limit <= 0:
+                self.add_console_line("HATA: Adet pozitif olmalı!", Colors.RED)
+                return
+            
+            nearest = parts[1].lower() in ["--near", "-n"]
+            self.find_resource(args[0], limit, richness, nearest)
+            return  # Aşağıdaki komut zincirinin else'ine ("Bilinmeyen komut") düşmez
+        
         elif cmd in ["info", "i"]:
             if len(parts) > 1:
                 sub_cmd = parts[1].lower()
@@ -1778,8 +2246,12 @@ class SpaceGamePygame:
                     self.show_universe_info()
                 elif sub_cmd == "objects" or sub_cmd == "o":
                     self.show_matrix_objects_info()
+                elif sub_cmd == "cache" or sub_cmd == "c":
+                    self.show_render_cache_info()
+                else:
+                    self.add_console_line(f"HATA: Bilinmeyen info parametresi: {parts[1]}! Kullanım: info universe/objects/cache veya i u/o/c", Colors.RED)
             else:
-                self.add_console_line("HATA: Geçersiz parametre! Kullanım: info universe/objects veya i u/o", Colors.RED)
+                self.add_console_line("HATA: Geçersiz parametre! Kullanım: info universe/objects/cache veya i u/o/c", Colors.RED)
         else:
             self.add_console_line("HATA: info universe/objects kullanın veya i u/o", Colors.RED)
         
@@ -1856,8 +2328,9 @@ class SpaceGamePygame:
                     self.load_universe(universe_file)
                 
                 self.start_mission(1)
-                # Matrix boyutunu güncelle
+                # Matrix boyutunu ve render threshold'u güncelle
                 self.matrix_size = self.calculate_matrix_size()
+                self.matrix_render_threshold = self.calculate_render_threshold()
                 
                 self.add_console_line(f"Evren yüklendi: {name}")
                 self.add_console_line(f"Boyut: {self.universe_size}x{self.universe_size}")
@@ -1877,8 +2350,9 @@ class SpaceGamePygame:
                 self.universe_size = size
                 self.create_advanced_universe(name, size, size, "normal")
                 self.start_mission(1)
-                # Matrix boyutunu güncelle
+                # Matrix boyutunu ve render threshold'u güncelle
                 self.matrix_size = self.calculate_matrix_size()
+                self.matrix_render_threshold = self.calculate_render_threshold()
                 
                 self.add_console_line(f"Yeni evren oluşturuldu: {name}")
                 self.add_console_line(f"Boyut: {self.universe_size}x{self.universe_size}")
@@ -1930,7 +2404,7 @@ class SpaceGamePygame:
                 return
             
             if len(parts) < 2:
-                self.add_catalog_line("ERROR: Usage: cat --save <name>, cat --list, cat --all, or cat --resume", Colors.RED)
+                self.add_catalog_line("ERROR: Usage: cat --save <name>, cat --delete <name>, cat --list, cat --all, or cat --resume", Colors.RED)
                 return
             
             if parts[1] == "--save" or parts[1] == "-s":
@@ -1941,6 +2415,13 @@ class SpaceGamePygame:
                 celestial_name = parts[2]
                 self.save_celestial_to_catalog(celestial_name)
                 
+            elif parts[1] == "--delete" or parts[1] == "-d":
+                if len(parts) < 3:
+                    self.add_catalog_line(self.locale.get("catalog.name_required"), Colors.RED)
+                    return
+                
+                self.delete_catalog_entry(parts[2])
+                
             elif parts[1] == "--list" or parts[1] == "-ls":
                 self.list_catalog()
                 
@@ -2022,6 +2503,14 @@ class SpaceGamePygame:
         else:
             self.add_console_line(f"Bilinmeyen komut: {cmd}", Colors.WHITE)
     
+    def show_render_cache_info(self):
+        """Metin render önbelleği sayaçlarını göster"""
+        stats = self.text_cache.stats()
+        self.add_console_line("=== TEXT RENDER CACHE ===", Colors.CYAN)
+        self.add_console_line(f"Entries: {stats['entries']}/{stats['max_entries']}")
+        self.add_console_line(f"Hits: {stats['hits']}  Misses: {stats['misses']}  Evictions: {stats['evictions']}")
+        self.add_console_line(f"Hit rate: %{stats['hit_rate'] * 100:.1f}")
+    
     def show_universe_info(self):
         """Evren bilgilerini göster"""
         if not self.mission_started:
@@ -2042,18 +2531,10 @@ class SpaceGamePygame:
         if os.path.exists(metadata_file):
             # Chunk-based format
             self.add_console_line("Format: Chunk-based")
-            # Tüm chunk'ları yükle ve gök cisimlerini say
-            for chunk_x in range(0, (self.universe_size // 100) + 1):
-                for chunk_y in range(0, (self.universe_size // 100) + 1):
-                    chunk_objects = self.chunk_manager.load_chunk(chunk_x, chunk_y, self.current_universe_name)
-                    
-                    for obj in chunk_objects:
-                        total_objects += 1
-                        obj_type = obj.get('type', 'unknown')
-                        if obj_type in object_types:
-                            object_types[obj_type] += 1
-                        else:
-                            object_types[obj_type] = 1
+            # Sayılar stats.json manifestinden - chunk yüklenmez
+            total = self.chunk_manager.get_stats(self.current_universe_name).total
+            total_objects = total.get("objects", 0)
+            object_types = dict(total.get("types", {}))
         elif os.path.exists(universe_file):
             # Eski format (tek dosya)
             self.add_console_line("Format: Eski format (tek dosya)")
@@ -2089,6 +2570,76 @@ class SpaceGamePygame:
         self.add_console_line("")
         self.add_console_line("=== EVREN BİLGİLERİ SONU ===")
     
+    def run_find_query(self, query):
+        """find sorgusunu indekslere göre planla ve ilk sonuç sayfasını göster"""
+        if not os.path.exists(f"universes/{self.current_universe_name}/metadata.json"):
+            self.add_console_line("HATA: find sadece chunk-based evrenlerde kullanılabilir", Colors.RED)
+            return
+        
+        plan, rows = query.execute(self.chunk_manager, self.current_universe_name, self.ship.x, self.ship.y)
+        self.find_results = rows
+        self.find_result_count = 0
+        self.add_console_line(f"=== FIND ({plan}) ===", Colors.CYAN)
+        self.show_find_page()
+    
+    def show_find_page(self):
+        """Son find sorgusunun sonraki sayfasını göster - sonuçlar sayfa sayfa üretilir"""
+        if self.find_results is None:
+            self.add_console_line("HATA: Devam edecek find sorgusu yok", Colors.RED)
+            return
+        
+        page = list(itertools.islice(self.find_results, self.find_page_size))
+        for row in page:
+            self.find_result_count += 1
+            line = f"{self.find_result_count}. {row['name']} ({row['type']}) @ ({row['x']},{row['y']}) mesafe: {row['distance']:.1f}"
+            if "score" in row:
+                line += f" skor: {row['score']:.3f} {row['richness']}"
+            self.add_console_line(line)
+        
+        if len(page) < self.find_page_size:
+            if self.find_result_count == 0:
+                self.add_console_line("Sonuç bulunamadı.", Colors.YELLOW)
+            self.add_console_line(f"Toplam {self.find_result_count} sonuç.", Colors.CYAN)
+            self.find_results = None
+        else:
+            self.add_console_line("Devamı için: find --more", Colors.CYAN)
+    
+    def find_resource(self, resource_name, limit, richness=None, nearest=False):
+        """Kaynak indeksinden en yüksek skorlu veya gemiye en yakın kaynak yataklarını listele"""
+        resource = UniverseConstants.resolve_resource(resource_name)
+        if resource is None:
+            self.add_console_line(f"HATA: Bilinmeyen kaynak: {resource_name}", Colors.RED)
+            return
+        
+        if not os.path.exists(f"universes/{self.current_universe_name}/metadata.json"):
+            self.add_console_line("HATA: Kaynak indeksi sadece chunk-based evrenlerde kullanılabilir", Colors.RED)
+            return
+        
+        index = self.chunk_manager.get_resource_index(self.current_universe_name)
+        richness_text = f" ({richness})" if richness else ""
+        
+        if nearest:
+            if not self.ship:
+                self.add_console_line("HATA: Gemi bulunamadı!", Colors.RED)
+                return
+            results = index.nearest(resource, self.ship.x, self.ship.y,
+                                    self.chunk_manager.chunk_size, limit, richness)
+            self.add_console_line(f"=== EN YAKIN {resource.upper()}{richness_text} ===", Colors.CYAN)
+        else:
+            results = [(None, posting) for posting in index.top(resource, limit, richness)]
+            self.add_console_line(f"=== EN YÜKSEK SKORLU {len(results)} {resource.upper()}{richness_text} ===", Colors.CYAN)
+        
+        if not results:
+            self.add_console_line("Sonuç bulunamadı.", Colors.YELLOW)
+            return
+        
+        for rank, (distance, posting) in enumerate(results, 1):
+            score, name, chunk_x, chunk_y, x, y, obj_type, posting_richness = posting
+            line = f"{rank}. {name} ({obj_type}) skor: {score:.3f} {posting_richness} @ ({x},{y}) chunk ({chunk_x},{chunk_y})"
+            if distance is not None:
+                line += f" mesafe: {distance:.1f}"
+            self.add_console_line(line)
+    
     def show_matrix_objects_info(self):
         """Matrix içerisindeki gök cisimleri hakkında detaylı bilgileri göster"""
         if not self.mission_started:
@@ -2227,233 +2778,6 @@ class SpaceGamePygame:
         self.add_console_line("")
         self.add_console_line("=== MATRİS GÖK CİSİMLERİ BİLGİLERİ SONU ===")
     
-    def calculate_star_count(self, width: int, height: int, preset_scale: float = 1.0) -> int:
-        """Yıldız sayısını hesapla"""
-        area = width * height
-        S = UniverseConstants.BASE_STAR_DENOMINATOR * preset_scale
-        n_stars = max(UniverseConstants.MIN_STAR_COUNT, round(area / S))
-        return min(n_stars, UniverseConstants.MAX_STAR_COUNT)
-    
-    def calculate_minimum_star_spacing(self, width: int, height: int, n_stars: int) -> float:
-        """Minimum yıldız-yıldız mesafesini hesapla"""
-        area = width * height
-        D = math.sqrt(area / n_stars)
-        return UniverseConstants.MIN_STAR_SPACING_FACTOR * D
-    
-    def place_black_holes(self, width: int, height: int, area: int, max_attempts: int = 5000) -> list:
-        """Karadelikleri yerleştir"""
-        n_bh = max(0, round(area / UniverseConstants.BH_DENOMINATOR))
-        black_holes = []
-        
-        for i in range(n_bh):
-            placed = False
-            for attempt in range(max_attempts):
-                x = random.uniform(0, width)
-                y = random.uniform(0, height)
-                
-                # Karadelik sınıfını seç
-                bh_class = random.choices(
-                    [BlackHoleClass.STELLAR, BlackHoleClass.INTERMEDIATE, BlackHoleClass.SUPERMASSIVE],
-                    weights=[85, 14, 1]
-                )[0]
-                
-                bh = BlackHole(x, y, bh_class, len(black_holes))
-                
-                # Mevcut karadeliklerle çakışma kontrolü
-                collision = False
-                for existing_bh in black_holes:
-                    distance = math.hypot(x - existing_bh.x, y - existing_bh.y)
-                    if distance < (bh.R_excl + existing_bh.R_excl):
-                        collision = True
-                        break
-                
-                if not collision:
-                    black_holes.append(bh)
-                    placed = True
-                    break
-            
-            if not placed:
-                # Karadelik yerleştirilemedi, devam et
-                continue
-        
-        return black_holes
-    
-    def place_stars(self, width: int, height: int, n_stars: int, D_min: float, 
-                   black_holes: list, max_attempts_per_star: int = 2000) -> list:
-        """Yıldızları yerleştir"""
-        stars = []
-        
-        for i in range(n_stars):
-            placed = False
-            for attempt in range(max_attempts_per_star):
-                x = random.uniform(0, width)
-                y = random.uniform(0, height)
-                
-                # Karadelik dışlama alanı kontrolü
-                collision = False
-                for bh in black_holes:
-                    distance = math.hypot(x - bh.x, y - bh.y)
-                    if distance < bh.R_excl:
-                        collision = True
-                        break
-                
-                if collision:
-                    continue
-                
-                # Yıldız-yıldız mesafe kontrolü
-                for star in stars:
-                    distance = math.hypot(x - star.x, y - star.y)
-                    if distance < D_min:
-                        collision = True
-                        break
-                
-                if collision:
-                    continue
-                
-                # Yıldız türünü seç
-                star_type = random.choices(
-                    [StarType.M, StarType.K, StarType.G, StarType.HOT],
-                    weights=[70, 15, 8, 7]
-                )[0]
-                
-                # Yıldız yarıçapı
-                star_radius = {"M": 5, "K": 7, "G": 9, "Hot": 12}[star_type.value]
-                
-                star = Star(x, y, star_type, star_radius, len(stars))
-                stars.append(star)
-                placed = True
-                break
-            
-            if not placed:
-                # Yıldız yerleştirilemedi, devam et
-                continue
-        
-        return stars
-    
-    def place_planets_for_star(self, star: Star, width: int, height: int, 
-                              existing_objects: list, mean_planets: float = 3.5) -> list:
-        """Yıldız için gezegenleri yerleştir"""
-        planets = []
-        
-        # Poisson dağılımı ile gezegen sayısı
-        n_planets = max(0, int(random.gauss(mean_planets, 1)))
-        n_planets = min(n_planets, 20)  # Maksimum sınır
-        
-        if n_planets == 0:
-            return planets
-        
-        # İlk yörünge yarıçapı
-        a = max(star.radius * 1.5, 8)
-        
-        for i in range(n_planets):
-            # Yörünge yarıçapını artır
-            r_ratio = random.uniform(*UniverseConstants.PLANET_ORBIT_RATIO_RANGE)
-            a = a * r_ratio
-            
-            # Yörünge açısı
-            theta = random.uniform(0, 2 * math.pi)
-            
-            # Gezegen konumu
-            px = star.x + a * math.cos(theta)
-            py = star.y + a * math.sin(theta)
-            
-            # Sınır kontrolü
-            if px < 0 or px >= width or py < 0 or py >= height:
-                continue
-            
-            # Gezegen yarıçapı tahmini
-            planet_radius = max(1, int(a ** 0.3))
-            
-            # Çakışma kontrolü
-            collision = False
-            for obj in existing_objects:
-                distance = math.hypot(px - obj.x, py - obj.y)
-                obj_radius = getattr(obj, 'radius', 0)
-                if distance < (planet_radius + obj_radius) * 1.2:
-                    collision = True
-                    break
-            
-            if collision:
-                continue
-            
-            # Gezegen türünü belirle (mesafeye göre)
-            if a < 50:
-                planet_type = PlanetType.ROCKY
-            elif a > 200:
-                planet_type = PlanetType.GAS
-            else:
-                planet_type = PlanetType.ICE
-            
-            planet = Planet(px, py, a, theta, planet_type, planet_radius, 
-                          star.star_id, len(planets))
-            planets.append(planet)
-        
-        return planets
-    
-    def create_asteroid_belt(self, star: Star, planets: list, belt_id: int) -> AsteroidBelt:
-        """Asteroid kuşağı oluştur"""
-        # Kuşak merkez yarıçapı (gezegen yörüngeleri arasında)
-        if len(planets) >= 2:
-            # İkinci ve üçüncü gezegen arası
-            orbit_radii = [p.orbit_radius for p in planets]
-            orbit_radii.sort()
-            if len(orbit_radii) >= 2:
-                a_belt = random.uniform(orbit_radii[1], orbit_radii[2] if len(orbit_radii) > 2 else orbit_radii[1] * 1.5)
-            else:
-                a_belt = orbit_radii[0] * random.uniform(1.2, 2.5)
-        else:
-            # Gezegen yoksa varsayılan mesafe
-            a_belt = star.radius * random.uniform(3, 8)
-        
-        # Kuşak genişliği
-        width = random.uniform(10, 100)
-        
-        return AsteroidBelt(star.star_id, a_belt, width, belt_id)
-    
-    def assign_resources(self, body, body_type: str) -> dict:
-        """Gök cismine kaynak ataması yap - Rastgele kaynak seçimi"""
-        resources = {}
-        
-        # Kütle faktörü - radius özelliği varsa kullan, yoksa varsayılan değer
-        if hasattr(body, 'radius'):
-            mass_factor = max(0.5, body.radius / 5.0)
-        else:
-            mass_factor = 1.0  # Varsayılan kütle faktörü
-        
-        # Mesafe faktörü
-        distance_factor = 1.0
-        if body_type == "asteroid":
-            distance_factor = 1.5
-        elif hasattr(body, 'prop') and body.prop == "gas":
-            distance_factor = 0.2
-        
-        # Rastgele kaynak sayısı (3-8 arası)
-        num_resources = random.randint(3, 8)
-        
-        # Mevcut kaynak türlerini rastgele seç
-        available_resources = list(UniverseConstants.BASE_RESOURCE_ABUNDANCE.keys())
-        selected_resources = random.sample(available_resources, min(num_resources, len(available_resources)))
-        
-        # Seçilen kaynaklar için hesaplama
-        for resource_type in selected_resources:
-            base_val = UniverseConstants.BASE_RESOURCE_ABUNDANCE[resource_type][body_type]
-            score = base_val * mass_factor * distance_factor * random.uniform(0.7, 1.3)
-            
-            # Zenginlik sınıflandırması
-            if score > UniverseConstants.RESOURCE_THRESHOLD_HIGH:
-                richness = ResourceRichness.RICH
-            elif score > UniverseConstants.RESOURCE_THRESHOLD_LOW:
-                richness = ResourceRichness.NORMAL
-            else:
-                richness = ResourceRichness.POOR
-            
-            resources[resource_type.value] = {
-                "score": score,
-                "richness": richness.value
-            }
-        
-        return resources
-    
     def get_star_temperature(self, star_type: str) -> str:
         """Yıldız türüne göre sıcaklık döndür"""
         temperatures = {
@@ -2479,185 +2803,29 @@ class SpaceGamePygame:
         masses = {
             'stellar': '3-20',
             'intermediate': '100-10,000',
-            'super': '1,000,000-10,000,000'
+            'supermassive': '1,000,000-10,000,000'
         }
         return masses.get(bh_class, 'Bilinmeyen')
     
-    def create_advanced_universe(self, name: str, width: int, height: int, preset: str = "normal") -> dict:
+    def create_advanced_universe(self, name: str, width: int, height: int, preset: str = "normal",
+                                 seed: Optional[int] = None) -> dict:
         """Gelişmiş evren oluşturma algoritması"""
         self.add_console_line(f"Evren oluşturuluyor: {name} ({width}x{height})")
         self.add_console_line(f"Preset: {preset}")
         
-        # Preset ölçekleri
-        preset_scales = {
-            "sparse": 2.5,
-            "normal": 1.0,
-            "dense": 0.5,
-            "empty": 10.0
-        }
-        preset_scale = preset_scales.get(preset, 1.0)
-        
-        area = width * height
-        
-        # 1. Yıldız sayısını hesapla
-        n_stars = self.calculate_star_count(width, height, preset_scale)
-        D_min = self.calculate_minimum_star_spacing(width, height, n_stars)
-        
-        self.add_console_line(f"Yıldız sayısı: {n_stars}")
-        self.add_console_line(f"Minimum yıldız mesafesi: {D_min:.1f}")
-        
-        # 2. Karadelikleri yerleştir (önce)
-        self.add_console_line("Karadelikler yerleştiriliyor...")
-        black_holes = self.place_black_holes(width, height, area)
-        self.add_console_line(f"Yerleştirilen karadelik sayısı: {len(black_holes)}")
-        
-        # 3. Yıldızları yerleştir
-        self.add_console_line("Yıldızlar yerleştiriliyor...")
-        stars = self.place_stars(width, height, n_stars, D_min, black_holes)
-        self.add_console_line(f"Yerleştirilen yıldız sayısı: {len(stars)}")
-        
-        # 4. Her yıldıza gezegenler ekle
-        all_planets = []
-        all_asteroid_belts = []
-        existing_objects = black_holes + stars
-        
-        self.add_console_line("Gezegenler yerleştiriliyor...")
-        for star in stars:
-            planets = self.place_planets_for_star(star, width, height, existing_objects)
-            star.planets = planets
-            all_planets.extend(planets)
-            
-            # Kaynak ataması
-            for planet in planets:
-                planet.resources = self.assign_resources(planet, "planet")
-            
-            # Asteroid kuşağı oluştur
-            if random.random() < UniverseConstants.ASTEROID_BELT_PROB:
-                belt = self.create_asteroid_belt(star, planets, len(all_asteroid_belts))
-                belt.resource_pool = self.assign_resources(belt, "asteroid")
-                star.asteroid_belts.append(belt)
-                all_asteroid_belts.append(belt)
-            
-            # Mevcut objeleri güncelle
-            existing_objects.extend(planets)
-        
-        self.add_console_line(f"Yerleştirilen gezegen sayısı: {len(all_planets)}")
-        self.add_console_line(f"Yerleştirilen asteroid kuşağı sayısı: {len(all_asteroid_belts)}")
-        
-        # 5. Chunk'lara dağıt
-        self.add_console_line("Chunk'lara dağıtılıyor...")
-        chunk_objects = {}
-        
-        # Yıldızları chunk'lara dağıt
-        for star in stars:
-            chunk_coord = self.chunk_manager.get_chunk_coords(int(star.x), int(star.y))
-            if chunk_coord not in chunk_objects:
-                chunk_objects[chunk_coord] = []
-            
-            chunk_objects[chunk_coord].append({
-                "x": int(star.x),
-                "y": int(star.y),
-                "type": "sun",
-                "name": f"star_{int(star.x)}_{int(star.y)}",
-                "prop": star.star_type.value,
-                "radius": star.radius
-            })
-        
-        # Karadelikleri chunk'lara dağıt
-        for bh in black_holes:
-            chunk_coord = self.chunk_manager.get_chunk_coords(int(bh.x), int(bh.y))
-            if chunk_coord not in chunk_objects:
-                chunk_objects[chunk_coord] = []
-            
-            chunk_objects[chunk_coord].append({
-                "x": int(bh.x),
-                "y": int(bh.y),
-                "type": "black_hole",
-                "name": f"blackhole_{int(bh.x)}_{int(bh.y)}",
-                "prop": bh.bh_class.value,
-                "R_infl": bh.R_infl,
-                "R_excl": bh.R_excl
-            })
-        
-        # Gezegenleri chunk'lara dağıt
-        for planet in all_planets:
-            chunk_coord = self.chunk_manager.get_chunk_coords(int(planet.x), int(planet.y))
-            if chunk_coord not in chunk_objects:
-                chunk_objects[chunk_coord] = []
-            
-            chunk_objects[chunk_coord].append({
-                "x": int(planet.x),
-                "y": int(planet.y),
-                "type": "planet",
-                "name": f"planet_{int(planet.x)}_{int(planet.y)}",
-                "prop": planet.planet_type.value,
-                "radius": planet.radius,
-                "orbit_radius": planet.orbit_radius,
-                "star_id": planet.star_id,
-                "resources": planet.resources
-            })
-        
-        # Asteroid kuşaklarını chunk'lara dağıt
-        for belt in all_asteroid_belts:
-            # Kuşak merkezini bul
-            star = next((s for s in stars if s.star_id == belt.star_id), None)
-            if star:
-                chunk_coord = self.chunk_manager.get_chunk_coords(int(star.x), int(star.y))
-                if chunk_coord not in chunk_objects:
-                    chunk_objects[chunk_coord] = []
-                
-                chunk_objects[chunk_coord].append({
-                    "x": int(star.x),
-                    "y": int(star.y),
-                    "type": "asteroid_belt",
-                    "name": f"belt_{int(star.x)}_{int(star.y)}_{belt.belt_id}",
-                    "center_radius": belt.center_radius,
-                    "width": belt.width,
-                    "fragment_count": belt.fragment_count,
-                    "star_id": belt.star_id,
-                    "resource_pool": belt.resource_pool
-                })
-        
-        # 6. Chunk dosyalarını oluştur
-        universe_dir = f"universes/{name}"
-        os.makedirs(universe_dir, exist_ok=True)
-        
-        # Metadata dosyası
-        metadata = {
-            "name": name,
-            "size": width,
-            "chunk_size": 100,
-            "created": datetime.now().isoformat(),
-            "preset": preset,
-            "statistics": {
-                "stars": len(stars),
-                "black_holes": len(black_holes),
-                "planets": len(all_planets),
-                "asteroid_belts": len(all_asteroid_belts)
-            }
-        }
-        
-        with open(f"{universe_dir}/metadata.json", 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        if seed is None:
+            seed = random.randrange(2 ** 31)
         
-        # Chunk dosyalarını oluştur
-        for chunk_coord, objects in chunk_objects.items():
-            chunk_file = self.chunk_manager.get_chunk_file_path(
-                chunk_coord[0], chunk_coord[1], name
-            )
-            with open(chunk_file, 'w', encoding='utf-8') as f:
-                json.dump(objects, f, indent=2, ensure_ascii=False)
+        generator = UniverseGenerator(width, height, preset, seed,
+                                      self.chunk_manager.chunk_size, log=self.add_console_line)
+        result = generator.write_universe(name, f"universes/{name}")
+        self.chunk_manager.forget_universe_files(name)
+        self.matrix_renderer.invalidate()  # Aynı isimle yeniden oluşturulan evrenin eski hücreleri çizilmesin
         
         self.add_console_line(f"Evren oluşturuldu: {name}")
-        self.add_console_line(f"Toplam chunk sayısı: {len(chunk_objects)}")
-        
-        return {
-            "stars": stars,
-            "black_holes": black_holes,
-            "planets": all_planets,
-            "asteroid_belts": all_asteroid_belts,
-            "chunk_objects": chunk_objects
-        }
+        self.add_console_line(f"Toplam chunk sayısı: {len(result['chunk_objects'])}")
+        
+        return result
     
     def get_celestial_type_info(self, obj_type):
         """Gök cismi türüne göre bilgi döndür"""
@@ -2695,6 +2863,13 @@ class SpaceGamePygame:
             'description': 'Tanımlanmamış gök cismi türü'
         })
     
+    def get_map_index(self):
+        """Aktif oturumun map özetleri (maps/index.json) - oturum başına bir kez okunur"""
+        maps_dir = f"sessions/{self.current_universe_name}/{self.current_session_name}/maps"
+        if self.map_index is None or self.map_index.directory != maps_dir:
+            self.map_index = MapIndex(maps_dir).load()
+        return self.map_index
+    
     def save_map(self, map_name, description=""):
         """Mevcut chunk'ı map olarak kaydet"""
         if not self.ship:
@@ -2713,39 +2888,42 @@ class SpaceGamePygame:
         # Map dosya yolu
         map_file = f"{maps_dir}/{map_name}.json"
         
+        if map_name == MapIndex.INDEX_FILE[:-len(".json")]:
+            self.add_console_line(f"HATA: '{map_name}' map ismi olarak kullanılamaz!", Colors.RED)
+            return
+        
         # Aynı isimde map var mı kontrol et
         if os.path.exists(map_file):
             self.add_console_line(f"HATA: '{map_name}' isimli map zaten mevcut!", Colors.RED)
             return
         
         # Mevcut matrix alanındaki gök cisimlerini yükle
-        matrix_objects = self.chunk_manager.get_objects_in_area(
-            self.matrix_start_x, self.matrix_start_y,
-            self.matrix_start_x + self.matrix_size - 1,
-            self.matrix_start_y + self.matrix_size - 1,
-            self.current_universe_name
-        )
-        
-        # Map verisini oluştur
-        map_data = {
-            "name": map_name,
-            "description": description,
-            "universe_name": self.current_universe_name,
-            "created": datetime.now().isoformat(),
-            "matrix_data": {
-                "center_x": self.ship.x,
-                "center_y": self.ship.y,
-                "matrix_start_x": self.matrix_start_x,
-                "matrix_start_y": self.matrix_start_y,
-                "matrix_size": self.matrix_size,
-                "celestial_objects": matrix_objects
-            }
+        self.finish_viewport_preview()
+        area = (self.matrix_start_x, self.matrix_start_y,
+                self.matrix_start_x + self.matrix_size - 1,
+                self.matrix_start_y + self.matrix_size - 1)
+        matrix_objects = self.chunk_manager.get_objects_in_area(*area, self.current_universe_name)
+        # Önizleme: alana uzanan tüm cisimlerin çizim geometrisi (map yüklenirken anında çizilir)
+        preview = self.chunk_manager.get_objects_reaching_area(*area, self.current_universe_name)
+        
+        # Map verisini oluştur - cisimler kopyalanmaz, isim + chunk referansı ve içerik hash'i saklanır
+        metadata = dict(self.chunk_manager.get_metadata(self.current_universe_name))
+        metadata.setdefault("name", self.current_universe_name)
+        geometry = {
+            "center_x": self.ship.x,
+            "center_y": self.ship.y,
+            "matrix_start_x": self.matrix_start_x,
+            "matrix_start_y": self.matrix_start_y,
+            "matrix_size": self.matrix_size
         }
+        map_data = MapSnapshot.create(map_name, description, datetime.now().isoformat(), metadata,
+                                      geometry, matrix_objects, self.chunk_manager.chunk_size, preview)
         
         # Map dosyasını kaydet
         try:
             with open(map_file, 'w', encoding='utf-8') as f:
-                json.dump(map_data, f, indent=2, ensure_ascii=False)
+                json.dump(map_data, f, ensure_ascii=False)
+            self.get_map_index().put(map_name, map_data)
             
             self.add_console_line(f"Map kaydedildi: {map_name}")
             self.add_console_line(f"Konum: {maps_dir}/{map_name}.json")
@@ -2770,6 +2948,7 @@ class SpaceGamePygame:
         
         try:
             os.remove(map_file)
+            self.get_map_index().remove(map_name)
             self.add_console_line(f"Map silindi: {map_name}")
         except Exception as e:
             self.add_console_line(f"HATA: Map silinemedi: {e}", Colors.RED)
@@ -2780,40 +2959,26 @@ class SpaceGamePygame:
             self.add_console_line("ERROR: No active session!", Colors.RED)
             return
         
-        maps_dir = f"sessions/{self.current_universe_name}/{self.current_session_name}/maps"
+        # Özetler maps/index.json'dan okunur - map dosyaları açılmaz
+        map_index = self.get_map_index()
         
-        if not os.path.exists(maps_dir):
-            self.add_console_line("Kayıtlı map bulunamadı.")
-            return
-        
-        map_files = [f for f in os.listdir(maps_dir) if f.endswith('.json')]
-        
-        if not map_files:
+        if not map_index.entries:
             self.add_console_line("Kayıtlı map bulunamadı.")
             return
         
         self.add_console_line("=== KAYITLI MAP'LER ===")
         
-        for i, map_file in enumerate(sorted(map_files), 1):
-            map_name = map_file.replace('.json', '')
-            map_path = os.path.join(maps_dir, map_file)
+        for i, map_name in enumerate(sorted(map_index.entries), 1):
+            summary = map_index.entries[map_name]
+            if "error" in summary:
+                self.add_console_line(f"{i:2d}. {map_name} (HATA: {summary['error']})")
+                continue
             
-            try:
-                with open(map_path, 'r', encoding='utf-8') as f:
-                    map_data = json.load(f)
-                
-                description = map_data.get('description', 'Açıklama yok')
-                created = map_data.get('created', 'Bilinmiyor')
-                obj_count = len(map_data.get('matrix_data', {}).get('celestial_objects', []))
-                
-                self.add_console_line(f"{i:2d}. {map_name}")
-                self.add_console_line(f"    Açıklama: {description}")
-                self.add_console_line(f"    Oluşturulma: {created}")
-                self.add_console_line(f"    Gök cismi sayısı: {obj_count}")
-                self.add_console_line("")
-                
-            except Exception as e:
-                self.add_console_line(f"{i:2d}. {map_name} (HATA: {e})")
+            self.add_console_line(f"{i:2d}. {map_name}")
+            self.add_console_line(f"    Açıklama: {summary.get('description') or 'Açıklama yok'}")
+            self.add_console_line(f"    Oluşturulma: {summary.get('created') or 'Bilinmiyor'}")
+            self.add_console_line(f"    Gök cismi sayısı: {summary.get('object_count', 0)}")
+            self.add_console_line("")
         
         self.add_console_line("=== MAP LİSTESİ SONU ===")
     
@@ -2850,6 +3015,13 @@ class SpaceGamePygame:
             # Chunk'ları güncelle
             self.chunk_manager.unload_distant_chunks(self.ship.x, self.ship.y)
             
+            # Map önizlemeden hemen çizilir, alanın chunk'ları arka planda okunur
+            preview = MapSnapshot.preview(map_data)
+            if preview is None:
+                # Önizlemesiz map - cisim noktaları uzamsal indeksten
+                preview = self.get_viewport_points()
+            self.start_viewport_preview(preview, lambda: self.check_map_references(map_data))
+            
             # Motoru durdur (güvenlik)
             self.ship.is_moving = False
             self.engine_on = False
@@ -2858,6 +3030,7 @@ class SpaceGamePygame:
             self.add_console_line(f"Map yüklendi: {map_name}")
             self.add_console_line(f"Gemi konumu: ({self.ship.x}, {self.ship.y})")
             self.add_console_line(f"Matrix alanı: ({self.matrix_start_x}, {self.matrix_start_y}) - ({self.matrix_start_x + self.matrix_size - 1}, {self.matrix_start_y + self.matrix_size - 1})")
+            self.add_console_line(f"Gök cismi sayısı: {MapIndex.summarize(map_data)['object_count']}")
             
             # Matrix görüntüye bilgi ekle
             self.add_matrix_line(f"MAP YÜKLENDİ: {map_name}", Colors.MAGENTA)
@@ -2867,6 +3040,18 @@ class SpaceGamePygame:
         except Exception as e:
             self.add_console_line(f"HATA: Map yüklenemedi: {e}", Colors.RED)
     
+    def check_map_references(self, map_data):
+        """Referansları chunk'lardan çöz ve evrenin map kaydedildikten sonra değişip değişmediğini kontrol et"""
+        objects, missing, unchanged = MapSnapshot.resolve(
+            map_data,
+            lambda chunk_x, chunk_y: self.chunk_manager.load_chunk(chunk_x, chunk_y, self.current_universe_name)
+        )
+        identity = map_data.get('universe')
+        if identity and identity != MapSnapshot.universe_identity(self.chunk_manager.get_metadata(self.current_universe_name)):
+            self.add_console_line("UYARI: Evren bu map kaydedildikten sonra yeniden oluşturulmuş!", Colors.YELLOW)
+        elif not unchanged:
+            self.add_console_line(f"UYARI: Map alanındaki gök cisimleri değişmiş ({len(missing)} kayıp)", Colors.YELLOW)
+    
     def show_help(self, command=None):
         """Yardım ekranını göster"""
         if command:
@@ -2912,6 +3097,12 @@ class SpaceGamePygame:
         self.add_console_line("max", Colors.YELLOW)
         self.add_console_line("  Hızı maksimuma ayarla (en hızlı)", Colors.WHITE)
         self.add_console_line("")
+        self.add_console_line("timewarp (tw)", Colors.YELLOW)
+        self.add_console_line("  <çarpan>               : Simülasyon zamanını hızlandır (0.1-1000)", Colors.WHITE)
+        self.add_console_line("")
+        self.add_console_line("warp", Colors.YELLOW)
+        self.add_console_line("  <süre>                 : Uçuşu ileri sar (90s, 30m, 2h, 1h30m)", Colors.WHITE)
+        self.add_console_line("")
         self.add_console_line("refresh (r)", Colors.YELLOW)
         self.add_console_line("  Güncelleme süresi bilgisi", Colors.WHITE)
         self.add_console_line("")
@@ -2930,9 +3121,33 @@ class SpaceGamePygame:
         # KATALOG YÖNETİMİ
         self.add_console_line("cat", Colors.YELLOW)
         self.add_console_line("  --save (-s) <name>     : Gök cismini kataloga kaydet", Colors.WHITE)
+        self.add_console_line("  --delete (-d) <name>   : Gök cismini katalogdan sil", Colors.WHITE)
         self.add_console_line("  --list (-ls)           : Katalogu listele", Colors.WHITE)
         self.add_console_line("  --all (-a)             : Matrix'teki tüm gök cisimlerini kaydet", Colors.WHITE)
-        self.add_console_line("  --resume (-r)          : Katalog istatistiklerini göster", Colors.WHITE)
+        self.add_console_line("  --resume (-r)          : Katalog istatistikleri (evren toplamına oranla)", Colors.WHITE)
+        self.add_console_line("")
+        
+        # SORGU
+        self.add_console_line("find", Colors.YELLOW)
+        self.add_console_line("  <alan><op><değer> ...  : type, prop, res, richness, name, radius... (= != < <= > >=)", Colors.WHITE)
+        self.add_console_line("  within <mesafe>        : Gemiye mesafe sınırı", Colors.WHITE)
+        self.add_console_line("  limit <n> / sort <alan>: Sonuç sayısı / sıralama (score, distance, name, -alan)", Colors.WHITE)
+        self.add_console_line("  --more (-m)            : Sonraki sonuç sayfası", Colors.WHITE)
+        self.add_console_line("")
+        
+        # YAKINLIK ARAMA
+        self.add_console_line("near", Colors.YELLOW)
+        self.add_console_line("  [tip] [prop] [n]       : Gemiye en yakın n gök cismi (örn: near sun G 5)", Colors.WHITE)
+        self.add_console_line("  --within <mesafe>      : Mesafe içindeki gök cisimleri", Colors.WHITE)
+        self.add_console_line("  tip: sun/star, planet, black_hole/bh, asteroid_belt/belt, all", Colors.WHITE)
+        self.add_console_line("")
+        
+        # KAYNAK ARAMA
+        self.add_console_line("res (resource)", Colors.YELLOW)
+        self.add_console_line("  --top (-t) <kaynak> [n] : En yüksek skorlu n kaynak yatağı", Colors.WHITE)
+        self.add_console_line("  --near (-n) <kaynak> [n]: Gemiye en yakın n kaynak yatağı", Colors.WHITE)
+        self.add_console_line("  --richness <seviye>    : poor/normal/rich filtresi", Colors.WHITE)
+        self.add_console_line("  Kaynak adı veya sembolü: Gold, Au, U, Fe ...", Colors.WHITE)
         self.add_console_line("")
         
         # MAP YÖNETİMİ
@@ -3017,11 +3232,13 @@ class SpaceGamePygame:
             self.add_console_line("")
             self.add_console_line("cat", Colors.YELLOW)
             self.add_console_line("  --save <name>          : Gök cismini kataloga kaydet", Colors.WHITE)
+            self.add_console_line("  --delete <name>        : Gök cismini katalogdan sil", Colors.WHITE)
             self.add_console_line("  --list                 : Katalogu listele", Colors.WHITE)
             self.add_console_line("  --all                  : Matrix'teki tüm gök cisimlerini kaydet", Colors.WHITE)
             self.add_console_line("")
             self.add_console_line("Örnekler:", Colors.CYAN)
             self.add_console_line("  cat --save planet_123", Colors.WHITE)
+            self.add_console_line("  cat --delete planet_123", Colors.WHITE)
             self.add_console_line("  cat --list", Colors.WHITE)
             self.add_console_line("  cat --all", Colors.WHITE)
             
@@ -3042,6 +3259,7 @@ class SpaceGamePygame:
             self.add_console_line("info (i)", Colors.YELLOW)
             self.add_console_line("  universe (u)           : Evren bilgilerini göster", Colors.WHITE)
             self.add_console_line("  objects (o)            : Matris gök cisimleri bilgilerini göster", Colors.WHITE)
+            self.add_console_line("  cache (c)              : Metin render önbelleği sayaçlarını göster", Colors.WHITE)
             self.add_console_line("")
             self.add_console_line("Örnekler:", Colors.CYAN)
             self.add_console_line("  info universe", Colors.WHITE)
@@ -3262,6 +3480,11 @@ class SpaceGamePygame:
             )
             with open(chunk_file, 'w', encoding='utf-8') as f:
                 json.dump(objects, f, indent=2)
+        StatsManifest.build(chunk_objects).save(universe_dir)
+        ResourceIndex.build(chunk_objects).save(universe_dir)
+        SpatialIndex.build(chunk_objects).save(universe_dir)
+        self.chunk_manager.forget_universe_files(name)
+        self.matrix_renderer.invalidate()  # Aynı isimle yeniden oluşturulan evrenin eski hücreleri çizilmesin
         
         self.add_console_line(f"Chunk-based evren oluşturuldu: {name}")
         self.add_console_line(f"Toplam {total_objects} gök cismi, {len(chunk_objects)} chunk")
@@ -3313,7 +3536,7 @@ class SpaceGamePygame:
         if self.ship:
             self.ship.is_moving = True
             self.ship.start_time = datetime.now()
-            self.last_position_update = datetime.now()
+            self.sim_accumulator = 0.0
             self.engine_on = True
             # Yön hattını hesapla
             self.calculate_direction_indicator()
@@ -3382,6 +3605,86 @@ class SpaceGamePygame:
             else:  # RIGHT
                 self.ship.direction = Direction.LEFT
     
+    def handle_event(self, event):
+        """Tek bir pygame event'ini işle"""
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.ACTIVEEVENT):
+            # Pencere yeniden görünür oldu - tüm ekranı yeniden çiz
+            self.clear_screen()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
+                # Enter tuşu - komut işle
+                if self.current_command.strip():
+                    self.process_command(self.current_command.strip())
+                self.current_command = ""
+            elif event.key == pygame.K_BACKSPACE:
+                # Backspace - karakter sil
+                if self.current_command:
+                    self.current_command = self.current_command[:-1]
+            elif event.key == pygame.K_ESCAPE:
+                # Escape - komutu temizle
+                self.current_command = ""
+            elif event.key == pygame.K_DOWN:
+                # Aşağı ok tuşu - konsol scroll
+                max_scroll = max(0, len(self.console_lines) - self.max_console_lines)
+                if self.console_scroll < max_scroll:
+                    self.console_scroll += 1
+                    self.mark_dirty("console")
+            elif event.key == pygame.K_UP:
+                # Yukarı ok tuşu - konsol scroll
+                if self.console_scroll > 0:
+                    self.console_scroll -= 1
+                    self.mark_dirty("console")
+            elif event.unicode and event.unicode.isprintable():
+                # Sadece yazdırılabilir karakterleri ekle
+                self.current_command += event.unicode
+    
+    def get_idle_timeout(self) -> float:
+        """Bir sonraki zamanlanmış işe kadar kalan süre (saniye) - 0 ise hemen çalış"""
+        if self.dirty_panels:
+            return 0.0
+        
+        # Komut satırı cursor'u her 0.5 saniyede bir yanıp söner
+        now = time.time()
+        deadlines = [0.5 - (now % 0.5)]
+        
+        # Arka planda okunan chunk'lar geldikçe matris canlı veriye geçer
+        if self.viewport_preview is not None:
+            deadlines.append(0.01)
+        
+        if self.ship and self.mission_started:
+            # Dashboard'daki görev saati her tam saniyede değişir
+            if self.ship.mission_start_time:
+                elapsed = (datetime.now() - self.ship.mission_start_time).total_seconds()
+                deadlines.append((1.0 - (elapsed % 1.0)) / self.time_warp)
+            
+            # Koordinat (motor kapalı) ve alarm yanıp sönmesinin bir sonraki fazı
+            if not self.engine_on or self.radar_alarm:
+                interval = self.blink_interval_ms
+                deadlines.append((interval - pygame.time.get_ticks() % interval) / 1000)
+            
+            # Geminin bir sonraki adımı
+            if self.ship.is_moving:
+                effective_speed = self.ship.speed / self.speed_factor
+                pending = self.sim_accumulator + (time.monotonic() - self.last_sim_time) * self.time_warp
+                deadlines.append((effective_speed - pending) / self.time_warp)
+        
+        return max(0.0, min(deadlines))
+    
+    def wait_for_events(self):
+        """Event'leri topla - animasyon yoksa girdi veya son tarihe kadar CPU harcamadan bekle"""
+        timeout = self.get_idle_timeout()
+        if timeout * 1000 <= 1000 / self.max_fps:
+            return pygame.event.get()
+        
+        # pygame.event.wait zaman aşımında NOEVENT döner
+        event = pygame.event.wait(int(timeout * 1000) + 1)
+        events = pygame.event.get()
+        if event.type != pygame.NOEVENT:
+            events.insert(0, event)
+        return events
+    
     def run(self):
         """Ana oyun döngüsü"""
         # Console initialization
@@ -3390,6 +3693,9 @@ class SpaceGamePygame:
             self.max_console_lines = 50
             self.console_scroll = 0
         
+        if not hasattr(self, 'console_wrap_width'):
+            self.console_wrap_width = 0  # İlk çizimde yeniden wrap edilir
+        
         # UI layout initialization
         if not hasattr(self, 'left_width'):
             self.left_width = int(self.screen_width * 0.3)
@@ -3414,6 +3720,9 @@ class SpaceGamePygame:
         if not hasattr(self, 'matrix_objects'):
             self.matrix_objects = []
         
+        if not hasattr(self, 'matrix_objects_by_name'):
+            self.matrix_objects_by_name = (None, {})
+        
         if not hasattr(self, 'matrix_width'):
             self.matrix_width = self.center_width
         
@@ -3454,6 +3763,10 @@ class SpaceGamePygame:
         if not hasattr(self, 'direction_line_passed'):
             self.direction_line_passed = False
         
+        if not hasattr(self, 'direction_overlay_key'):
+            self.direction_overlay = None
+            self.direction_overlay_key = None
+        
         # Engine and movement initialization
         if not hasattr(self, 'engine_on'):
             self.engine_on = False
@@ -3462,16 +3775,33 @@ class SpaceGamePygame:
         if not hasattr(self, 'radar_alarm'):
             self.radar_alarm = False
         
-        if not hasattr(self, 'alarm_blink_timer'):
-            self.alarm_blink_timer = 0
+        if not hasattr(self, 'blink_interval_ms'):
+            self.blink_interval_ms = 250
         
-        if not hasattr(self, 'coord_blink_timer'):
-            self.coord_blink_timer = 0
+        # Dirty-rect render initialization
+        if not hasattr(self, 'dirty_panels'):
+            self.dirty_panels = set(self.PANELS)
+            self.panel_signatures = {}
+        
+        if not hasattr(self, 'max_fps'):
+            self.max_fps = 60
+        
+        if not hasattr(self, 'catalog_store'):
+            self.catalog_store = None
+        
+        if not hasattr(self, 'map_index'):
+            self.map_index = None
         
         # Grid system initialization
         if not hasattr(self, 'grid_enabled'):
             self.grid_enabled = False
         
+        if not hasattr(self, 'grid_layer_key'):
+            self.grid_layer = None
+            self.grid_layer_key = None
+            self.label_layer = None
+            self.label_layer_key = None
+        
         # Movement calculation initialization
         if not hasattr(self, 'points_per_minute'):
             self.points_per_minute = 10
@@ -3485,6 +3815,20 @@ class SpaceGamePygame:
         if not hasattr(self, 'speed_factor'):
             self.speed_factor = 1.0
         
+        if not hasattr(self, 'time_warp'):
+            self.time_warp = 1.0
+            self.max_sim_steps_per_frame = 5000
+            self.sim_accumulator = 0.0
+            self.last_sim_time = time.monotonic()
+        
+        if not hasattr(self, 'find_results'):
+            self.find_results = None
+            self.find_result_count = 0
+            self.find_page_size = 20
+        
+        if not hasattr(self, 'viewport_preview'):
+            self.viewport_preview = None
+        
         # Command output initialization
         if not hasattr(self, 'command_output_lines'):
             self.command_output_lines = []
@@ -3502,70 +3846,30 @@ class SpaceGamePygame:
         
         # Ana oyun döngüsü
         while self.running:
-            # Event handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
-                        # Enter tuşu - komut işle
-                        if self.current_command.strip():
-                            self.process_command(self.current_command.strip())
-                        self.current_command = ""
-                    elif event.key == pygame.K_BACKSPACE:
-                        # Backspace - karakter sil
-                        if self.current_command:
-                            self.current_command = self.current_command[:-1]
-                    elif event.key == pygame.K_ESCAPE:
-                        # Escape - komutu temizle
-                        self.current_command = ""
-                    elif event.key == pygame.K_DOWN:
-                        # Aşağı ok tuşu - konsol scroll
-                        max_scroll = max(0, len(self.console_lines) - self.max_console_lines)
-                        if self.console_scroll < max_scroll:
-                            self.console_scroll += 1
-                    elif event.key == pygame.K_UP:
-                        # Yukarı ok tuşu - konsol scroll
-                        if self.console_scroll > 0:
-                            self.console_scroll -= 1
-                    elif event.unicode and event.unicode.isprintable():
-                        # Sadece yazdırılabilir karakterleri ekle
-                        self.current_command += event.unicode
+            # Event handling - yapılacak iş yoksa bir sonraki son tarihe kadar bloklanır
+            for event in self.wait_for_events():
+                self.handle_event(event)
             
             # Gemi pozisyonunu güncelle
             self.update_ship_position()
             
-            # Ekranı temizle
-            self.clear_screen()
+            # Arka planda okunan chunk'ları önizlemeden canlı veriye geçir
+            self.update_viewport_preview()
             
-            # UI elemanlarını çiz - Yeni tasarım
-            self.print_console()            # Sol %25 - Konsol (wrap ile)
-            self.print_matrix_display()     # Orta %50 - Grid
-            self.print_dashboard_panel()    # Sağ üst - Dashboard
-            self.print_probe_panel()        # Sağ alt - Catalogs
-            self.print_command_line()       # Alt - Komut satırı
-            
-            # Mevcut komutu göster (prompt'un yanında) - Sabit konum
-            if self.current_command:
-                y_pos = self.screen_height - 35  # Sabit konum
-                # Prompt genişliğini hesapla
-                if self.ship and self.mission_started:
-                    universe_name = getattr(self, 'current_universe_name', 'unknown')
-                    direction_text = self.ship.direction.value.upper()
-                    status_text = "HAREKET HALİNDE" if self.ship.is_moving else "DURAK"
-                    prompt_text = f"{universe_name}@{direction_text}-{status_text}:$ "
-                else:
-                    prompt_text = "orbit@başlatma:$ "
-                
-                prompt_surface = self.font_medium.render(prompt_text, True, Colors.GREEN)
-                command_x = 10 + prompt_surface.get_width()
-                
-                command_surface = self.font_medium.render(self.current_command, True, Colors.WHITE)
-                self.screen.blit(command_surface, (command_x, y_pos))
+            # Sadece değişen panelleri çiz ve ekrana gönder
+            self.render_dirty_panels()
             
-            # Ekranı güncelle
-            pygame.display.flip()
-            self.clock.tick(60)  # 60 FPS
+            self.clock.tick(self.max_fps)  # Animasyon varken frame cap
+        
+        # Katalog journal'ını snapshot'a katla
+        if self.catalog_store is not None and self.catalog_store.journal_length:
+            try:
+                self.catalog_store.compact()
+            except OSError as e:
+                print(f"Error saving catalog: {e}")
+        
+        # Arka plan chunk okuyucusunu durdur - sıradaki okumalar iptal edilir
+        self.chunk_manager.close()
         
         pygame.quit()
         sys.exit()
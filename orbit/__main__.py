@@ -7,34 +7,100 @@ Kullanım:
     python -m orbit
     veya
     orbit
+
+Pencere açmadan evren üretimi (çok makineli / batch işler için):
+    python -m orbit generate --name <isim> --size <boyut> [--preset normal] [--seed <n>]
+                             [--shard i/N] [--output <klasör>]
+    python -m orbit merge --name <isim> [--output <klasör>] [<shard_klasörü> ...]
 """
 
 import sys
 import os
+import glob
+import argparse
 from pathlib import Path
 
-def main():
-    """Ana giriş noktası"""
+def setup_path():
+    """Orbit paketinin yolunu Python path'e ekle"""
+    orbit_package_path = Path(__file__).parent
+    orbit_root = orbit_package_path.parent
+
+    if str(orbit_root) not in sys.path:
+        sys.path.insert(0, str(orbit_root))
+
+def shard_dir(name, shard_index, shard_count):
+    """Varsayılan shard çıktı klasörü"""
+    return f"universes/{name}.shard-{shard_index}-of-{shard_count}"
+
+def generate_command(args):
+    """Evreni (veya bir shard'ını) pencere açmadan üret"""
+    from orbit.modules import UniverseGenerator, parse_shard
+
+    if args.size < 100:
+        print("❌ HATA: Evren boyutu en az 100 olmalı!")
+        return 1
+
+    generator = UniverseGenerator(args.size, args.size, args.preset, args.seed, log=print)
+
+    if args.shard:
+        try:
+            shard_index, shard_count = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"❌ HATA: {e}")
+            return 1
+
+        output_dir = args.output or shard_dir(args.name, shard_index, shard_count)
+        generator.write_shard(args.name, shard_index, shard_count, output_dir)
+        print(f"Shard {shard_index}/{shard_count} oluşturuldu: {output_dir}")
+    else:
+        output_dir = args.output or f"universes/{args.name}"
+        result = generator.write_universe(args.name, output_dir)
+        print(f"Evren oluşturuldu: {output_dir} ({len(result['chunk_objects'])} chunk)")
+
+    print(f"Seed: {generator.seed}")
+    return 0
+
+def merge_command(args):
+    """Shard klasörlerini doğrula ve tek bir evrende birleştir"""
+    from orbit.modules import UniverseGenerator
+
+    shard_dirs = args.shards or sorted(glob.glob(f"universes/{args.name}.shard-*-of-*"))
+    if not shard_dirs:
+        print(f"❌ HATA: '{args.name}' için shard klasörü bulunamadı!")
+        return 1
+
+    output_dir = args.output or f"universes/{args.name}"
+    if os.path.exists(os.path.join(output_dir, "metadata.json")):
+        print(f"❌ HATA: {output_dir} zaten bir evren içeriyor!")
+        return 1
+
+    try:
+        merged = UniverseGenerator.merge_shards(shard_dirs, output_dir)
+    except (ValueError, OSError) as e:
+        print(f"❌ HATA: Shard'lar birleştirilemedi: {e}")
+        return 1
+
+    metadata = merged["metadata"]
+    print(f"Evren birleştirildi: {output_dir}")
+    print(f"Shard sayısı: {metadata['shards']}, chunk sayısı: {len(merged['chunk_objects'])}")
+    for key, value in metadata["statistics"].items():
+        print(f"  {key}: {value}")
+    return 0
+
+def run_game():
+    """Oyunu başlat"""
     try:
-        # Orbit paketinin yolunu bul
-        orbit_package_path = Path(__file__).parent
-        orbit_root = orbit_package_path.parent
-        
-        # Python path'e ekle
-        if str(orbit_root) not in sys.path:
-            sys.path.insert(0, str(orbit_root))
-        
         # Ana oyun dosyasını import et ve çalıştır
         from orbit import SpaceGamePygame
-        
+
         print("🚀 ORBIT - Uzay Keşif Simülasyonu")
         print("by Altay Kireççi")
         print("")
-        
+
         # Oyunu başlat
         game = SpaceGamePygame()
         game.run()
-        
+
     except ImportError as e:
         print(f"❌ HATA: Gerekli modüller yüklenemedi: {e}")
         print("Lütfen 'pip install -r requirements.txt' komutunu çalıştırın.")
@@ -43,5 +109,38 @@ def main():
         print(f"❌ HATA: Oyun başlatılamadı: {e}")
         sys.exit(1)
 
+def main():
+    """Ana giriş noktası"""
+    setup_path()
+
+    if len(sys.argv) < 2:
+        run_game()
+        return
+
+    parser = argparse.ArgumentParser(prog="orbit", description="ORBIT - Uzay Keşif Simülasyonu")
+    subparsers = parser.add_subparsers(dest="command")
+
+    generate_parser = subparsers.add_parser("generate", help="Evren üret (pencere açmadan)")
+    generate_parser.add_argument("--name", "-n", required=True, help="Evren adı")
+    generate_parser.add_argument("--size", type=int, required=True, help="Evren boyutu")
+    generate_parser.add_argument("--preset", default="normal", choices=["sparse", "normal", "dense", "empty"])
+    generate_parser.add_argument("--seed", type=int, default=None, help="Tekrarlanabilir üretim için seed")
+    generate_parser.add_argument("--shard", help="Sadece i/N shard'ını üret (örn: 0/4)")
+    generate_parser.add_argument("--output", "-o", help="Çıktı klasörü")
+
+    merge_parser = subparsers.add_parser("merge", help="Shard'ları tek evrende birleştir")
+    merge_parser.add_argument("--name", "-n", required=True, help="Evren adı")
+    merge_parser.add_argument("--output", "-o", help="Çıktı klasörü (varsayılan: universes/<isim>)")
+    merge_parser.add_argument("shards", nargs="*", help="Shard klasörleri")
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        sys.exit(generate_command(args))
+    elif args.command == "merge":
+        sys.exit(merge_command(args))
+    else:
+        parser.print_help()
+
 if __name__ == "__main__":
     main()
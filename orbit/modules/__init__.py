@@ -12,11 +12,26 @@ from .ship import Ship
 from .chunk_manager import ChunkManager
 from .universe_constants import UniverseConstants
 from .locale_manager import LocaleManager
+from .universe_generator import UniverseGenerator, parse_shard
+from .text_cache import TextCache
+from .matrix_renderer import MatrixRenderer
+from .occupancy import OccupancyRaster
+from .catalog_store import CatalogStore
+from .universe_stats import summarize_objects, add_summary, empty_summary, StatsManifest
+from .resource_index import ResourceIndex
+from .spatial_index import SpatialIndex
+from .query import Query
+from .map_index import MapIndex
+from .map_snapshot import MapSnapshot
 
 __all__ = [
     'Colors',
     'Direction', 'CelestialType', 'StarType', 'BlackHoleClass',
     'PlanetType', 'ResourceType', 'ResourceRichness',
     'CelestialObject', 'Star', 'BlackHole', 'Planet', 'AsteroidBelt',
-    'Ship', 'ChunkManager', 'UniverseConstants', 'LocaleManager'
+    'Ship', 'ChunkManager', 'UniverseConstants', 'LocaleManager',
+    'UniverseGenerator', 'parse_shard', 'TextCache',
+    'MatrixRenderer', 'OccupancyRaster', 'CatalogStore',
+    'summarize_objects', 'add_summary', 'empty_summary', 'StatsManifest',
+    'ResourceIndex', 'SpatialIndex', 'Query', 'MapIndex', 'MapSnapshot'
 ]
@@ -0,0 +1,61 @@
+class CatalogIndex:
+    """Hash indexes over catalog entries, maintained on every insert and delete.
+
+    Entries are referred to by the sequence number the store gave them. Besides
+    name -> entries, entries are indexed by type, prop, resource key and
+    resource richness (overall and per resource), so lookups and the catalog
+    statistics are dictionary reads instead of scans of the whole catalog.
+    """
+
+    def __init__(self):
+        self.by_name = {}
+        self.by_type = {}
+        self.by_prop = {}
+        self.by_resource = {}
+        self.by_richness = {}
+        self.by_resource_richness = {}
+
+    @staticmethod
+    def keys(entry):
+        """(index, key) pairs an entry is filed under"""
+        yield 'by_type', entry.get('type') or 'unknown'
+        yield 'by_prop', entry.get('prop') or 'unknown'
+        for resource, data in (entry.get('resources') or {}).items():
+            yield 'by_resource', resource
+            if isinstance(data, dict) and data.get('richness'):
+                yield 'by_richness', data['richness']
+                yield 'by_resource_richness', (resource, data['richness'])
+
+    def add(self, seq, entry):
+        self.by_name.setdefault(entry.get('name'), {})[seq] = entry
+        for index, key in self.keys(entry):
+            getattr(self, index).setdefault(key, set()).add(seq)
+
+    def remove(self, seq, entry):
+        self._discard(self.by_name, entry.get('name'), seq)
+        for index, key in self.keys(entry):
+            self._discard(getattr(self, index), key, seq)
+
+    @staticmethod
+    def _discard(index, key, seq):
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        if isinstance(bucket, dict):
+            bucket.pop(seq, None)
+        else:
+            bucket.discard(seq)
+        if not bucket:
+            del index[key]
+
+    def clear(self):
+        self.__init__()
+
+    def get(self, name):
+        """First entry saved under name, or None"""
+        bucket = self.by_name.get(name)
+        return next(iter(bucket.values())) if bucket else None
+
+    def counts(self, index):
+        """{key: number of entries} for one of the secondary indexes"""
+        return {key: len(seqs) for key, seqs in getattr(self, index).items()}
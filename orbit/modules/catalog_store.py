@@ -0,0 +1,153 @@
+import os
+import json
+
+from .catalog_index import CatalogIndex
+
+
+class CatalogStore:
+    """Session catalog kept in memory, persisted as snapshot + append-only journal.
+
+    cats.json is the snapshot (the same JSON list older versions wrote) and
+    cats.journal.jsonl holds one {"op": ..., ...} record per change made since.
+    Adding an entry appends one line instead of rewriting the whole catalog;
+    the journal is folded into the snapshot once it grows as long as the
+    catalog itself, which keeps the amortised cost of a save constant.
+    Entries are held by sequence number and indexed (CatalogIndex) as they
+    are added and removed.
+    """
+
+    SNAPSHOT_FILE = "cats.json"
+    JOURNAL_FILE = "cats.journal.jsonl"
+
+    def __init__(self, directory, compact_every=1000):
+        self.directory = directory
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_FILE)
+        self.journal_path = os.path.join(directory, self.JOURNAL_FILE)
+        self.compact_every = compact_every
+        self.records = {}  # seq -> entry, in insertion order
+        self.next_seq = 0
+        self.index = CatalogIndex()
+        self.journal_length = 0
+        self._entries = None
+
+    @property
+    def entries(self):
+        """Entries in insertion order (the list is rebuilt only after a change)"""
+        if self._entries is None:
+            self._entries = list(self.records.values())
+        return self._entries
+
+    def _insert(self, entry):
+        seq = self.next_seq
+        self.next_seq += 1
+        self.records[seq] = entry
+        self.index.add(seq, entry)
+        self._entries = None
+
+    def _delete(self, name):
+        bucket = self.index.by_name.get(name)
+        if not bucket:
+            return 0
+        removed = list(bucket.items())
+        for seq, entry in removed:
+            self.index.remove(seq, entry)
+            del self.records[seq]
+        self._entries = None
+        return len(removed)
+
+    def _reset(self, entries=()):
+        self.records = {}
+        self.next_seq = 0
+        self.index.clear()
+        self._entries = None
+        for entry in entries:
+            self._insert(entry)
+
+    def load(self):
+        """Read the snapshot and replay the journal on top of it"""
+        self._reset()
+        self.journal_length = 0
+
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                self._reset(json.load(f))
+
+        if os.path.exists(self.journal_path):
+            complete = 0  # Bytes up to the end of the last complete line
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Interrupted write - the last line is incomplete
+                        break
+                    complete += len(line)
+                    try:
+                        record = json.loads(line.decode('utf-8'))
+                    except ValueError:
+                        continue
+                    self._apply(record)
+                    self.journal_length += 1
+            if os.path.getsize(self.journal_path) > complete:
+                # Drop the partial line so the next append starts on a line of its own
+                with open(self.journal_path, 'r+b') as f:
+                    f.truncate(complete)
+        return self
+
+    def _apply(self, record):
+        if record.get("op") == "add":
+            self._insert(record["entry"])
+        elif record.get("op") == "delete":
+            self._delete(record.get("name"))
+
+    def _append_journal(self, records):
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.journal_length += len(records)
+        if self.journal_length >= max(self.compact_every, len(self.records)):
+            self.compact()
+
+    def add(self, entry):
+        """Add one entry"""
+        self.extend([entry])
+
+    def extend(self, entries):
+        """Add several entries with a single journal write"""
+        if not entries:
+            return
+        for entry in entries:
+            self._insert(entry)
+        self._append_journal([{"op": "add", "entry": entry} for entry in entries])
+
+    def remove(self, name):
+        """Delete entries by name; returns the number removed"""
+        removed = self._delete(name)
+        if removed:
+            self._append_journal([{"op": "delete", "name": name}])
+        return removed
+
+    def replace(self, entries):
+        """Replace the whole catalog and write it as the new snapshot"""
+        self._reset(list(entries))
+        self.compact()
+
+    def compact(self):
+        """Write the in-memory catalog as the snapshot and truncate the journal"""
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.snapshot_path)
+
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.journal_length = 0
+
+    def get(self, name):
+        """Entry saved under name, or None - one hash lookup"""
+        return self.index.get(name)
+
+    def __contains__(self, name):
+        return name in self.index.by_name
+
+    def __len__(self):
+        return len(self.records)
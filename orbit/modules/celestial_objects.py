@@ -7,6 +7,11 @@ class CelestialObject:
         self.y = y
         self.obj_type = obj_type
         self.name = name or f"{obj_type.value}_{random.randint(1, 1000)}"
+    
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Create from a chunk file record"""
+        return cls(data['x'], data['y'], CelestialType(data['type']), data.get('name', ''))
 
 # Star class
 class Star:
@@ -28,7 +33,7 @@ class BlackHole:
         self.bh_id = bh_id
         
         # Influence radius and exclusion radius
-        self.R_infl = {"stellar": 400, "intermediate": 2500, "super": 10000}[bh_class.value]
+        self.R_infl = {"stellar": 400, "intermediate": 2500, "supermassive": 10000}[bh_class.value]
         self.R_excl = 1.5 * self.R_infl
 
 # Planet class
@@ -47,11 +52,12 @@ class Planet:
 
 # Asteroid belt class
 class AsteroidBelt:
-    def __init__(self, star_id: int, center_radius: float, width: float, belt_id: int):
+    def __init__(self, star_id: int, center_radius: float, width: float, belt_id: int,
+                 fragment_count: int = None):
         self.star_id = star_id
         self.center_radius = center_radius
         self.width = width
         self.belt_id = belt_id
         self.radius = width / 2  # Belt radius as half of width
-        self.fragment_count = random.randint(20, 200)
+        self.fragment_count = fragment_count if fragment_count is not None else random.randint(20, 200)
         self.resource_pool = {}
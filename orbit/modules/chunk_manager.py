@@ -1,5 +1,13 @@
 import os
+import sys
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .occupancy import OccupancyRaster
+from .universe_stats import summarize_objects, add_summary, empty_summary, StatsManifest
+from .resource_index import ResourceIndex
+from .spatial_index import SpatialIndex
 
 class ChunkManager:
     def __init__(self, universe_size, chunk_size=100):
@@ -8,6 +16,18 @@ class ChunkManager:
         self.chunks = {}  # Loaded chunks
         self.loaded_chunks = set()
         self.max_loaded_chunks = 25  # Maximum 5x5 area (500x500)
+        self.rasters = {}  # Per chunk occupancy rasters of extended bodies
+        self.max_object_reach = 150  # Farthest cell an object can cover from its (x, y)
+        self.chunk_summaries = {}  # Per chunk object counts, built when the chunk loads
+        self.loaded_summary = empty_summary()  # Sum of chunk_summaries, kept incrementally
+        self.stats_manifests = {}  # universe name -> StatsManifest (stats.json)
+        self.resource_indexes = {}  # universe name -> ResourceIndex (resources.json)
+        self.spatial_indexes = {}  # universe name -> SpatialIndex (spatial.json)
+        self.metadata = {}  # universe name -> metadata.json
+        self.prefetched = {}  # (universe name, chunk) -> objects read by the background loader
+        self.prefetch_pending = set()  # (universe name, chunk) keys still being read
+        self.prefetch_lock = threading.Lock()
+        self.prefetch_executor = None  # Created on the first prefetch
     
     def get_chunk_coords(self, x, y):
         """Convert coordinates to chunk coordinates"""
@@ -22,34 +42,252 @@ class ChunkManager:
         if (chunk_x, chunk_y) in self.loaded_chunks:
             return self.chunks.get((chunk_x, chunk_y), [])
         
+        # Already read by the background loader - no disk access
+        with self.prefetch_lock:
+            chunk_data = self.prefetched.pop((universe_name, (chunk_x, chunk_y)), None)
+        if chunk_data is not None:
+            return self._install_chunk(chunk_x, chunk_y, chunk_data)
+        
         chunk_file = self.get_chunk_file_path(chunk_x, chunk_y, universe_name)
         if os.path.exists(chunk_file):
             try:
                 with open(chunk_file, 'r', encoding='utf-8') as f:
                     chunk_data = json.load(f)
-                self.chunks[(chunk_x, chunk_y)] = chunk_data
-                self.loaded_chunks.add((chunk_x, chunk_y))
-                return chunk_data
+                return self._install_chunk(chunk_x, chunk_y, chunk_data)
             except Exception as e:
                 print(f"Error loading chunk: {e}")
                 return []
         return []
     
+    def _install_chunk(self, chunk_x, chunk_y, chunk_data):
+        self.chunks[(chunk_x, chunk_y)] = chunk_data
+        self.loaded_chunks.add((chunk_x, chunk_y))
+        summary = summarize_objects(chunk_data)
+        self.chunk_summaries[(chunk_x, chunk_y)] = summary
+        add_summary(self.loaded_summary, summary)
+        return chunk_data
+    
+    def prefetch(self, chunk_coords, universe_name):
+        """Read chunk files on a background thread; load_chunk picks the results up without disk access"""
+        with self.prefetch_lock:
+            keys = [(universe_name, coord) for coord in chunk_coords
+                    if coord not in self.loaded_chunks
+                    and (universe_name, coord) not in self.prefetched
+                    and (universe_name, coord) not in self.prefetch_pending]
+            self.prefetch_pending.update(keys)
+        if not keys:
+            return
+        if self.prefetch_executor is None:
+            self.prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chunk-prefetch")
+        for key in keys:
+            self.prefetch_executor.submit(self._prefetch_chunk, key)
+    
+    def _prefetch_chunk(self, key):
+        universe_name, (chunk_x, chunk_y) = key
+        chunk_file = self.get_chunk_file_path(chunk_x, chunk_y, universe_name)
+        chunk_data = []  # Missing or unreadable chunks load as empty
+        try:
+            if os.path.exists(chunk_file):
+                with open(chunk_file, 'r', encoding='utf-8') as f:
+                    chunk_data = json.load(f)
+        except Exception as e:
+            print(f"Error prefetching chunk: {e}")
+        with self.prefetch_lock:
+            if key in self.prefetch_pending:
+                self.prefetch_pending.discard(key)
+                self.prefetched[key] = chunk_data
+    
+    def prefetch_area(self, min_x, min_y, max_x, max_y, universe_name):
+        """Prefetch every chunk the rasters of an area need; returns the area's chunks"""
+        area_chunks = [(chunk_x, chunk_y)
+                       for chunk_x in range(min_x // self.chunk_size, max_x // self.chunk_size + 1)
+                       for chunk_y in range(min_y // self.chunk_size, max_y // self.chunk_size + 1)]
+        needed = []
+        for chunk_x, chunk_y in area_chunks:
+            if (chunk_x, chunk_y) not in self.rasters:
+                needed.extend(self.raster_chunks(chunk_x, chunk_y))
+        self.prefetch(dict.fromkeys(needed), universe_name)
+        return area_chunks
+    
+    def close(self):
+        """Stop the background loader - queued reads are cancelled, a read in progress is dropped"""
+        executor, self.prefetch_executor = self.prefetch_executor, None
+        if executor is None:
+            return
+        with self.prefetch_lock:
+            self.prefetch_pending.clear()
+        if sys.version_info >= (3, 9):
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            executor.shutdown(wait=False)
+    
+    def is_chunk_ready(self, chunk_x, chunk_y, universe_name):
+        """True if load_chunk can return the chunk without reading the disk"""
+        if (chunk_x, chunk_y) in self.loaded_chunks:
+            return True
+        with self.prefetch_lock:
+            return (universe_name, (chunk_x, chunk_y)) in self.prefetched
+    
+    def is_raster_ready(self, chunk_x, chunk_y, universe_name):
+        """True if get_raster can build the chunk's raster without reading the disk"""
+        if (chunk_x, chunk_y) in self.rasters:
+            return True
+        return all(self.is_chunk_ready(neighbour_x, neighbour_y, universe_name)
+                   for neighbour_x, neighbour_y in self.raster_chunks(chunk_x, chunk_y))
+    
+    def raster_chunks(self, chunk_x, chunk_y):
+        """Chunks whose objects can reach into a chunk's raster"""
+        reach = -(-self.max_object_reach // self.chunk_size)
+        return [(neighbour_x, neighbour_y)
+                for neighbour_x in range(chunk_x - reach, chunk_x + reach + 1)
+                for neighbour_y in range(chunk_y - reach, chunk_y + reach + 1)]
+    
+    def read_chunk(self, chunk_x, chunk_y, universe_name):
+        """Objects of a chunk without caching it (the cached copy if it is loaded)"""
+        if (chunk_x, chunk_y) in self.loaded_chunks:
+            return self.chunks.get((chunk_x, chunk_y), [])
+        chunk_file = self.get_chunk_file_path(chunk_x, chunk_y, universe_name)
+        if not os.path.exists(chunk_file):
+            return []
+        with open(chunk_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def iter_chunk_files(self, universe_name):
+        """(chunk_x, chunk_y, objects) of every chunk file of a universe, read straight from disk"""
+        universe_dir = f"universes/{universe_name}"
+        if not os.path.isdir(universe_dir):
+            return
+        for file_name in sorted(os.listdir(universe_dir)):
+            if not (file_name.startswith("chunk_") and file_name.endswith(".json")):
+                continue
+            chunk_x, chunk_y = file_name[len("chunk_"):-len(".json")].split("_")
+            with open(os.path.join(universe_dir, file_name), 'r', encoding='utf-8') as f:
+                yield int(chunk_x), int(chunk_y), json.load(f)
+    
+    def _get_universe_file(self, cache, file_class, universe_name):
+        """Per-universe file (stats, resource index) - read once; built from the chunk files if it is missing"""
+        data = cache.get(universe_name)
+        if data is not None:
+            return data
+        
+        universe_dir = f"universes/{universe_name}"
+        data = file_class.load(universe_dir)
+        if data is None:
+            # Universe generated before the file existed - build once and keep the result
+            data = file_class()
+            for chunk_x, chunk_y, objects in self.iter_chunk_files(universe_name):
+                data.update_chunk(chunk_x, chunk_y, objects)
+            if os.path.isdir(universe_dir):
+                data.save(universe_dir)
+        
+        cache[universe_name] = data
+        return data
+    
+    def forget_universe_files(self, universe_name):
+        """Drop cached per-universe files (after the universe is regenerated)
+        
+        Chunks, rasters and summaries are keyed by coordinates alone, so they
+        are dropped whichever universe was rewritten.
+        """
+        for cache in (self.stats_manifests, self.resource_indexes, self.spatial_indexes, self.metadata):
+            cache.pop(universe_name, None)
+        self.clear()
+    
+    def get_metadata(self, universe_name):
+        """metadata.json of a chunk-based universe ({} if it has none)"""
+        if universe_name not in self.metadata:
+            metadata_file = f"universes/{universe_name}/metadata.json"
+            metadata = {}
+            if os.path.exists(metadata_file):
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+            self.metadata[universe_name] = metadata
+        return self.metadata[universe_name]
+    
+    def get_stats(self, universe_name):
+        """Stats manifest of a universe"""
+        return self._get_universe_file(self.stats_manifests, StatsManifest, universe_name)
+    
+    def get_resource_index(self, universe_name):
+        """Inverted resource index of a universe"""
+        return self._get_universe_file(self.resource_indexes, ResourceIndex, universe_name)
+    
+    def get_spatial_index(self, universe_name):
+        """KD-tree index of every object's coordinates in a universe"""
+        return self._get_universe_file(self.spatial_indexes, SpatialIndex, universe_name)
+    
+    def get_object_record(self, point, universe_name):
+        """Full chunk record of a spatial index point (loads only that point's chunk)"""
+        for obj in self.load_chunk(point["chunk"][0], point["chunk"][1], universe_name):
+            if obj.get('name') == point["name"]:
+                return obj
+        return None
+    
+    def save_chunk(self, chunk_x, chunk_y, objects, universe_name):
+        """Rewrite a chunk file and keep the caches, summaries and per-universe indexes in step"""
+        with open(self.get_chunk_file_path(chunk_x, chunk_y, universe_name), 'w', encoding='utf-8') as f:
+            json.dump(objects, f, indent=2, ensure_ascii=False)
+        
+        coord = (chunk_x, chunk_y)
+        with self.prefetch_lock:
+            # A copy read before this write is stale
+            self.prefetched.pop((universe_name, coord), None)
+            self.prefetch_pending.discard((universe_name, coord))
+        if coord in self.loaded_chunks:
+            add_summary(self.loaded_summary, self.chunk_summaries[coord], -1)
+            self.chunks[coord] = objects
+            self.chunk_summaries[coord] = summarize_objects(objects)
+            add_summary(self.loaded_summary, self.chunk_summaries[coord])
+        
+        # Extended bodies of this chunk may cover cells of its neighbours
+        reach = -(-self.max_object_reach // self.chunk_size)
+        for raster_coord in list(self.rasters):
+            if max(abs(raster_coord[0] - chunk_x), abs(raster_coord[1] - chunk_y)) <= reach:
+                del self.rasters[raster_coord]
+        
+        for universe_file in (self.get_stats(universe_name), self.get_resource_index(universe_name),
+                              self.get_spatial_index(universe_name)):
+            universe_file.update_chunk(chunk_x, chunk_y, objects)
+            universe_file.save(f"universes/{universe_name}")
+    
     def unload_distant_chunks(self, ship_x, ship_y, max_distance=2):
-        """Unload distant chunks from memory"""
+        """Unload distant chunks from memory
+        
+        Rasters are kept within max_distance chunks of the ship; chunk data (and
+        prefetched chunks) one raster reach further, since building those
+        rasters reads the neighbouring chunks.
+        """
         ship_chunk = self.get_chunk_coords(ship_x, ship_y)
-        chunks_to_remove = []
+        reach = -(-self.max_object_reach // self.chunk_size)
         
-        for chunk_coord in self.loaded_chunks:
-            distance = max(abs(chunk_coord[0] - ship_chunk[0]), 
-                          abs(chunk_coord[1] - ship_chunk[1]))
-            if distance > max_distance:
-                chunks_to_remove.append(chunk_coord)
+        def distance(chunk_coord):
+            return max(abs(chunk_coord[0] - ship_chunk[0]), abs(chunk_coord[1] - ship_chunk[1]))
         
-        for chunk_coord in chunks_to_remove:
-            if chunk_coord in self.chunks:
-                del self.chunks[chunk_coord]
-            self.loaded_chunks.remove(chunk_coord)
+        for chunk_coord in [coord for coord in self.rasters if distance(coord) > max_distance]:
+            del self.rasters[chunk_coord]
+        
+        for chunk_coord in [coord for coord in self.loaded_chunks if distance(coord) > max_distance + reach]:
+            self.chunks.pop(chunk_coord, None)
+            self.loaded_chunks.discard(chunk_coord)
+            summary = self.chunk_summaries.pop(chunk_coord, None)
+            if summary is not None:
+                add_summary(self.loaded_summary, summary, -1)
+        
+        with self.prefetch_lock:
+            for key in [key for key in self.prefetched if distance(key[1]) > max_distance + reach]:
+                del self.prefetched[key]
+    
+    def clear(self):
+        """Drop every cached chunk, raster, summary and prefetched chunk (per-universe files stay)"""
+        self.chunks.clear()
+        self.loaded_chunks.clear()
+        self.rasters.clear()
+        self.chunk_summaries.clear()
+        self.loaded_summary = empty_summary()
+        with self.prefetch_lock:
+            # Reads still in flight are dropped when they finish
+            self.prefetched.clear()
+            self.prefetch_pending.clear()
     
     def get_objects_in_area(self, min_x, min_y, max_x, max_y, universe_name):
         """Return all objects in specified area"""
@@ -73,3 +311,87 @@ class ChunkManager:
                         objects.append(obj)
         
         return objects
+    
+    def get_objects_reaching_area(self, min_x, min_y, max_x, max_y, universe_name):
+        """Objects covering any cell of an area, extended bodies centred outside it included"""
+        objects = {}
+        for chunk_x in range(min_x // self.chunk_size, max_x // self.chunk_size + 1):
+            for chunk_y in range(min_y // self.chunk_size, max_y // self.chunk_size + 1):
+                for obj in self.get_raster(chunk_x, chunk_y, universe_name).objects:
+                    extent = OccupancyRaster.extent(obj)
+                    if (obj['x'] + extent >= min_x and obj['x'] - extent <= max_x and
+                        obj['y'] + extent >= min_y and obj['y'] - extent <= max_y):
+                        objects[id(obj)] = obj
+        return list(objects.values())
+    
+    def get_raster(self, chunk_x, chunk_y, universe_name):
+        """Occupancy raster of a chunk, built once from every object that reaches into it"""
+        raster = self.rasters.get((chunk_x, chunk_y))
+        if raster is not None:
+            return raster
+        
+        # Extended bodies of neighbouring chunks can cover cells of this one
+        min_x = chunk_x * self.chunk_size
+        min_y = chunk_y * self.chunk_size
+        max_x = min_x + self.chunk_size - 1
+        max_y = min_y + self.chunk_size - 1
+        
+        objects = []
+        for neighbour_x, neighbour_y in self.raster_chunks(chunk_x, chunk_y):
+            for obj in self.load_chunk(neighbour_x, neighbour_y, universe_name):
+                extent = OccupancyRaster.extent(obj)
+                if (obj['x'] + extent >= min_x and obj['x'] - extent <= max_x and
+                    obj['y'] + extent >= min_y and obj['y'] - extent <= max_y):
+                    objects.append(obj)
+        
+        raster = OccupancyRaster(chunk_x, chunk_y, self.chunk_size, objects)
+        self.rasters[(chunk_x, chunk_y)] = raster
+        return raster
+    
+    def get_objects_at(self, x, y, universe_name):
+        """Object occupying cell (x, y), as a list - one lookup in the chunk's raster"""
+        chunk_x, chunk_y = self.get_chunk_coords(x, y)
+        obj = self.get_raster(chunk_x, chunk_y, universe_name).object_at(x, y)
+        return [obj] if obj is not None else []
+    
+    def get_objects_in_radius(self, x, y, radius, universe_name):
+        """Objects covering any cell within radius of (x, y)"""
+        found = {}
+        for cell_y in range(y - radius, y + radius + 1):
+            half_width = int((radius * radius - (cell_y - y) ** 2) ** 0.5)
+            for cell_x in range(x - half_width, x + half_width + 1):
+                for obj in self.get_objects_at(cell_x, cell_y, universe_name):
+                    found[id(obj)] = obj
+        return list(found.values())
+    
+    def cast_ray(self, x, y, dx, dy, max_steps, universe_name):
+        """First occupied cell on an axis-aligned ray from (x, y), within max_steps cells
+        
+        Only the chunks the ray crosses are visited, nearest first, and each one
+        is searched with a single scan of its raster row/column. Returns
+        (steps, objects) for the first occupied cell or (None, []) if the ray is clear.
+        """
+        if max_steps <= 0 or (dx == 0 and dy == 0):
+            return None, []
+        
+        horizontal = dx != 0
+        step = dx or dy
+        start = (x if horizontal else y) + step
+        end = (x if horizontal else y) + step * max_steps
+        fixed = y if horizontal else x
+        
+        while True:
+            chunk_x, chunk_y = self.get_chunk_coords(start, fixed) if horizontal else self.get_chunk_coords(fixed, start)
+            chunk_start = (chunk_x if horizontal else chunk_y) * self.chunk_size
+            chunk_end = chunk_start + self.chunk_size - 1 if step > 0 else chunk_start
+            segment_end = min(end, chunk_end) if step > 0 else max(end, chunk_end)
+            
+            raster = self.get_raster(chunk_x, chunk_y, universe_name)
+            hit = raster.find_occupied(fixed, start, segment_end, horizontal)
+            if hit is not None:
+                position = (hit, fixed) if horizontal else (fixed, hit)
+                return abs(hit - (x if horizontal else y)), [raster.object_at(*position)]
+            
+            if segment_end == end:
+                return None, []
+            start = segment_end + step
@@ -24,6 +24,7 @@ class StarType(Enum):
     A = "A"
     B = "B"
     O = "O"
+    HOT = "Hot"
 
 # Black hole classes
 class BlackHoleClass(Enum):
@@ -37,6 +38,8 @@ class PlanetType(Enum):
     GAS_GIANT = "gas_giant"
     ICE_GIANT = "ice_giant"
     TERRESTRIAL = "terrestrial"
+    GAS = "gas"
+    ICE = "ice"
 
 # Resource types
 class ResourceType(Enum):
@@ -0,0 +1,89 @@
+import os
+import json
+
+
+class MapIndex:
+    """maps/index.json of a session: the summary of every saved map.
+
+    Listing maps reads this one small file instead of parsing every map with
+    its object list. save_map / delete_map keep it current; on load, map
+    files the index doesn't know (and entries whose file is gone) are
+    reconciled from a directory listing, so only unknown maps are ever parsed.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.index_path = os.path.join(directory, self.INDEX_FILE)
+        self.entries = {}  # map name -> summary
+
+    @staticmethod
+    def summarize(map_data):
+        """Summary fields of a map file's data"""
+        matrix_data = map_data.get('matrix_data', {})
+        if 'object_count' in matrix_data:
+            object_count = matrix_data['object_count']
+        else:
+            object_count = len(matrix_data.get('celestial_objects', []))
+        return {
+            "description": map_data.get('description', ''),
+            "created": map_data.get('created', ''),
+            "universe_name": map_data.get('universe_name', ''),
+            "object_count": object_count
+        }
+
+    def map_path(self, name):
+        return os.path.join(self.directory, f"{name}.json")
+
+    def load(self):
+        """Read the index and reconcile it with the map files on disk"""
+        self.entries = {}
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except ValueError:
+                self.entries = {}
+
+        names = set()
+        if os.path.isdir(self.directory):
+            names = {file_name[:-len(".json")] for file_name in os.listdir(self.directory)
+                     if file_name.endswith(".json") and file_name != self.INDEX_FILE}
+
+        changed = False
+        for name in list(self.entries):
+            if name not in names:
+                del self.entries[name]
+                changed = True
+        for name in names - set(self.entries):
+            try:
+                with open(self.map_path(name), 'r', encoding='utf-8') as f:
+                    self.entries[name] = self.summarize(json.load(f))
+            except (OSError, ValueError) as e:
+                self.entries[name] = {"error": str(e)}
+            changed = True
+
+        if changed:
+            self.save()
+        return self
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.index_path)
+
+    def put(self, name, map_data):
+        """Record a saved map"""
+        self.entries[name] = self.summarize(map_data)
+        self.save()
+
+    def remove(self, name):
+        """Forget a deleted map"""
+        if self.entries.pop(name, None) is not None:
+            self.save()
+
+    def __contains__(self, name):
+        return name in self.entries
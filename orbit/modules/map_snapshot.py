@@ -0,0 +1,106 @@
+import json
+import hashlib
+
+
+class MapSnapshot:
+    """Reference-based map files.
+
+    A map stores the viewport geometry, the identity of the universe it was
+    taken in (name, seed and creation time - regenerating a universe changes
+    the latter) and a reference [name, chunk_x, chunk_y] per object instead
+    of the object records themselves. content_hash covers the referenced
+    records, so edits to the universe since the map was saved are detected
+    when the references are resolved through the chunks.
+
+    matrix_data["preview"] keeps the drawing geometry of the bodies reaching
+    into the viewport, so a loaded map is drawn at once while its chunks are
+    still being read.
+
+    Maps written by older versions embed the records in
+    matrix_data["celestial_objects"]; resolve returns those as they are.
+    """
+
+    FORMAT = 2
+
+    # Record fields the occupancy raster draws from
+    PREVIEW_FIELDS = ("name", "type", "x", "y", "radius", "center_radius", "width",
+                      "fragment_count", "belt_id")
+
+    @staticmethod
+    def content_hash(objects):
+        """sha256 of object records, independent of their key order"""
+        digest = hashlib.sha256()
+        for obj in objects:
+            digest.update(json.dumps(obj, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    @staticmethod
+    def universe_identity(metadata):
+        return {
+            "name": metadata.get('name'),
+            "seed": metadata.get('seed'),
+            "created": metadata.get('created')
+        }
+
+    @classmethod
+    def preview_shapes(cls, objects):
+        """Geometry-only copies of records"""
+        return [{field: obj[field] for field in cls.PREVIEW_FIELDS if field in obj} for obj in objects]
+
+    @classmethod
+    def preview(cls, map_data):
+        """Shapes to draw a map with before its chunks are loaded, or None if the map has none"""
+        matrix_data = map_data.get('matrix_data', {})
+        if map_data.get('format', 1) < cls.FORMAT:
+            return matrix_data.get('celestial_objects', [])
+        return matrix_data.get('preview')
+
+    @classmethod
+    def create(cls, name, description, created, metadata, geometry, objects, chunk_size, preview=()):
+        """Map data referencing objects (records of the viewport) by name and chunk
+
+        preview holds the records drawn in the viewport, including extended
+        bodies centred outside it.
+        """
+        matrix_data = dict(geometry)
+        matrix_data["object_count"] = len(objects)
+        matrix_data["object_refs"] = [[obj.get('name'), obj['x'] // chunk_size, obj['y'] // chunk_size]
+                                      for obj in objects]
+        matrix_data["preview"] = cls.preview_shapes(preview)
+        return {
+            "format": cls.FORMAT,
+            "name": name,
+            "description": description,
+            "universe_name": metadata.get('name'),
+            "universe": cls.universe_identity(metadata),
+            "created": created,
+            "content_hash": cls.content_hash(objects),
+            "matrix_data": matrix_data
+        }
+
+    @classmethod
+    def resolve(cls, map_data, read_chunk):
+        """(objects, missing names, unchanged) of a map; read_chunk(chunk_x, chunk_y) returns chunk records
+
+        unchanged is True when the resolved records still hash to the stored
+        content_hash (always True for maps that embed their records).
+        """
+        matrix_data = map_data.get('matrix_data', {})
+        if map_data.get('format', 1) < cls.FORMAT:
+            return matrix_data.get('celestial_objects', []), [], True
+
+        chunks = {}
+        objects = []
+        missing = []
+        for name, chunk_x, chunk_y in matrix_data.get('object_refs', []):
+            if (chunk_x, chunk_y) not in chunks:
+                chunks[(chunk_x, chunk_y)] = {obj.get('name'): obj for obj in read_chunk(chunk_x, chunk_y)}
+            obj = chunks[(chunk_x, chunk_y)].get(name)
+            if obj is None:
+                missing.append(name)
+            else:
+                objects.append(obj)
+
+        unchanged = not missing and cls.content_hash(objects) == map_data.get('content_hash')
+        return objects, missing, unchanged
@@ -0,0 +1,136 @@
+import pygame
+
+from .colors import Colors
+
+
+class MatrixRenderer:
+    """Palette-indexed matrix renderer.
+
+    Every matrix cell is one pixel of a small 8-bit surface whose value is a
+    palette index, copied from the chunks' occupancy rasters. The matrix is
+    scaled to the screen rect with transform.scale instead of one draw.rect
+    per cell, and kept between frames in a display format surface: when the
+    view origin moves by a few cells both surfaces are scrolled and only the
+    newly exposed strips are painted, scaled and converted.
+    """
+
+    EMPTY = 0
+    SUN = 1
+    BLACK_HOLE = 2
+    ASTEROID_BELT = 3
+    PLANET = 4
+    COMET = 5
+    UNKNOWN = 6
+
+    PALETTE = [
+        Colors.BLACK,       # EMPTY
+        Colors.YELLOW,      # SUN
+        Colors.DARK_GRAY,   # BLACK_HOLE
+        Colors.LIGHT_GRAY,  # ASTEROID_BELT
+        Colors.NAVY,        # PLANET
+        Colors.WHITE,       # COMET
+        Colors.YELLOW,      # UNKNOWN (varsayılan)
+    ]
+
+    TYPE_CODES = {
+        'sun': SUN,
+        'black_hole': BLACK_HOLE,
+        'asteroid_belt': ASTEROID_BELT,
+        'planet': PLANET,
+        'comet': COMET,
+    }
+
+    def __init__(self):
+        self.palette = self.PALETTE + [Colors.BLACK] * (256 - len(self.PALETTE))
+        self.matrix_size = 0
+        self.cell_size = 0
+        self.origin = None
+        self.cells = None
+        self.view = None
+
+    def _indexed_surface(self, width, height):
+        surface = pygame.Surface((width, height), 0, 8)
+        surface.set_palette(self.palette)
+        return surface
+
+    def invalidate(self):
+        """Force a full rebuild on the next frame (universe or chunk content changed)"""
+        self.origin = None
+
+    def get_shift(self, matrix_size, cell_size, origin):
+        """Cell offset from the rendered origin, or None if the buffer can't be reused"""
+        if self.origin is None or self.matrix_size != matrix_size or self.cell_size != cell_size:
+            return None
+        return origin[0] - self.origin[0], origin[1] - self.origin[1]
+
+    def begin(self, matrix_size, cell_size, origin):
+        """Start a full rebuild of the matrix at origin"""
+        if self.cells is None or self.matrix_size != matrix_size:
+            self.cells = self._indexed_surface(matrix_size, matrix_size)
+        pixel_size = matrix_size * cell_size
+        if self.view is None or self.view.get_size() != (pixel_size, pixel_size):
+            self.view = pygame.Surface((pixel_size, pixel_size))
+            if pygame.display.get_surface() is not None:
+                self.view = self.view.convert()
+        self.matrix_size = matrix_size
+        self.cell_size = cell_size
+        self.origin = origin
+        self.cells.fill(self.EMPTY)
+
+    def scroll(self, dx, dy):
+        """Shift the content by (dx, dy) cells and return the exposed cell rects"""
+        n = self.matrix_size
+        self.cells.scroll(-dx, -dy)
+        self.view.scroll(-dx * self.cell_size, -dy * self.cell_size)
+        self.origin = (self.origin[0] + dx, self.origin[1] + dy)
+
+        exposed = []
+        if dx > 0:
+            exposed.append(pygame.Rect(n - dx, 0, dx, n))
+        elif dx < 0:
+            exposed.append(pygame.Rect(0, 0, -dx, n))
+        if dy > 0:
+            exposed.append(pygame.Rect(0, n - dy, n, dy))
+        elif dy < 0:
+            exposed.append(pygame.Rect(0, 0, n, -dy))
+
+        for region in exposed:
+            self.cells.fill(self.EMPTY, region)
+        return exposed
+
+    def type_code(self, obj_type):
+        return self.TYPE_CODES.get(obj_type, self.UNKNOWN)
+
+    def raster_surface(self, raster):
+        """8-bit surface sharing the type codes of a chunk's occupancy raster"""
+        surface = pygame.image.frombuffer(raster.codes, (raster.size, raster.size), 'P')
+        surface.set_palette(self.palette)
+        return surface
+
+    def paint_rasters(self, get_raster, chunk_size, regions=None):
+        """Copy the chunk occupancy rasters under the view into the cells, optionally only inside regions"""
+        if regions is None:
+            regions = [self.cells.get_rect()]
+        origin_x, origin_y = self.origin
+        for region in regions:
+            area = region.move(origin_x, origin_y)
+            self.cells.set_clip(region)
+            for chunk_y in range(area.top // chunk_size, (area.bottom - 1) // chunk_size + 1):
+                for chunk_x in range(area.left // chunk_size, (area.right - 1) // chunk_size + 1):
+                    raster = get_raster(chunk_x, chunk_y)
+                    if raster.surface is None:
+                        raster.surface = self.raster_surface(raster)
+                    self.cells.blit(raster.surface, (chunk_x * chunk_size - origin_x,
+                                                     chunk_y * chunk_size - origin_y))
+        self.cells.set_clip(None)
+
+    def draw(self, target, rect, regions=None):
+        """Scale the changed cells (all by default) into the persistent view and blit it"""
+        if regions is None:
+            regions = [self.cells.get_rect()]
+        cell = self.cell_size
+        for region in regions:
+            strip = pygame.transform.scale(self.cells.subsurface(region),
+                                           (region.width * cell, region.height * cell))
+            self.view.blit(strip, (region.x * cell, region.y * cell))
+        target.blit(self.view, rect.topleft)
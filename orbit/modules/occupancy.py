@@ -0,0 +1,182 @@
+import math
+import random
+from array import array
+
+from .matrix_renderer import MatrixRenderer
+
+
+class OccupancyRaster:
+    """Per-chunk occupancy grid of extended bodies.
+
+    Each object is rasterised once, when the chunk is first queried: stars and
+    planets as discs of their radius, asteroid belts as the fragments of their
+    annulus that fall into the chunk, everything else as a single cell. codes holds
+    the MatrixRenderer type code of every cell (row-major, uint8) and owners the
+    index + 1 of the object covering it (0 = empty). Later objects win, so
+    bodies are stamped from the least to the most important type.
+    """
+
+    # Stamp order - later types cover earlier ones
+    STAMP_ORDER = {
+        'asteroid_belt': 0,
+        'comet': 1,
+        'planet': 2,
+        'sun': 3,
+        'black_hole': 4,
+    }
+
+    # Belt annuli are split into angular sectors; each sector's fragments come
+    # from their own seeded generator, so a chunk only expands the sectors it sees
+    BELT_SECTORS = 16
+
+    def __init__(self, chunk_x, chunk_y, chunk_size, objects):
+        self.chunk_x = chunk_x
+        self.chunk_y = chunk_y
+        self.size = chunk_size
+        self.origin_x = chunk_x * chunk_size
+        self.origin_y = chunk_y * chunk_size
+        self.codes = bytearray(chunk_size * chunk_size)
+        self.owners = array('H', bytes(2 * chunk_size * chunk_size))
+        self.objects = []
+        self._columns = None
+        self.surface = None  # Matrix renderer's 8-bit copy, created on first draw
+
+        for obj in sorted(objects, key=lambda o: self.STAMP_ORDER.get(o.get('type'), 1)):
+            self.stamp(obj)
+
+    @staticmethod
+    def extent(obj):
+        """Distance from (x, y) to the farthest occupied cell of an object"""
+        if obj.get('type') == 'asteroid_belt':
+            return obj.get('center_radius', 0) + obj.get('width', 0) / 2
+        if obj.get('type') in ('sun', 'planet'):
+            return obj.get('radius', 0)
+        return 0
+
+    def stamp(self, obj):
+        """Rasterise one object into the cells of this chunk"""
+        code = MatrixRenderer.TYPE_CODES.get(obj.get('type'), MatrixRenderer.UNKNOWN)
+        self.objects.append(obj)
+        owner = len(self.objects)
+        self._columns = None
+
+        if obj.get('type') == 'asteroid_belt':
+            for x, y in self.belt_fragments(obj):
+                index = (y - self.origin_y) * self.size + (x - self.origin_x)
+                self.codes[index] = code
+                self.owners[index] = owner
+        else:
+            self.stamp_annulus(obj['x'], obj['y'], 0.0, self.extent(obj), code, owner)
+
+    def stamp_annulus(self, cx, cy, inner, outer, code, owner):
+        """Mark cells whose distance d from (cx, cy) satisfies inner <= d <= outer"""
+        size = self.size
+        top = max(self.origin_y, math.ceil(cy - outer))
+        bottom = min(self.origin_y + size - 1, math.floor(cy + outer))
+        for y in range(top, bottom + 1):
+            dy2 = (y - cy) ** 2
+            half_outer = math.floor(math.sqrt(max(0.0, outer * outer - dy2)))
+            if inner > 0 and inner * inner > dy2:
+                # Ring row: two segments left and right of the hole
+                half_inner = math.ceil(math.sqrt(inner * inner - dy2))
+                spans = ((cx - half_outer, cx - half_inner), (cx + half_inner, cx + half_outer))
+            else:
+                spans = ((cx - half_outer, cx + half_outer),)
+
+            row = (y - self.origin_y) * size
+            for left, right in spans:
+                left = max(left, self.origin_x) - self.origin_x
+                right = min(right, self.origin_x + size - 1) - self.origin_x
+                if left > right:
+                    continue
+                count = right - left + 1
+                self.codes[row + left:row + right + 1] = bytes((code,)) * count
+                self.owners[row + left:row + right + 1] = array('H', (owner,)) * count
+
+    @staticmethod
+    def belt_id(belt):
+        """belt_id of a belt record (older universes only carry it in the name suffix)"""
+        if 'belt_id' in belt:
+            return belt['belt_id']
+        try:
+            return int(belt.get('name', '').rsplit('_', 1)[-1])
+        except ValueError:
+            return 0
+
+    def belt_sectors(self, belt):
+        """Annulus sectors whose angular span can reach this chunk"""
+        sectors = self.BELT_SECTORS
+        # One cell of slack: fragments are rounded to the nearest cell
+        left, top = self.origin_x - 1 - belt['x'], self.origin_y - 1 - belt['y']
+        right, bottom = left + self.size + 1, top + self.size + 1
+        if left <= 0 <= right and top <= 0 <= bottom:
+            return range(sectors)
+
+        # The chunk doesn't contain the star, so it spans less than half a turn
+        corners = [math.atan2(y, x) for x in (left, right) for y in (top, bottom)]
+        middle = math.atan2((top + bottom) / 2, (left + right) / 2)
+        offsets = [(angle - middle + math.pi) % (2 * math.pi) - math.pi for angle in corners]
+        sector_angle = 2 * math.pi / sectors
+        first = math.floor((middle + min(offsets)) / sector_angle)
+        last = math.floor((middle + max(offsets)) / sector_angle)
+        return [sector % sectors for sector in range(first, last + 1)]
+
+    def belt_fragments(self, belt):
+        """Fragment cells of a belt inside this chunk, expanded deterministically from belt_id"""
+        center_radius = belt.get('center_radius', 0)
+        half_width = belt.get('width', 0) / 2
+        inner = max(1.0, center_radius - half_width)
+        outer = max(inner, center_radius + half_width)
+        count = belt.get('fragment_count', 0)
+        sectors = self.BELT_SECTORS
+        sector_angle = 2 * math.pi / sectors
+        base_seed = self.belt_id(belt) * sectors
+
+        fragments = []
+        for sector in self.belt_sectors(belt):
+            rng = random.Random(base_seed + sector)
+            for _ in range(count // sectors + (1 if sector < count % sectors else 0)):
+                angle = (sector + rng.random()) * sector_angle
+                # Uniform in area, not in radius
+                radius = math.sqrt(rng.uniform(inner * inner, outer * outer))
+                x = belt['x'] + round(radius * math.cos(angle))
+                y = belt['y'] + round(radius * math.sin(angle))
+                if (self.origin_x <= x < self.origin_x + self.size and
+                        self.origin_y <= y < self.origin_y + self.size):
+                    fragments.append((x, y))
+        return fragments
+
+    def object_at(self, x, y):
+        """Object covering cell (x, y) of this chunk, or None"""
+        owner = self.owners[(y - self.origin_y) * self.size + (x - self.origin_x)]
+        return self.objects[owner - 1] if owner else None
+
+    def find_occupied(self, fixed, start, end, horizontal=True):
+        """First occupied cell from start to end (inclusive, either direction) on one line
+        
+        The line is row y=fixed if horizontal, otherwise column x=fixed; start and
+        end are absolute coordinates inside this chunk. Returns the coordinate of
+        the hit along the line, or None.
+        """
+        size = self.size
+        if horizontal:
+            line, base, offset = self.codes, (fixed - self.origin_y) * size, self.origin_x
+        else:
+            line, base, offset = self.columns(), (fixed - self.origin_x) * size, self.origin_y
+        first, last = sorted((start - offset, end - offset))
+        segment = line[base + first:base + last + 1]
+
+        if start <= end:
+            skipped = len(segment) - len(segment.lstrip(b'\x00'))
+            return start + skipped if skipped < len(segment) else None
+        skipped = len(segment) - len(segment.rstrip(b'\x00'))
+        return start - skipped if skipped < len(segment) else None
+
+    def columns(self):
+        """Column-major copy of codes for vertical ray queries"""
+        if self._columns is None:
+            size = self.size
+            self._columns = bytearray(size * size)
+            for column in range(size):
+                self._columns[column * size:(column + 1) * size] = self.codes[column::size]
+        return self._columns
@@ -0,0 +1,284 @@
+import re
+import math
+import heapq
+import operator
+import itertools
+from collections import OrderedDict
+
+from .universe_constants import UniverseConstants
+
+
+class Query:
+    """find query: predicates over chunk records, planned against the universe indexes.
+
+        find type=planet prop=rocky res=Au richness=rich within 300 limit 20 sort score
+
+    Terms are field<op>value (op: = != < <= > >=), "within <distance>",
+    "limit <n>" and "sort <field>" ("-field" reverses the order; score sorts
+    best first). Equality on res, type and prop is answered from an
+    index - the resource index for res, the spatial index for type/prop and
+    within - and every other predicate is checked on the candidates, reading a
+    chunk only when a predicate needs a field the index doesn't carry. Without
+    an indexable term the chunk files are streamed one at a time. Results are
+    produced lazily, so a page of results costs only what that page needs.
+    """
+
+    TYPE_ALIASES = {
+        "star": "sun",
+        "bh": "black_hole",
+        "blackhole": "black_hole",
+        "belt": "asteroid_belt",
+    }
+
+    FIELD_ALIASES = {"res": "resource"}
+
+    OPERATORS = {
+        "=": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+    }
+
+    TERM = re.compile(r"^([A-Za-z_]+)(!=|<=|>=|=|<|>)(.+)$")
+
+    def __init__(self):
+        self.predicates = []  # (field, op, value) checked on candidate rows
+        self.resource = None
+        self.richness = None
+        self.obj_type = None
+        self.prop = None
+        self.within = None
+        self.limit = None
+        self.sort = None
+        self.descending = False
+
+    @classmethod
+    def parse(cls, terms):
+        """Query of the words after "find"; raises ValueError with a message for the console"""
+        query = cls()
+        terms = list(terms)
+        while terms:
+            term = terms.pop(0)
+            keyword = term.lower()
+            if keyword in ("within", "limit", "sort"):
+                if not terms:
+                    raise ValueError(f"'{term}' için değer gerekli")
+                value = terms.pop(0)
+                if keyword == "sort":
+                    query.descending = value.startswith("-")
+                    query.sort = value.lstrip("-").lower()
+                    continue
+                try:
+                    number = float(value) if keyword == "within" else int(value)
+                except ValueError:
+                    raise ValueError(f"Geçersiz sayı: {value}") from None
+                if number <= 0:
+                    raise ValueError(f"'{term}' pozitif olmalı")
+                if keyword == "within":
+                    query.within = number
+                else:
+                    query.limit = number
+                continue
+
+            match = cls.TERM.match(term)
+            if not match:
+                raise ValueError(f"Anlaşılamayan terim: {term}")
+            field, op, value = match.groups()
+            field = cls.FIELD_ALIASES.get(field.lower(), field.lower())
+
+            if field == "resource":
+                resource = UniverseConstants.resolve_resource(value)
+                if resource is None:
+                    raise ValueError(f"Bilinmeyen kaynak: {value}")
+                value = resource
+            elif field == "type":
+                value = cls.TYPE_ALIASES.get(value.lower(), value.lower())
+            elif field == "richness":
+                value = value.lower()
+
+            if op == "=" and field in ("resource", "type", "prop", "richness") and getattr(query, cls._slot(field)) is None:
+                setattr(query, cls._slot(field), value)
+            else:
+                query.predicates.append((field, op, value))
+
+        if query.sort == "score" and query.resource is None:
+            raise ValueError("sort score için res=<kaynak> gerekli")
+        if query.sort == "score":
+            query.descending = not query.descending
+        return query
+
+    @staticmethod
+    def _slot(field):
+        return "obj_type" if field == "type" else field
+
+    def execute(self, chunk_manager, universe_name, origin_x, origin_y):
+        """(plan description, lazy iterator of result rows)"""
+        reader = _RecordReader(chunk_manager, universe_name)
+
+        # Each source also reports the (field, descending) order it already yields
+        if self.resource is not None:
+            plan = f"kaynak indeksi ({self.resource})"
+            rows, natural_sort = self._resource_rows(chunk_manager, universe_name, origin_x, origin_y)
+        elif self.within is not None or self.sort == "distance" or self.obj_type or self.prop:
+            plan = "uzamsal indeks"
+            rows, natural_sort = self._spatial_rows(chunk_manager, universe_name, origin_x, origin_y)
+        else:
+            plan = "chunk taraması"
+            rows, natural_sort = self._scan_rows(chunk_manager, universe_name, origin_x, origin_y), None
+
+        checks = list(self.predicates)
+        if self.resource is None and self.richness is not None:
+            checks.append(("richness", "=", self.richness))
+        if self.resource is not None and self.prop is not None:
+            # Resource postings don't carry prop - checked on the record
+            checks.append(("prop", "=", self.prop))
+        if checks:
+            plan += " + filtre: " + " ".join(f"{field}{op}{value}" for field, op, value in checks)
+            rows = (row for row in rows if all(self._check(row, check, reader) for check in checks))
+
+        if self.sort is not None and (self.sort, self.descending) != natural_sort:
+            plan += f" + sıralama: {'-' if self.descending else ''}{self.sort}"
+            rows = self._sorted(rows, reader)
+
+        if self.limit is not None:
+            rows = itertools.islice(rows, self.limit)
+        return plan, rows
+
+    def _resource_rows(self, chunk_manager, universe_name, origin_x, origin_y):
+        index = chunk_manager.get_resource_index(universe_name)
+        if self.sort == "distance" and not self.descending:
+            postings = [posting for _, posting in index.nearest(
+                self.resource, origin_x, origin_y, chunk_manager.chunk_size,
+                len(index.postings.get(self.resource, ())), self.richness)]
+            natural_sort = ("distance", False)
+        else:
+            postings = (posting for posting in index.postings.get(self.resource, ())
+                        if self.richness is None or posting[index.RICHNESS] == self.richness)
+            natural_sort = ("score", True)
+
+        def rows():
+            for score, name, chunk_x, chunk_y, x, y, obj_type, richness in postings:
+                if self.obj_type is not None and obj_type != self.obj_type:
+                    continue
+                distance = math.hypot(x - origin_x, y - origin_y)
+                if self.within is not None and distance > self.within:
+                    if natural_sort[0] == "distance":
+                        return
+                    continue
+                yield {"name": name, "type": obj_type, "x": x, "y": y, "chunk": (chunk_x, chunk_y),
+                       "distance": distance, "score": score, "richness": richness}
+
+        return rows(), natural_sort
+
+    def _spatial_rows(self, chunk_manager, universe_name, origin_x, origin_y):
+        index = chunk_manager.get_spatial_index(universe_name)
+        if self.within is not None:
+            points = index.within(origin_x, origin_y, self.within, self.obj_type, self.prop)
+            natural_sort = ("distance", False)
+        elif (self.sort == "distance" and not self.descending and self.limit is not None
+              and not self.predicates and self.richness is None):
+            points = index.nearest(origin_x, origin_y, self.limit, self.obj_type, self.prop)
+            natural_sort = ("distance", False)
+        elif self.sort == "distance" and not self.descending:
+            points = index.within(origin_x, origin_y, math.inf, self.obj_type, self.prop)
+            natural_sort = ("distance", False)
+        else:
+            points = ((None, point) for point in index.iter_points(self.obj_type, self.prop))
+            natural_sort = None
+
+        def rows():
+            for distance, point in points:
+                if distance is None:
+                    distance = math.hypot(point["x"] - origin_x, point["y"] - origin_y)
+                yield dict(point, distance=distance)
+
+        return rows(), natural_sort
+
+    def _scan_rows(self, chunk_manager, universe_name, origin_x, origin_y):
+        for chunk_x, chunk_y, objects in chunk_manager.iter_chunk_files(universe_name):
+            for obj in objects:
+                distance = math.hypot(obj.get('x', 0) - origin_x, obj.get('y', 0) - origin_y)
+                if self.within is not None and distance > self.within:
+                    continue
+                yield {"name": obj.get('name'), "type": obj.get('type'), "prop": obj.get('prop') or 'unknown',
+                       "x": obj.get('x'), "y": obj.get('y'), "chunk": (chunk_x, chunk_y),
+                       "distance": distance, "record": obj}
+
+    def _value(self, row, field, reader):
+        if field in row:
+            return row[field]
+        record = reader.record(row)
+        if record is None:
+            return None
+        if field in ("resource", "richness"):
+            resources = record.get('resources') or record.get('resource_pool') or {}
+            if field == "resource":
+                return set(resources)
+            return {data.get('richness') for data in resources.values() if isinstance(data, dict)}
+        if field == "prop":
+            return record.get('prop') or 'unknown'
+        return record.get(field)
+
+    def _check(self, row, check, reader):
+        field, op, expected = check
+        value = self._value(row, field, reader)
+        if isinstance(value, set):
+            # Set-valued fields (resources of a body): = means "has", != "lacks"
+            has = expected in value
+            return has if op == "=" else (not has if op == "!=" else False)
+        if value is None:
+            return op == "!="
+        if isinstance(value, (int, float)):
+            try:
+                return self.OPERATORS[op](value, float(expected))
+            except ValueError:
+                return False
+        return self.OPERATORS[op](str(value).lower(), str(expected).lower())
+
+    def _sorted(self, rows, reader):
+        """Rows ordered by a key the source doesn't produce - keeps only limit rows when given"""
+        missing = (-1,) if self.descending else (1,)  # Rows without the field go last
+
+        def key(row):
+            value = self._value(row, self.sort, reader)
+            if value is None or isinstance(value, set):
+                return missing
+            if isinstance(value, (int, float)):
+                return (0, 0, value)
+            return (0, 1, str(value).lower())
+
+        if self.limit is not None:
+            pick = heapq.nlargest if self.descending else heapq.nsmallest
+            return iter(pick(self.limit, rows, key=key))
+        return iter(sorted(rows, key=key, reverse=self.descending))
+
+
+class _RecordReader:
+    """Chunk records of index rows, keeping the MAX_CHUNKS most recently used chunks
+
+    A chunk is read again only after MAX_CHUNKS other chunks have been used
+    since - never for queries touching at most MAX_CHUNKS chunks.
+    """
+
+    MAX_CHUNKS = 64
+
+    def __init__(self, chunk_manager, universe_name):
+        self.chunk_manager = chunk_manager
+        self.universe_name = universe_name
+        self.chunks = OrderedDict()  # (chunk_x, chunk_y) -> {name: record}, least recently used first
+
+    def record(self, row):
+        if "record" in row:
+            return row["record"]
+        chunk = row["chunk"]
+        if chunk in self.chunks:
+            self.chunks.move_to_end(chunk)
+        else:
+            if len(self.chunks) >= self.MAX_CHUNKS:
+                self.chunks.popitem(last=False)
+            objects = self.chunk_manager.read_chunk(chunk[0], chunk[1], self.universe_name)
+            self.chunks[chunk] = {obj.get('name'): obj for obj in objects}
+        row["record"] = self.chunks[chunk].get(row["name"])
+        return row["record"]
@@ -0,0 +1,146 @@
+import os
+import json
+import math
+
+
+class ResourceIndex:
+    """Inverted resource index of a universe (resources.json).
+
+    For every resource key ("Gold") it holds the postings of all bodies that
+    carry it - planets through their "resources", asteroid belts through their
+    "resource_pool" - sorted by descending score:
+
+        [score, name, chunk_x, chunk_y, x, y, type, richness]
+
+    Top-k queries read the head of a posting list; nearest queries bucket a
+    resource's postings by chunk (built on first use) and search rings of
+    chunks outwards from the query point.
+    """
+
+    FILE_NAME = "resources.json"
+
+    SCORE, NAME, CHUNK_X, CHUNK_Y, X, Y, TYPE, RICHNESS = range(8)
+
+    def __init__(self, postings=None):
+        self.postings = postings or {}
+        self._grids = {}  # resource -> ({(chunk_x, chunk_y): [posting]}, bounds)
+
+    @classmethod
+    def build(cls, chunk_objects):
+        """Index of {(chunk_x, chunk_y): objects}"""
+        index = cls()
+        for (chunk_x, chunk_y), objects in sorted(chunk_objects.items()):
+            index.update_chunk(chunk_x, chunk_y, objects)
+        return index
+
+    @classmethod
+    def load(cls, directory):
+        """Index of a universe directory, or None if it has none"""
+        path = os.path.join(directory, cls.FILE_NAME)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get("resources"))
+
+    def save(self, directory):
+        path = os.path.join(directory, self.FILE_NAME)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"resources": self.postings}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def object_postings(chunk_x, chunk_y, obj):
+        """(resource, posting) pairs of one object record"""
+        resources = obj.get('resources') or obj.get('resource_pool') or {}
+        for resource, data in resources.items():
+            if not isinstance(data, dict):
+                continue
+            yield resource, [data.get('score', 0.0), obj.get('name'), chunk_x, chunk_y,
+                             obj.get('x'), obj.get('y'), obj.get('type'), data.get('richness')]
+
+    def update_chunk(self, chunk_x, chunk_y, objects):
+        """Replace the postings of one chunk"""
+        changed = set()
+        for resource, postings in self.postings.items():
+            kept = [p for p in postings if p[self.CHUNK_X] != chunk_x or p[self.CHUNK_Y] != chunk_y]
+            if len(kept) != len(postings):
+                self.postings[resource] = kept
+                changed.add(resource)
+
+        for obj in objects:
+            for resource, posting in self.object_postings(chunk_x, chunk_y, obj):
+                self.postings.setdefault(resource, []).append(posting)
+                changed.add(resource)
+
+        for resource in changed:
+            self.postings[resource].sort(key=lambda p: (-p[self.SCORE], p[self.NAME] or ""))
+            self._grids.pop(resource, None)
+
+    def top(self, resource, k=10, richness=None):
+        """k highest-scoring postings of a resource, optionally of one richness"""
+        results = []
+        for posting in self.postings.get(resource, ()):
+            if richness is None or posting[self.RICHNESS] == richness:
+                results.append(posting)
+                if len(results) >= k:
+                    break
+        return results
+
+    def _grid(self, resource):
+        if resource not in self._grids:
+            grid = {}
+            for posting in self.postings.get(resource, ()):
+                grid.setdefault((posting[self.CHUNK_X], posting[self.CHUNK_Y]), []).append(posting)
+            bounds = None
+            if grid:
+                xs = [chunk[0] for chunk in grid]
+                ys = [chunk[1] for chunk in grid]
+                bounds = (min(xs), min(ys), max(xs), max(ys))
+            self._grids[resource] = (grid, bounds)
+        return self._grids[resource]
+
+    def nearest(self, resource, x, y, chunk_size, k=1, richness=None):
+        """k postings of a resource closest to (x, y) as (distance, posting), nearest first"""
+        grid, bounds = self._grid(resource)
+        if not grid:
+            return []
+
+        chunk_x, chunk_y = x // chunk_size, y // chunk_size
+        max_ring = max(abs(chunk_x - bounds[0]), abs(chunk_x - bounds[2]),
+                       abs(chunk_y - bounds[1]), abs(chunk_y - bounds[3]))
+        found = []  # (distance², posting)
+
+        def consider(postings):
+            for posting in postings:
+                if richness is None or posting[self.RICHNESS] == richness:
+                    found.append(((posting[self.X] - x) ** 2 + (posting[self.Y] - y) ** 2, posting))
+
+        for ring in range(max_ring + 1):
+            # Every cell of ring r is more than (r - 1) chunks away
+            if len(found) >= k and found[k - 1][0] <= ((ring - 1) * chunk_size) ** 2:
+                break
+            if 8 * ring > len(grid):
+                # Sparse resource: walking the remaining rings costs more than the list
+                found = []
+                consider(self.postings[resource])
+                found.sort(key=lambda item: item[0])
+                break
+            if ring == 0:
+                consider(grid.get((chunk_x, chunk_y), ()))
+            else:
+                for dx in range(-ring, ring + 1):
+                    consider(grid.get((chunk_x + dx, chunk_y - ring), ()))
+                    consider(grid.get((chunk_x + dx, chunk_y + ring), ()))
+                for dy in range(-ring + 1, ring):
+                    consider(grid.get((chunk_x - ring, chunk_y + dy), ()))
+                    consider(grid.get((chunk_x + ring, chunk_y + dy), ()))
+            found.sort(key=lambda item: item[0])
+            del found[k:]
+
+        return [(math.sqrt(distance2), posting) for distance2, posting in found[:k]]
+
+    def resources(self):
+        """{resource: number of bodies carrying it}"""
+        return {resource: len(postings) for resource, postings in self.postings.items()}
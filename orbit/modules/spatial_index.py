@@ -0,0 +1,185 @@
+import os
+import json
+import math
+import heapq
+
+
+class SpatialIndex:
+    """KD-trees over the coordinates of every object of a universe (spatial.json).
+
+    There is one tree per (type, prop) pair - "sun:G", "planet:rocky",
+    "black_hole:stellar" - so type and prop filters select whole trees instead
+    of skipping points. A tree is stored implicitly as parallel lists in KD
+    order: the median of [lo, hi) sits at (lo + hi) // 2, split on x at even
+    depths and on y at odd ones. Trees are saved in that order, so loading
+    needs no rebuild; chunks rewritten later only mark their trees for a
+    re-sort on next use.
+    """
+
+    FILE_NAME = "spatial.json"
+
+    FIELDS = ("x", "y", "chunk_x", "chunk_y", "name")
+
+    def __init__(self, trees=None):
+        self.trees = trees or {}  # "type:prop" -> {field: [...]}
+        self._dirty = set()  # keys of trees whose lists are not in KD order
+        self._chunks = None  # (chunk_x, chunk_y) pairs with points, built on first update
+
+    @staticmethod
+    def tree_key(obj_type, prop):
+        return f"{obj_type or 'unknown'}:{prop or 'unknown'}"
+
+    @classmethod
+    def build(cls, chunk_objects):
+        """Index of {(chunk_x, chunk_y): objects}"""
+        index = cls()
+        for (chunk_x, chunk_y), objects in sorted(chunk_objects.items()):
+            index.update_chunk(chunk_x, chunk_y, objects)
+        return index
+
+    @classmethod
+    def load(cls, directory):
+        """Index of a universe directory, or None if it has none"""
+        path = os.path.join(directory, cls.FILE_NAME)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get("trees"))
+
+    def save(self, directory):
+        for key in list(self._dirty):
+            self._sort_tree(key)
+        path = os.path.join(directory, self.FILE_NAME)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"trees": self.trees}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def update_chunk(self, chunk_x, chunk_y, objects):
+        """Replace the points of one chunk"""
+        if self._chunks is None:
+            self._chunks = set()
+            for tree in self.trees.values():
+                self._chunks.update(zip(tree["chunk_x"], tree["chunk_y"]))
+
+        if (chunk_x, chunk_y) in self._chunks:
+            for key, tree in self.trees.items():
+                keep = [i for i in range(len(tree["x"]))
+                        if tree["chunk_x"][i] != chunk_x or tree["chunk_y"][i] != chunk_y]
+                if len(keep) != len(tree["x"]):
+                    for field in self.FIELDS:
+                        tree[field] = [tree[field][i] for i in keep]
+                    self._dirty.add(key)
+            self._chunks.discard((chunk_x, chunk_y))
+
+        for obj in objects:
+            key = self.tree_key(obj.get('type'), obj.get('prop'))
+            tree = self.trees.setdefault(key, {field: [] for field in self.FIELDS})
+            for field, value in zip(self.FIELDS, (obj.get('x'), obj.get('y'), chunk_x, chunk_y, obj.get('name'))):
+                tree[field].append(value)
+            self._dirty.add(key)
+            self._chunks.add((chunk_x, chunk_y))
+
+        for key in [key for key, tree in self.trees.items() if not tree["x"]]:
+            del self.trees[key]
+            self._dirty.discard(key)
+
+    def _sort_tree(self, key):
+        """Reorder a tree's lists into KD order"""
+        tree = self.trees[key]
+        points = list(zip(*(tree[field] for field in self.FIELDS)))
+        stack = [(0, len(points), 0)]
+        while stack:
+            lo, hi, axis = stack.pop()
+            if hi - lo <= 1:
+                continue
+            points[lo:hi] = sorted(points[lo:hi], key=lambda p: p[axis])
+            mid = (lo + hi) // 2
+            stack.append((lo, mid, 1 - axis))
+            stack.append((mid + 1, hi, 1 - axis))
+        for i, field in enumerate(self.FIELDS):
+            tree[field] = [p[i] for p in points]
+        self._dirty.discard(key)
+
+    def select(self, obj_type=None, prop=None):
+        """Keys of the trees matching a type and/or prop (prop is case-insensitive)"""
+        keys = []
+        for key in self.trees:
+            key_type, key_prop = key.split(":", 1)
+            if obj_type is not None and key_type != obj_type:
+                continue
+            if prop is not None and key_prop.lower() != prop.lower():
+                continue
+            keys.append(key)
+        return keys
+
+    def _search(self, key, x, y, k, radius2, best):
+        """Visit one tree; best is a heap of (-distance², key, index) holding at most k items"""
+        if key in self._dirty:
+            self._sort_tree(key)
+        tree = self.trees[key]
+        xs, ys = tree["x"], tree["y"]
+        full = k is not None and len(best) >= k
+        limit2 = -best[0][0] if full else radius2
+        stack = [(0, len(xs), 0, 0)]
+        while stack:
+            lo, hi, axis, bound2 = stack.pop()
+            if bound2 > limit2:
+                continue
+            # Walk down the near side, leaving far subtrees on the stack
+            while lo < hi:
+                mid = (lo + hi) // 2
+                dx = x - xs[mid]
+                dy = y - ys[mid]
+                distance2 = dx * dx + dy * dy
+                if distance2 <= limit2:
+                    if full:
+                        heapq.heapreplace(best, (-distance2, key, mid))
+                    else:
+                        heapq.heappush(best, (-distance2, key, mid))
+                        full = k is not None and len(best) >= k
+                    if full:
+                        limit2 = -best[0][0]
+                diff = dx if axis == 0 else dy
+                if diff < 0:
+                    far_lo, far_hi, hi = mid + 1, hi, mid
+                else:
+                    far_lo, far_hi, lo = lo, mid, mid + 1
+                axis = 1 - axis
+                if diff * diff <= limit2 and far_lo < far_hi:
+                    stack.append((far_lo, far_hi, axis, diff * diff))
+
+    def _point(self, key, i):
+        tree = self.trees[key]
+        obj_type, prop = key.split(":", 1)
+        return {"x": tree["x"][i], "y": tree["y"][i], "type": obj_type, "prop": prop,
+                "name": tree["name"][i], "chunk": (tree["chunk_x"][i], tree["chunk_y"][i])}
+
+    def _results(self, best):
+        return [(math.sqrt(-negative_distance2), self._point(key, i))
+                for negative_distance2, key, i in sorted(best, key=lambda item: (-item[0], item[1], item[2]))]
+
+    def iter_points(self, obj_type=None, prop=None):
+        """Points of the matching trees, one tree after another (no distance order)"""
+        for key in self.select(obj_type, prop):
+            for i in range(len(self.trees[key]["x"])):
+                yield self._point(key, i)
+
+    def nearest(self, x, y, k=1, obj_type=None, prop=None):
+        """k objects closest to (x, y) as (distance, point), nearest first"""
+        best = []
+        for key in self.select(obj_type, prop):
+            self._search(key, x, y, k, math.inf, best)
+        return self._results(best)
+
+    def within(self, x, y, radius, obj_type=None, prop=None):
+        """Objects at most radius away from (x, y) as (distance, point), nearest first"""
+        best = []
+        for key in self.select(obj_type, prop):
+            self._search(key, x, y, None, radius * radius, best)
+        return self._results(best)
+
+    def counts(self):
+        """{"type:prop": number of objects}"""
+        return {key: len(tree["x"]) for key, tree in self.trees.items()}
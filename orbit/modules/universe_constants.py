@@ -41,3 +41,33 @@ class UniverseConstants:
     # Resource richness thresholds
     RESOURCE_THRESHOLD_HIGH = 1.0
     RESOURCE_THRESHOLD_LOW = 0.2
+    
+    # Chemical symbols accepted in place of resource names (coal and lignite have none)
+    RESOURCE_SYMBOLS = {
+        ResourceType.IRON: "Fe",
+        ResourceType.COPPER: "Cu",
+        ResourceType.LEAD: "Pb",
+        ResourceType.ZINC: "Zn",
+        ResourceType.NICKEL: "Ni",
+        ResourceType.CHROMIUM: "Cr",
+        ResourceType.BAUXITE: "Al",
+        ResourceType.SILVER: "Ag",
+        ResourceType.GOLD: "Au",
+        ResourceType.BORON: "B",
+        ResourceType.SULFUR: "S",
+        ResourceType.URANIUM: "U",
+        ResourceType.THORIUM: "Th",
+        ResourceType.CARBON: "C",
+        ResourceType.OXYGEN: "O",
+        ResourceType.NITROGEN: "N"
+    }
+    
+    @classmethod
+    def resolve_resource(cls, name):
+        """Resource key ("Gold") of a resource name or symbol, case-insensitive; None if unknown"""
+        wanted = name.lower()
+        for resource_type in ResourceType:
+            symbol = cls.RESOURCE_SYMBOLS.get(resource_type, "")
+            if wanted in (resource_type.value.lower(), symbol.lower()):
+                return resource_type.value
+        return None
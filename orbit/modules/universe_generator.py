@@ -0,0 +1,680 @@
+import json
+import math
+import os
+import random
+from datetime import datetime
+
+from .enums import StarType, BlackHoleClass, PlanetType, ResourceRichness
+from .celestial_objects import Star, BlackHole, Planet, AsteroidBelt
+from .universe_constants import UniverseConstants
+from .universe_stats import StatsManifest
+from .resource_index import ResourceIndex
+from .spatial_index import SpatialIndex
+
+PRESET_SCALES = {
+    "sparse": 2.5,
+    "normal": 1.0,
+    "dense": 0.5,
+    "empty": 10.0
+}
+
+
+def parse_shard(value):
+    """Parse an "i/N" shard specification into (index, count)"""
+    try:
+        index_text, count_text = value.split("/")
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected i/N (e.g. 0/4)")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard '{value}', index must be in 0..{count - 1}")
+    return index, count
+
+
+class UniverseGenerator:
+    """Deterministic universe generator.
+
+    The universe is split into horizontal strips whose height is at least the
+    minimum star spacing (rounded up to whole chunks). Every strip is generated
+    from its own seed, so the result does not depend on how many processes
+    take part:
+
+    - black holes are few and are generated globally by every shard
+    - even strips place their stars independently (they never touch each other)
+    - odd strips place their stars against the stars of both neighbouring even
+      strips, which are regenerated locally as a halo
+    - planets follow the same pattern: even strips keep their planets within
+      half a strip of their own band (discs and overlap clearance included),
+      odd strips keep them inside their band and check them against the
+      planets of both even neighbours
+    """
+
+    def __init__(self, width: int, height: int, preset: str = "normal",
+                 seed: int = None, chunk_size: int = 100, log=None):
+        self.width = width
+        self.height = height
+        self.preset = preset
+        self.preset_scale = PRESET_SCALES.get(preset, 1.0)
+        self.seed = seed if seed is not None else random.randrange(2 ** 31)
+        self.chunk_size = chunk_size
+        self.log = log or (lambda text: None)
+
+        self.area = width * height
+        self.n_stars = self.calculate_star_count(width, height, self.preset_scale)
+        self.D_min = self.calculate_minimum_star_spacing(width, height, self.n_stars)
+
+        # Strip height >= D_min: stars of non-adjacent strips can never conflict
+        self.strip_height = chunk_size * max(1, math.ceil(self.D_min / chunk_size))
+        self.strip_count = max(1, math.ceil(height / self.strip_height))
+        self.strip_star_counts = self.allocate_stars()
+        self.strip_offsets = []
+        offset = 0
+        for count in self.strip_star_counts:
+            self.strip_offsets.append(offset)
+            offset += count
+
+        self._black_holes = None
+        self._strip_stars = {}
+        self._strip_bodies = {}
+
+    # ------------------------------------------------------------------
+    # Sizing
+    # ------------------------------------------------------------------
+
+    def calculate_star_count(self, width: int, height: int, preset_scale: float = 1.0) -> int:
+        """Yıldız sayısını hesapla"""
+        area = width * height
+        S = UniverseConstants.BASE_STAR_DENOMINATOR * preset_scale
+        n_stars = max(UniverseConstants.MIN_STAR_COUNT, round(area / S))
+        return min(n_stars, UniverseConstants.MAX_STAR_COUNT)
+
+    def calculate_minimum_star_spacing(self, width: int, height: int, n_stars: int) -> float:
+        """Minimum yıldız-yıldız mesafesini hesapla"""
+        area = width * height
+        D = math.sqrt(area / n_stars)
+        return UniverseConstants.MIN_STAR_SPACING_FACTOR * D
+
+    def strip_bounds(self, strip: int):
+        """Y range [y0, y1) covered by a strip"""
+        y0 = strip * self.strip_height
+        return y0, min(self.height, y0 + self.strip_height)
+
+    def allocate_stars(self) -> list:
+        """Distribute the star count over strips proportionally to their area"""
+        quotas = []
+        for strip in range(self.strip_count):
+            y0, y1 = self.strip_bounds(strip)
+            quotas.append(self.n_stars * (y1 - y0) / self.height)
+
+        counts = [int(q) for q in quotas]
+        remainder = self.n_stars - sum(counts)
+        by_fraction = sorted(range(self.strip_count), key=lambda s: (-(quotas[s] - counts[s]), s))
+        for strip in by_fraction[:remainder]:
+            counts[strip] += 1
+        return counts
+
+    def shard_strips(self, shard_index: int, shard_count: int) -> range:
+        """Contiguous strip range owned by a shard"""
+        start = shard_index * self.strip_count // shard_count
+        end = (shard_index + 1) * self.strip_count // shard_count
+        return range(start, end)
+
+    def planet_bounds(self, strip: int):
+        """Y range [y0, y1) planets of a strip may occupy; even strips' ranges only touch
+
+        Even strips also keep their planets' discs (with the overlap clearance)
+        inside the range, so planets of two even strips can't overlap either.
+        """
+        y0, y1 = self.strip_bounds(strip)
+        if strip % 2 == 0:
+            margin = self.strip_height // 2
+            return max(0, y0 - margin), min(self.height, y1 + margin)
+        return y0, y1
+
+    def strip_rng(self, strip: int, stage: str) -> random.Random:
+        return random.Random(f"{self.seed}:{stage}:{strip}")
+
+    # ------------------------------------------------------------------
+    # Placement
+    # ------------------------------------------------------------------
+
+    def black_holes(self) -> list:
+        """Karadelikleri yerleştir (tüm shard'larda aynı sonuç)"""
+        if self._black_holes is None:
+            self._black_holes = self.place_black_holes(random.Random(f"{self.seed}:black_holes"))
+        return self._black_holes
+
+    def place_black_holes(self, rng: random.Random, max_attempts: int = 5000) -> list:
+        """Karadelikleri yerleştir"""
+        n_bh = max(0, round(self.area / UniverseConstants.BH_DENOMINATOR))
+        black_holes = []
+
+        for i in range(n_bh):
+            for attempt in range(max_attempts):
+                x = rng.uniform(0, self.width)
+                y = rng.uniform(0, self.height)
+
+                # Karadelik sınıfını seç
+                bh_class = rng.choices(
+                    [BlackHoleClass.STELLAR, BlackHoleClass.INTERMEDIATE, BlackHoleClass.SUPERMASSIVE],
+                    weights=[85, 14, 1]
+                )[0]
+
+                bh = BlackHole(x, y, bh_class, len(black_holes))
+
+                # Mevcut karadeliklerle çakışma kontrolü
+                collision = False
+                for existing_bh in black_holes:
+                    distance = math.hypot(x - existing_bh.x, y - existing_bh.y)
+                    if distance < (bh.R_excl + existing_bh.R_excl):
+                        collision = True
+                        break
+
+                if not collision:
+                    black_holes.append(bh)
+                    break
+
+        return black_holes
+
+    def stars_for_strip(self, strip: int) -> list:
+        """Stars of a strip; odd strips see their even neighbours as a halo"""
+        if strip < 0 or strip >= self.strip_count:
+            return []
+        if strip not in self._strip_stars:
+            halo = []
+            if strip % 2 == 1:
+                halo = self.stars_for_strip(strip - 1) + self.stars_for_strip(strip + 1)
+            self._strip_stars[strip] = self.place_stars(strip, halo)
+        return self._strip_stars[strip]
+
+    def place_stars(self, strip: int, halo: list, max_attempts_per_star: int = 2000) -> list:
+        """Yıldızları yerleştir"""
+        rng = self.strip_rng(strip, "stars")
+        y0, y1 = self.strip_bounds(strip)
+        black_holes = self.black_holes()
+        D_min = self.D_min
+
+        # D_min boyutlu hücrelerde komşuluk araması
+        grid = {}
+
+        def add_to_grid(star):
+            key = (int(star.x // D_min), int(star.y // D_min))
+            grid.setdefault(key, []).append(star)
+
+        for star in halo:
+            add_to_grid(star)
+
+        stars = []
+        for i in range(self.strip_star_counts[strip]):
+            for attempt in range(max_attempts_per_star):
+                x = rng.uniform(0, self.width)
+                y = rng.uniform(y0, y1)
+
+                # Karadelik dışlama alanı kontrolü
+                collision = False
+                for bh in black_holes:
+                    if math.hypot(x - bh.x, y - bh.y) < bh.R_excl:
+                        collision = True
+                        break
+
+                if collision:
+                    continue
+
+                # Yıldız-yıldız mesafe kontrolü
+                cell_x, cell_y = int(x // D_min), int(y // D_min)
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        for star in grid.get((cell_x + dx, cell_y + dy), ()):
+                            if math.hypot(x - star.x, y - star.y) < D_min:
+                                collision = True
+                                break
+                        if collision:
+                            break
+                    if collision:
+                        break
+
+                if collision:
+                    continue
+
+                # Yıldız türünü seç
+                star_type = rng.choices(
+                    [StarType.M, StarType.K, StarType.G, StarType.HOT],
+                    weights=[70, 15, 8, 7]
+                )[0]
+
+                # Yıldız yarıçapı
+                star_radius = {"M": 5, "K": 7, "G": 9, "Hot": 12}[star_type.value]
+
+                star = Star(x, y, star_type, star_radius, self.strip_offsets[strip] + len(stars))
+                stars.append(star)
+                add_to_grid(star)
+                break
+
+        return stars
+
+    def place_planets_for_star(self, star: Star, existing: "_ObjectGrid", rng: random.Random,
+                               y_range: tuple, mean_planets: float = UniverseConstants.PLANET_MEAN_PER_STAR,
+                               keep_clear: bool = False) -> list:
+        """Yıldız için gezegenleri yerleştir
+
+        keep_clear: gezegen diski çakışma payıyla birlikte y_range içinde kalır
+        (evren kenarları hariç)
+        """
+        planets = []
+
+        # Poisson dağılımı ile gezegen sayısı
+        n_planets = max(0, int(rng.gauss(mean_planets, 1)))
+        n_planets = min(n_planets, 20)  # Maksimum sınır
+
+        if n_planets == 0:
+            return planets
+
+        # İlk yörünge yarıçapı
+        a = max(star.radius * 1.5, 8)
+
+        for i in range(n_planets):
+            # Yörünge yarıçapını artır
+            a = a * rng.uniform(*UniverseConstants.PLANET_ORBIT_RATIO_RANGE)
+
+            # Yörünge açısı
+            theta = rng.uniform(0, 2 * math.pi)
+
+            # Gezegen konumu
+            px = star.x + a * math.cos(theta)
+            py = star.y + a * math.sin(theta)
+
+            # Sınır kontrolü
+            if px < 0 or px >= self.width or not y_range[0] <= py < y_range[1]:
+                continue
+
+            # Gezegen yarıçapı tahmini
+            planet_radius = max(1, int(a ** 0.3))
+
+            # Komşu olmayan şeritlerin gezegenleri birbirine karşı kontrol edilmez -
+            # aralıklarının ortak sınırından çakışma payı kadar uzak durulur
+            reach = planet_radius * _ObjectGrid.CLEARANCE
+            if keep_clear and ((y_range[0] > 0 and py - reach < y_range[0]) or
+                               (y_range[1] < self.height and py + reach >= y_range[1])):
+                continue
+
+            # Çakışma kontrolü
+            if existing.collides(px, py, planet_radius):
+                continue
+
+            # Gezegen türünü belirle (mesafeye göre)
+            if a < 50:
+                planet_type = PlanetType.ROCKY
+            elif a > 200:
+                planet_type = PlanetType.GAS
+            else:
+                planet_type = PlanetType.ICE
+
+            planet = Planet(px, py, a, theta, planet_type, planet_radius,
+                            star.star_id, len(planets))
+            planets.append(planet)
+
+        # Mevcut objeleri güncelle
+        for planet in planets:
+            existing.add(planet)
+
+        return planets
+
+    def create_asteroid_belt(self, star: Star, planets: list, belt_id: int,
+                             rng: random.Random) -> AsteroidBelt:
+        """Asteroid kuşağı oluştur"""
+        # Kuşak merkez yarıçapı (gezegen yörüngeleri arasında)
+        if len(planets) >= 2:
+            # İkinci ve üçüncü gezegen arası
+            orbit_radii = sorted(p.orbit_radius for p in planets)
+            a_belt = rng.uniform(orbit_radii[1], orbit_radii[2] if len(orbit_radii) > 2 else orbit_radii[1] * 1.5)
+        else:
+            # Gezegen yoksa varsayılan mesafe
+            a_belt = star.radius * rng.uniform(3, 8)
+
+        # Kuşak genişliği
+        width = rng.uniform(10, 100)
+
+        return AsteroidBelt(star.star_id, a_belt, width, belt_id,
+                            fragment_count=rng.randint(20, 200))
+
+    def assign_resources(self, body, body_type: str, rng: random.Random) -> dict:
+        """Gök cismine kaynak ataması yap - Rastgele kaynak seçimi"""
+        resources = {}
+
+        # Kütle faktörü - radius özelliği varsa kullan, yoksa varsayılan değer
+        if hasattr(body, 'radius'):
+            mass_factor = max(0.5, body.radius / 5.0)
+        else:
+            mass_factor = 1.0  # Varsayılan kütle faktörü
+
+        # Mesafe faktörü
+        distance_factor = 1.0
+        if body_type == "asteroid":
+            distance_factor = 1.5
+        elif hasattr(body, 'prop') and body.prop == "gas":
+            distance_factor = 0.2
+
+        # Rastgele kaynak sayısı (3-8 arası)
+        num_resources = rng.randint(3, 8)
+
+        # Mevcut kaynak türlerini rastgele seç
+        available_resources = list(UniverseConstants.BASE_RESOURCE_ABUNDANCE.keys())
+        selected_resources = rng.sample(available_resources, min(num_resources, len(available_resources)))
+
+        # Seçilen kaynaklar için hesaplama
+        for resource_type in selected_resources:
+            base_val = UniverseConstants.BASE_RESOURCE_ABUNDANCE[resource_type][body_type]
+            score = base_val * mass_factor * distance_factor * rng.uniform(0.7, 1.3)
+
+            # Zenginlik sınıflandırması
+            if score > UniverseConstants.RESOURCE_THRESHOLD_HIGH:
+                richness = ResourceRichness.RICH
+            elif score > UniverseConstants.RESOURCE_THRESHOLD_LOW:
+                richness = ResourceRichness.NORMAL
+            else:
+                richness = ResourceRichness.POOR
+
+            resources[resource_type.value] = {
+                "score": score,
+                "richness": richness.value
+            }
+
+        return resources
+
+    def generate_strip(self, strip: int) -> dict:
+        """Generate every body that belongs to a strip"""
+        if strip in self._strip_bodies:
+            return self._strip_bodies[strip]
+
+        stars = self.stars_for_strip(strip)
+        y0, y1 = self.strip_bounds(strip)
+        black_holes = [bh for bh in self.black_holes() if y0 <= bh.y < y1]
+
+        existing = _ObjectGrid(self.chunk_size)
+        for obj in self.black_holes():
+            existing.add(obj)
+        for neighbour in (strip - 1, strip, strip + 1):
+            for star in self.stars_for_strip(neighbour):
+                existing.add(star)
+
+        # Tek şeritler komşu çift şeritlerin gezegenlerini halo olarak görür
+        if strip % 2 == 1:
+            for neighbour in (strip - 1, strip + 1):
+                if 0 <= neighbour < self.strip_count:
+                    for planet in self.generate_strip(neighbour)["planets"]:
+                        existing.add(planet)
+
+        rng = self.strip_rng(strip, "bodies")
+        y_range = self.planet_bounds(strip)
+        planets = []
+        belts = []
+        for star in stars:
+            star_planets = self.place_planets_for_star(star, existing, rng, y_range,
+                                                       keep_clear=strip % 2 == 0)
+            star.planets = star_planets
+            planets.extend(star_planets)
+
+            # Kaynak ataması
+            for planet in star_planets:
+                planet.resources = self.assign_resources(planet, "planet", rng)
+
+            # Asteroid kuşağı oluştur
+            if rng.random() < UniverseConstants.ASTEROID_BELT_PROB:
+                belt = self.create_asteroid_belt(star, star_planets, self.strip_offsets[strip] + len(belts), rng)
+                belt.resource_pool = self.assign_resources(belt, "asteroid", rng)
+                star.asteroid_belts = [belt]
+                belts.append(belt)
+
+        self._strip_bodies[strip] = {
+            "stars": stars,
+            "black_holes": black_holes,
+            "planets": planets,
+            "asteroid_belts": belts
+        }
+        return self._strip_bodies[strip]
+
+    # ------------------------------------------------------------------
+    # Chunk records
+    # ------------------------------------------------------------------
+
+    def strip_records(self, bodies: dict) -> list:
+        """Chunk records (dicts) of a generated strip, in file order"""
+        records = []
+        stars_by_id = {}
+
+        for star in bodies["stars"]:
+            stars_by_id[star.star_id] = star
+            records.append({
+                "x": int(star.x),
+                "y": int(star.y),
+                "type": "sun",
+                "name": f"star_{int(star.x)}_{int(star.y)}",
+                "prop": star.star_type.value,
+                "radius": star.radius
+            })
+
+        for bh in bodies["black_holes"]:
+            records.append({
+                "x": int(bh.x),
+                "y": int(bh.y),
+                "type": "black_hole",
+                "name": f"blackhole_{int(bh.x)}_{int(bh.y)}",
+                "prop": bh.bh_class.value,
+                "R_infl": bh.R_infl,
+                "R_excl": bh.R_excl
+            })
+
+        for planet in bodies["planets"]:
+            records.append({
+                "x": int(planet.x),
+                "y": int(planet.y),
+                "type": "planet",
+                "name": f"planet_{int(planet.x)}_{int(planet.y)}",
+                "prop": planet.planet_type.value,
+                "radius": planet.radius,
+                "orbit_radius": planet.orbit_radius,
+                "star_id": planet.star_id,
+                "resources": planet.resources
+            })
+
+        for belt in bodies["asteroid_belts"]:
+            star = stars_by_id[belt.star_id]
+            records.append({
+                "x": int(star.x),
+                "y": int(star.y),
+                "type": "asteroid_belt",
+                "name": f"belt_{int(star.x)}_{int(star.y)}_{belt.belt_id}",
+                "center_radius": belt.center_radius,
+                "width": belt.width,
+                "fragment_count": belt.fragment_count,
+                "belt_id": belt.belt_id,
+                "star_id": belt.star_id,
+                "resource_pool": belt.resource_pool
+            })
+
+        return records
+
+    def generate(self, shard_index: int = 0, shard_count: int = 1) -> dict:
+        """Generate the strips owned by a shard (the whole universe by default)"""
+        strips = self.shard_strips(shard_index, shard_count)
+
+        self.log(f"Yıldız sayısı: {self.n_stars}")
+        self.log(f"Minimum yıldız mesafesi: {self.D_min:.1f}")
+        if shard_count > 1:
+            self.log(f"Shard {shard_index}/{shard_count}: şerit {strips.start}-{strips.stop - 1} "
+                     f"(toplam {self.strip_count})")
+
+        result = {
+            "stars": [],
+            "black_holes": [],
+            "planets": [],
+            "asteroid_belts": [],
+            "chunk_objects": {}
+        }
+
+        for strip in strips:
+            bodies = self.generate_strip(strip)
+            for key in ("stars", "black_holes", "planets", "asteroid_belts"):
+                result[key].extend(bodies[key])
+
+            for record in self.strip_records(bodies):
+                chunk_coord = (record["x"] // self.chunk_size, record["y"] // self.chunk_size)
+                result["chunk_objects"].setdefault(chunk_coord, []).append(record)
+
+        self.log(f"Yerleştirilen karadelik sayısı: {len(result['black_holes'])}")
+        self.log(f"Yerleştirilen yıldız sayısı: {len(result['stars'])}")
+        self.log(f"Yerleştirilen gezegen sayısı: {len(result['planets'])}")
+        self.log(f"Yerleştirilen asteroid kuşağı sayısı: {len(result['asteroid_belts'])}")
+
+        result["statistics"] = {
+            "stars": len(result["stars"]),
+            "black_holes": len(result["black_holes"]),
+            "planets": len(result["planets"]),
+            "asteroid_belts": len(result["asteroid_belts"])
+        }
+        return result
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def metadata(self, name: str, statistics: dict) -> dict:
+        return {
+            "name": name,
+            "size": self.width,
+            "chunk_size": self.chunk_size,
+            "created": datetime.now().isoformat(),
+            "preset": self.preset,
+            "seed": self.seed,
+            "statistics": statistics
+        }
+
+    @staticmethod
+    def write_chunks(output_dir: str, chunk_objects: dict):
+        """Write chunk files and their stats manifest, resource and spatial indexes"""
+        for (chunk_x, chunk_y), objects in chunk_objects.items():
+            chunk_file = os.path.join(output_dir, f"chunk_{chunk_x}_{chunk_y}.json")
+            with open(chunk_file, 'w', encoding='utf-8') as f:
+                json.dump(objects, f, indent=2, ensure_ascii=False)
+        StatsManifest.build(chunk_objects).save(output_dir)
+        ResourceIndex.build(chunk_objects).save(output_dir)
+        SpatialIndex.build(chunk_objects).save(output_dir)
+
+    def write_universe(self, name: str, output_dir: str) -> dict:
+        """Generate the whole universe into output_dir (metadata + chunks)"""
+        result = self.generate()
+        os.makedirs(output_dir, exist_ok=True)
+
+        with open(os.path.join(output_dir, "metadata.json"), 'w', encoding='utf-8') as f:
+            json.dump(self.metadata(name, result["statistics"]), f, indent=2, ensure_ascii=False)
+
+        self.write_chunks(output_dir, result["chunk_objects"])
+        return result
+
+    def write_shard(self, name: str, shard_index: int, shard_count: int, output_dir: str) -> dict:
+        """Generate one shard into its own directory (shard.json + chunks)"""
+        result = self.generate(shard_index, shard_count)
+        os.makedirs(output_dir, exist_ok=True)
+        self.write_chunks(output_dir, result["chunk_objects"])
+
+        strips = self.shard_strips(shard_index, shard_count)
+        manifest = self.metadata(name, result["statistics"])
+        manifest.update({
+            "shard_index": shard_index,
+            "shard_count": shard_count,
+            "strips": [strips.start, strips.stop],
+            "chunks": [[x, y, len(objects)] for (x, y), objects in sorted(result["chunk_objects"].items())]
+        })
+        with open(os.path.join(output_dir, "shard.json"), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        return result
+
+    @staticmethod
+    def merge_shards(shard_dirs: list, output_dir: str) -> dict:
+        """Validate shard directories and assemble them into one universe"""
+        manifests = []
+        for shard_dir in shard_dirs:
+            manifest_path = os.path.join(shard_dir, "shard.json")
+            if not os.path.exists(manifest_path):
+                raise ValueError(f"shard.json not found in {shard_dir}")
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifests.append((json.load(f), shard_dir))
+
+        if not manifests:
+            raise ValueError("No shards to merge")
+
+        first = manifests[0][0]
+        for key in ("name", "size", "chunk_size", "preset", "seed", "shard_count"):
+            values = {manifest[key] for manifest, _ in manifests}
+            if len(values) > 1:
+                raise ValueError(f"Shards disagree on '{key}': {sorted(values, key=str)}")
+
+        shard_count = first["shard_count"]
+        indices = sorted(manifest["shard_index"] for manifest, _ in manifests)
+        if indices != list(range(shard_count)):
+            missing = sorted(set(range(shard_count)) - set(indices))
+            raise ValueError(f"Expected shards 0..{shard_count - 1}, missing {missing}, got {indices}")
+
+        size = first["size"]
+        chunk_objects = {}
+        names = set()
+        statistics = {}
+        for manifest, shard_dir in sorted(manifests, key=lambda item: item[0]["shard_index"]):
+            for chunk_x, chunk_y, count in manifest["chunks"]:
+                chunk_file = os.path.join(shard_dir, f"chunk_{chunk_x}_{chunk_y}.json")
+                with open(chunk_file, 'r', encoding='utf-8') as f:
+                    objects = json.load(f)
+                if len(objects) != count:
+                    raise ValueError(f"{chunk_file}: expected {count} objects, found {len(objects)}")
+                for obj in objects:
+                    if not (0 <= obj["x"] < size and 0 <= obj["y"] < size):
+                        raise ValueError(f"{chunk_file}: {obj['name']} is outside the universe")
+                    if obj["name"] in names:
+                        raise ValueError(f"Duplicate object '{obj['name']}' in {chunk_file}")
+                    names.add(obj["name"])
+                chunk_objects.setdefault((chunk_x, chunk_y), []).extend(objects)
+
+            for key, value in manifest["statistics"].items():
+                statistics[key] = statistics.get(key, 0) + value
+
+        os.makedirs(output_dir, exist_ok=True)
+        UniverseGenerator.write_chunks(output_dir, chunk_objects)
+
+        metadata = {
+            "name": first["name"],
+            "size": size,
+            "chunk_size": first["chunk_size"],
+            "created": datetime.now().isoformat(),
+            "preset": first["preset"],
+            "seed": first["seed"],
+            "shards": shard_count,
+            "statistics": statistics
+        }
+        with open(os.path.join(output_dir, "metadata.json"), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
+
+        return {"metadata": metadata, "chunk_objects": chunk_objects}
+
+
+class _ObjectGrid:
+    """Uniform grid used for the planet overlap checks during generation"""
+
+    CLEARANCE = 1.2  # Bodies must be this many times their summed radii apart
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def add(self, obj):
+        key = (int(obj.x // self.cell_size), int(obj.y // self.cell_size))
+        self.cells.setdefault(key, []).append(obj)
+
+    def collides(self, x: float, y: float, radius: float) -> bool:
+        cell_x, cell_y = int(x // self.cell_size), int(y // self.cell_size)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for obj in self.cells.get((cell_x + dx, cell_y + dy), ()):
+                    obj_radius = getattr(obj, 'radius', 0)
+                    if math.hypot(x - obj.x, y - obj.y) < (radius + obj_radius) * self.CLEARANCE:
+                        return True
+        return False
@@ -0,0 +1,113 @@
+"""Object count summaries of chunks and whole universes.
+
+A summary is a plain dict of counters, so it can be written to JSON as is:
+
+    {"objects": n, "types": {...}, "props": {...}, "resources": {...}, "richness": {...}}
+
+types/props are keyed like the catalog ('unknown' when missing), resources
+by the resource key of the object's "resources" map and richness by the
+richness label of each of those resources.
+"""
+
+import os
+import json
+
+SUMMARY_KEYS = ("types", "props", "resources", "richness")
+
+
+def empty_summary():
+    summary = {key: {} for key in SUMMARY_KEYS}
+    summary["objects"] = 0
+    return summary
+
+
+def summarize_objects(objects):
+    """Counts of one chunk's (or any list of) object records"""
+    summary = empty_summary()
+    types, props = summary["types"], summary["props"]
+    resources, richness = summary["resources"], summary["richness"]
+
+    for obj in objects:
+        summary["objects"] += 1
+        obj_type = obj.get('type') or 'unknown'
+        prop = obj.get('prop') or 'unknown'
+        types[obj_type] = types.get(obj_type, 0) + 1
+        props[prop] = props.get(prop, 0) + 1
+        for resource, data in (obj.get('resources') or {}).items():
+            resources[resource] = resources.get(resource, 0) + 1
+            if isinstance(data, dict) and data.get('richness'):
+                label = data['richness']
+                richness[label] = richness.get(label, 0) + 1
+    return summary
+
+
+def add_summary(total, summary, sign=1):
+    """Add (sign=1) or subtract (sign=-1) summary into total in place"""
+    total["objects"] = total.get("objects", 0) + sign * summary.get("objects", 0)
+    for key in SUMMARY_KEYS:
+        counts = total.setdefault(key, {})
+        for name, count in summary.get(key, {}).items():
+            value = counts.get(name, 0) + sign * count
+            if value:
+                counts[name] = value
+            else:
+                counts.pop(name, None)
+    return total
+
+
+class StatsManifest:
+    """stats.json of a chunk-based universe: per-chunk and global summaries.
+
+    Written next to the chunk files when they are generated, and updated
+    through update_chunk whenever a chunk file is rewritten, so universe
+    totals never require reading the chunks.
+    """
+
+    FILE_NAME = "stats.json"
+
+    def __init__(self, chunks=None, total=None):
+        self.chunks = chunks or {}
+        self.total = total or empty_summary()
+
+    @staticmethod
+    def chunk_key(chunk_x, chunk_y):
+        return f"{chunk_x}_{chunk_y}"
+
+    @classmethod
+    def build(cls, chunk_objects):
+        """Manifest of {(chunk_x, chunk_y): objects}"""
+        manifest = cls()
+        for (chunk_x, chunk_y), objects in sorted(chunk_objects.items()):
+            manifest.update_chunk(chunk_x, chunk_y, objects)
+        return manifest
+
+    @classmethod
+    def load(cls, directory):
+        """Manifest of a universe directory, or None if it has none"""
+        path = os.path.join(directory, cls.FILE_NAME)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get("chunks"), data.get("total"))
+
+    def save(self, directory):
+        path = os.path.join(directory, self.FILE_NAME)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"total": self.total, "chunks": self.chunks}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def update_chunk(self, chunk_x, chunk_y, objects):
+        """Replace one chunk's summary and adjust the totals"""
+        key = self.chunk_key(chunk_x, chunk_y)
+        previous = self.chunks.pop(key, None)
+        if previous is not None:
+            add_summary(self.total, previous, -1)
+        if objects:
+            summary = summarize_objects(objects)
+            self.chunks[key] = summary
+            add_summary(self.total, summary)
+
+    def chunk_summary(self, chunk_x, chunk_y):
+        return self.chunks.get(self.chunk_key(chunk_x, chunk_y)) or empty_summary()
@@ -0,0 +1,54 @@
+import json
+import os
+import random
+
+import pytest
+
+from orbit.modules.chunk_manager import ChunkManager
+
+RESOURCES = ["Iron", "Gold", "Copper", "Uranium", "Silver"]
+RICHNESS = ["poor", "normal", "rich"]
+
+
+def make_objects(seed=1, size=1000, count=400):
+    """Synthetic chunk records: suns, planets, belts and a black hole with resources"""
+    rng = random.Random(seed)
+    objects = []
+    for i in range(count):
+        x, y = rng.randrange(size), rng.randrange(size)
+        kind = rng.choice(["sun", "planet", "planet", "asteroid_belt"])
+        obj = {"x": x, "y": y, "type": kind, "name": f"{kind}_{i}"}
+        if kind == "sun":
+            obj.update(prop=rng.choice(["G", "K", "M"]), radius=rng.randint(2, 6))
+        elif kind == "planet":
+            obj.update(prop=rng.choice(["rocky", "ice", "gas"]), radius=rng.randint(1, 4))
+        else:
+            obj.update(center_radius=rng.randint(20, 60), width=rng.randint(5, 20), fragment_count=30, belt_id=i)
+        if kind != "sun":
+            resources = {resource: {"score": round(rng.uniform(0, 10), 3), "richness": rng.choice(RICHNESS)}
+                         for resource in rng.sample(RESOURCES, rng.randint(1, 3))}
+            obj["resources" if kind == "planet" else "resource_pool"] = resources
+        objects.append(obj)
+    objects.append({"x": size // 2, "y": size // 2, "type": "black_hole", "name": "bh_0", "prop": "stellar"})
+    return objects
+
+
+def write_universe(name, objects, chunk_size=100):
+    """Write records as chunk files under universes/<name> (relative to the working directory)"""
+    chunks = {}
+    for obj in objects:
+        chunks.setdefault((obj["x"] // chunk_size, obj["y"] // chunk_size), []).append(obj)
+    os.makedirs(f"universes/{name}", exist_ok=True)
+    for (chunk_x, chunk_y), chunk_objects in chunks.items():
+        with open(f"universes/{name}/chunk_{chunk_x}_{chunk_y}.json", 'w', encoding='utf-8') as f:
+            json.dump(chunk_objects, f)
+    return chunks
+
+
+@pytest.fixture
+def universe(tmp_path, monkeypatch):
+    """(chunk manager, universe name, records) of a synthetic chunk-based universe in a temp directory"""
+    monkeypatch.chdir(tmp_path)
+    objects = make_objects()
+    write_universe("test", objects)
+    return ChunkManager(1000), "test", objects
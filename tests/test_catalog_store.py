@@ -0,0 +1,48 @@
+import json
+
+from orbit.modules.catalog_store import CatalogStore
+
+
+def entry(name, obj_type="planet"):
+    return {"name": name, "type": obj_type, "x": 1, "y": 2, "prop": "rocky", "resources": {}}
+
+
+def test_torn_journal_line_is_dropped_and_later_appends_survive(tmp_path):
+    store = CatalogStore(str(tmp_path)).load()
+    store.extend([entry("a"), entry("b")])
+    # A write interrupted halfway through the third record
+    line = json.dumps({"op": "add", "entry": entry("c")})
+    with open(store.journal_path, 'a', encoding='utf-8') as f:
+        f.write(line[:len(line) // 2])
+
+    store = CatalogStore(str(tmp_path)).load()
+    assert [e["name"] for e in store.entries] == ["a", "b"]
+    assert store.journal_length == 2
+
+    store.add(entry("d"))
+    store = CatalogStore(str(tmp_path)).load()
+    assert [e["name"] for e in store.entries] == ["a", "b", "d"]
+    with open(store.journal_path, encoding='utf-8') as f:
+        assert all(json.loads(line) for line in f)
+
+
+def test_remove_is_replayed_from_the_journal(tmp_path):
+    store = CatalogStore(str(tmp_path)).load()
+    store.extend([entry("a"), entry("b", "sun"), entry("a")])
+    assert store.remove("a") == 2
+    assert store.remove("missing") == 0
+
+    store = CatalogStore(str(tmp_path)).load()
+    assert [e["name"] for e in store.entries] == ["b"]
+    assert "a" not in store
+    assert store.index.counts('by_type') == {"sun": 1}
+
+
+def test_compaction_keeps_the_catalog(tmp_path):
+    store = CatalogStore(str(tmp_path), compact_every=3).load()
+    for name in "abcd":
+        store.add(entry(name))
+    assert store.journal_length == 1  # Folded into the snapshot after the third add
+
+    store = CatalogStore(str(tmp_path)).load()
+    assert [e["name"] for e in store.entries] == ["a", "b", "c", "d"]
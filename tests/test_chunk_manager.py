@@ -0,0 +1,94 @@
+from orbit.modules.chunk_manager import ChunkManager
+from orbit.modules.resource_index import ResourceIndex
+from orbit.modules.spatial_index import SpatialIndex
+from orbit.modules.universe_stats import StatsManifest
+
+from conftest import RESOURCES
+
+
+def count_reads(manager):
+    """Record the chunks load_chunk installs (reads from disk or takes from the prefetcher)"""
+    reads = []
+    install = manager._install_chunk
+
+    def counting_install(chunk_x, chunk_y, chunk_data):
+        reads.append((chunk_x, chunk_y))
+        return install(chunk_x, chunk_y, chunk_data)
+
+    manager._install_chunk = counting_install
+    return reads
+
+
+def draw_view(manager, name, ship_x, ship_y, half=25):
+    """Rasters of the chunks under a matrix centred on the ship, as the game draws them"""
+    manager.unload_distant_chunks(ship_x, ship_y)
+    size = manager.chunk_size
+    for chunk_x in range((ship_x - half) // size, (ship_x + half) // size + 1):
+        for chunk_y in range((ship_y - half) // size, (ship_y + half) // size + 1):
+            manager.get_raster(chunk_x, chunk_y, name)
+
+
+def test_moving_across_chunks_reads_each_chunk_once(universe):
+    manager, name, _ = universe
+    reads = count_reads(manager)
+    # Rasters of the chunks under the view need chunks up to three away from the ship's chunk
+    for ship_x in range(430, 700):
+        draw_view(manager, name, ship_x, 450)
+    assert max(x for x, _ in reads) == 9
+    assert len(reads) == len(set(reads))
+
+
+def test_unload_keeps_chunk_data_one_raster_reach_beyond_the_rasters(universe):
+    manager, name, _ = universe
+    draw_view(manager, name, 490, 450)
+    manager.unload_distant_chunks(950, 950)
+    reach = -(-manager.max_object_reach // manager.chunk_size)
+    assert all(max(abs(x - 9), abs(y - 9)) <= 2 for x, y in manager.rasters)
+    assert all(max(abs(x - 9), abs(y - 9)) <= 2 + reach for x, y in manager.loaded_chunks)
+    assert manager.loaded_summary["objects"] == sum(
+        manager.chunk_summaries[coord]["objects"] for coord in manager.loaded_chunks)
+
+
+def test_save_chunk_keeps_summaries_and_indexes_equal_to_a_rebuild(universe):
+    manager, name, objects = universe
+    chunks = {}
+    for obj in objects:
+        chunks.setdefault((obj["x"] // 100, obj["y"] // 100), []).append(obj)
+    # Indexes built from the original files, the chunk and a neighbour's raster cached
+    manager.get_stats(name), manager.get_resource_index(name), manager.get_spatial_index(name)
+    draw_view(manager, name, 550, 550)
+
+    old = chunks[(5, 5)]
+    new = [dict(obj, x=obj["x"] + 1) for obj in old[1:]] + [{
+        "x": 599, "y": 540, "type": "planet", "name": "planet_new", "prop": "ice", "radius": 3,
+        "resources": {"Gold": {"score": 9.999, "richness": "rich"}}}]
+    chunks[(5, 5)] = new
+    manager.save_chunk(5, 5, new, name)
+
+    assert manager.chunks[(5, 5)] is new
+    assert manager.loaded_summary == StatsManifest.build(
+        {coord: chunks.get(coord, []) for coord in manager.loaded_chunks}).total
+    assert manager.get_raster(6, 5, name).object_at(601, 540)["name"] == "planet_new"
+
+    rebuilt_stats, rebuilt_resources, rebuilt_spatial = (
+        StatsManifest.build(chunks), ResourceIndex.build(chunks), SpatialIndex.build(chunks))
+    for fresh in (manager, ChunkManager(1000)):
+        # The cached copies and the rewritten files both match a rebuild
+        assert fresh.get_stats(name).total == rebuilt_stats.total
+        resources = fresh.get_resource_index(name)
+        for resource in RESOURCES:
+            assert resources.top(resource, 1000) == rebuilt_resources.top(resource, 1000)
+        spatial = fresh.get_spatial_index(name)
+        assert spatial.counts() == rebuilt_spatial.counts()
+        assert sorted(point["name"] for point in spatial.iter_points()) == sorted(
+            point["name"] for point in rebuilt_spatial.iter_points())
+
+
+def test_forget_universe_files_drops_coordinate_caches(universe):
+    manager, name, _ = universe
+    draw_view(manager, name, 550, 550)
+    manager.get_stats(name)
+    manager.forget_universe_files(name)
+    assert not (manager.chunks or manager.loaded_chunks or manager.rasters or manager.chunk_summaries)
+    assert manager.loaded_summary["objects"] == 0
+    assert name not in manager.stats_manifests
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from orbit import SpaceGamePygame
+
+
+@pytest.fixture
+def game(tmp_path, monkeypatch):
+    """Game with a small generated universe loaded, run in a temp directory"""
+    monkeypatch.chdir(tmp_path)
+    game = SpaceGamePygame()
+    game.process_command("universe --name test --size 200")
+    assert game.ship is not None
+    return game
+
+
+def console_after(game, command):
+    """Console lines a command prints (after the echoed command line)"""
+    start = len(game.console_lines)
+    game.process_command(command)
+    return [line[0] for line in game.console_lines[start + 1:]]
+
+
+def test_timewarp_sets_the_multiplier(game):
+    lines = console_after(game, "timewarp 10")
+    assert game.time_warp == 10
+    assert len(lines) == 1 and lines[0].startswith("Zaman çarpanı: x10 (")
+
+
+def test_timewarp_without_argument_shows_usage(game):
+    lines = console_after(game, "tw")
+    assert lines == ["Zaman çarpanı: x1", "Kullanım: timewarp <çarpan> (0.1-1000, örn: timewarp 10)"]
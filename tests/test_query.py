@@ -0,0 +1,151 @@
+import math
+
+import pytest
+
+from orbit.modules.query import Query, _RecordReader
+
+ORIGIN = (500, 500)
+
+
+def run(universe, text):
+    manager, name, _ = universe
+    plan, rows = Query.parse(text.split()).execute(manager, name, *ORIGIN)
+    return plan, list(rows)
+
+
+def distance(obj):
+    return math.hypot(obj["x"] - ORIGIN[0], obj["y"] - ORIGIN[1])
+
+
+@pytest.mark.parametrize("text, message", [
+    ("foo", "Anlaşılamayan terim"),
+    ("within", "için değer gerekli"),
+    ("limit x", "Geçersiz sayı"),
+    ("limit 0", "pozitif olmalı"),
+    ("within -5", "pozitif olmalı"),
+    ("res=Unobtainium", "Bilinmeyen kaynak"),
+    ("sort score", "res=<kaynak> gerekli"),
+])
+def test_parse_errors(text, message):
+    with pytest.raises(ValueError, match=message):
+        Query.parse(text.split())
+
+
+def test_parse_aliases_and_slots():
+    query = Query.parse("type=star res=Au prop=G type=planet radius>=3".split())
+    assert query.obj_type == "sun"
+    assert query.resource == "Gold"
+    assert query.prop == "G"
+    # Only the first equality of an indexed field fills its slot
+    assert ("type", "=", "planet") in query.predicates
+    assert ("radius", ">=", "3") in query.predicates
+
+
+@pytest.mark.parametrize("text, source", [
+    ("res=Gold", "kaynak indeksi"),
+    ("res=Gold type=planet within 200", "kaynak indeksi"),
+    ("type=planet", "uzamsal indeks"),
+    ("within 150", "uzamsal indeks"),
+    ("sort distance limit 3", "uzamsal indeks"),
+    ("radius>2", "chunk taraması"),
+    ("name=sun_1", "chunk taraması"),
+])
+def test_source_choice(universe, text, source):
+    plan, _ = run(universe, text)
+    assert plan.startswith(source)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("type=planet prop=rocky", lambda o: o["type"] == "planet" and o.get("prop") == "rocky"),
+    ("type=planet within 250 radius>2", lambda o: o["type"] == "planet" and distance(o) <= 250 and o["radius"] > 2),
+    ("radius<=2 type!=planet", lambda o: "radius" in o and o["radius"] <= 2 and o["type"] != "planet"),
+    ("res=Gold richness=rich", lambda o: (o.get("resources") or o.get("resource_pool") or {})
+        .get("Gold", {}).get("richness") == "rich"),
+    ("res=Iron type=asteroid_belt within 400", lambda o: o["type"] == "asteroid_belt" and distance(o) <= 400
+        and "Iron" in o["resource_pool"]),
+    ("prop=G res!=Gold", lambda o: o.get("prop") == "G"),
+])
+def test_results_match_brute_force(universe, text, expected):
+    _, rows = run(universe, text)
+    _, _, objects = universe
+    assert sorted(row["name"] for row in rows) == sorted(o["name"] for o in objects if expected(o))
+
+
+def test_sort_orders(universe):
+    _, _, objects = universe
+    suns = [o for o in objects if o["type"] == "sun"]
+
+    _, rows = run(universe, "type=sun sort radius")
+    assert [row["record"]["radius"] for row in rows] == sorted(o["radius"] for o in suns)
+
+    _, rows = run(universe, "type=sun sort -radius")
+    assert [row["record"]["radius"] for row in rows] == sorted((o["radius"] for o in suns), reverse=True)
+
+    _, rows = run(universe, "type=planet sort distance")
+    distances = [row["distance"] for row in rows]
+    assert distances == sorted(distances)
+
+    _, rows = run(universe, "type=planet sort -distance")
+    distances = [row["distance"] for row in rows]
+    assert distances == sorted(distances, reverse=True)
+
+
+def test_sort_score_is_best_first(universe):
+    _, _, objects = universe
+    scores = sorted((o.get("resources", o.get("resource_pool", {}))["Gold"]["score"]
+                     for o in objects if "Gold" in (o.get("resources") or o.get("resource_pool") or {})),
+                    reverse=True)
+    plan, rows = run(universe, "res=Gold sort score")
+    assert "sıralama" not in plan  # The resource index already yields this order
+    assert [row["score"] for row in rows] == scores
+
+    plan, rows = run(universe, "res=Gold sort -score")
+    assert [row["score"] for row in rows] == scores[::-1]
+
+
+def test_limit_keeps_the_first_rows_of_the_full_order(universe):
+    _, full = run(universe, "type=planet sort -radius")
+    plan, limited = run(universe, "type=planet sort -radius limit 7")
+    assert "sıralama" in plan  # Heap path: the spatial index doesn't produce this order
+    assert len(limited) == 7
+    assert [row["record"]["radius"] for row in limited] == [row["record"]["radius"] for row in full[:7]]
+
+    _, nearest = run(universe, "sort distance limit 5")
+    _, _, objects = universe
+    assert [round(row["distance"], 9) for row in nearest] == sorted(round(distance(o), 9) for o in objects)[:5]
+
+
+def test_rows_are_produced_lazily(universe):
+    manager, name, _ = universe
+    reads = []
+    read_chunk = manager.read_chunk
+    manager.read_chunk = lambda *args: reads.append(args) or read_chunk(*args)
+
+    _, rows = Query.parse("radius>0".split()).execute(manager, name, *ORIGIN)
+    assert reads == []
+    next(rows)
+
+
+class CountingManager:
+    def __init__(self):
+        self.reads = []
+
+    def read_chunk(self, chunk_x, chunk_y, universe_name):
+        self.reads.append((chunk_x, chunk_y))
+        return [{"name": f"o_{chunk_x}_{chunk_y}"}]
+
+
+def test_record_reader_evicts_least_recently_used_chunk():
+    manager = CountingManager()
+    reader = _RecordReader(manager, "test")
+    reader.MAX_CHUNKS = 3
+
+    def read(chunk):
+        return reader.record({"name": f"o_{chunk[0]}_{chunk[1]}", "chunk": chunk})
+
+    for chunk in [(0, 0), (1, 0), (2, 0), (0, 0), (3, 0), (0, 0)]:
+        assert read(chunk) is not None
+    # (0, 0) was used recently, so (1, 0) was evicted instead and (0, 0) was read only once
+    assert manager.reads == [(0, 0), (1, 0), (2, 0), (3, 0)]
+    read((1, 0))
+    assert manager.reads[-1] == (1, 0)
@@ -0,0 +1,55 @@
+import math
+import random
+
+import pytest
+
+from orbit.modules.resource_index import ResourceIndex
+
+from conftest import make_objects, RESOURCES, RICHNESS
+
+
+def postings(objects, resource, richness=None):
+    """(x, y, score, richness) of every body carrying a resource"""
+    found = []
+    for obj in objects:
+        data = (obj.get("resources") or obj.get("resource_pool") or {}).get(resource)
+        if data and (richness is None or data["richness"] == richness):
+            found.append((obj["x"], obj["y"], data["score"], data["richness"]))
+    return found
+
+
+@pytest.fixture(scope="module")
+def index_and_objects():
+    objects = make_objects(seed=9, count=500)
+    chunks = {}
+    for obj in objects:
+        chunks.setdefault((obj["x"] // 100, obj["y"] // 100), []).append(obj)
+    return ResourceIndex.build(chunks), objects
+
+
+@pytest.mark.parametrize("richness", [None] + RICHNESS)
+def test_top_is_sorted_by_score(index_and_objects, richness):
+    index, objects = index_and_objects
+    for resource in RESOURCES:
+        expected = sorted((p[2] for p in postings(objects, resource, richness)), reverse=True)[:15]
+        top = index.top(resource, 15, richness)
+        assert [p[ResourceIndex.SCORE] for p in top] == expected
+        assert all(richness is None or p[ResourceIndex.RICHNESS] == richness for p in top)
+
+
+@pytest.mark.parametrize("richness", [None, "rich"])
+def test_nearest_matches_brute_force(index_and_objects, richness):
+    index, objects = index_and_objects
+    rng = random.Random(3)
+    for _ in range(100):
+        resource = rng.choice(RESOURCES)
+        x, y, k = rng.randrange(-200, 1200), rng.randrange(-200, 1200), rng.randint(1, 10)
+        expected = sorted(math.hypot(px - x, py - y) for px, py, _, _ in postings(objects, resource, richness))[:k]
+        found = index.nearest(resource, x, y, 100, k, richness)
+        assert [d for d, _ in found] == pytest.approx(expected)
+
+
+def test_nearest_of_unknown_resource_is_empty(index_and_objects):
+    index, _ = index_and_objects
+    assert index.nearest("Unobtainium", 10, 10, 100) == []
+    assert index.top("Unobtainium") == []
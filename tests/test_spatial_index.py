@@ -0,0 +1,84 @@
+import math
+import random
+
+import pytest
+
+from orbit.modules.spatial_index import SpatialIndex
+
+from conftest import make_objects
+
+
+def chunked(objects, chunk_size=100):
+    chunks = {}
+    for obj in objects:
+        chunks.setdefault((obj["x"] // chunk_size, obj["y"] // chunk_size), []).append(obj)
+    return chunks
+
+
+def matches(obj, obj_type, prop):
+    return ((obj_type is None or obj["type"] == obj_type) and
+            (prop is None or (obj.get("prop") or "unknown").lower() == prop.lower()))
+
+
+def brute_force(objects, x, y, obj_type=None, prop=None):
+    return sorted(math.hypot(o["x"] - x, o["y"] - y) for o in objects if matches(o, obj_type, prop))
+
+
+FILTERS = [(None, None), ("planet", None), ("sun", "g"), ("asteroid_belt", None), ("black_hole", "stellar")]
+
+
+@pytest.fixture(scope="module")
+def index_and_objects():
+    objects = make_objects(seed=5, count=600)
+    return SpatialIndex.build(chunked(objects)), objects
+
+
+@pytest.mark.parametrize("obj_type, prop", FILTERS)
+def test_nearest_matches_brute_force(index_and_objects, obj_type, prop):
+    index, objects = index_and_objects
+    rng = random.Random(11)
+    for _ in range(50):
+        x, y, k = rng.randrange(-100, 1100), rng.randrange(-100, 1100), rng.randint(1, 12)
+        found = index.nearest(x, y, k, obj_type, prop)
+        expected = brute_force(objects, x, y, obj_type, prop)[:k]
+        assert [d for d, _ in found] == pytest.approx(expected)
+        for d, point in found:
+            assert matches(point, obj_type, prop)
+            assert d == pytest.approx(math.hypot(point["x"] - x, point["y"] - y))
+
+
+@pytest.mark.parametrize("obj_type, prop", FILTERS)
+def test_within_matches_brute_force(index_and_objects, obj_type, prop):
+    index, objects = index_and_objects
+    rng = random.Random(12)
+    for _ in range(50):
+        x, y, radius = rng.randrange(1000), rng.randrange(1000), rng.uniform(0, 300)
+        found = index.within(x, y, radius, obj_type, prop)
+        expected = [d for d in brute_force(objects, x, y, obj_type, prop) if d <= radius]
+        assert [d for d, _ in found] == pytest.approx(expected)
+
+
+def test_update_chunk_replaces_points_and_reorders(index_and_objects):
+    _, objects = index_and_objects
+    index = SpatialIndex.build(chunked(objects))
+    chunks = chunked(objects)
+    chunk = next(iter(chunks))
+    moved = [dict(obj, name=obj["name"] + "_new") for obj in chunks[chunk][:2]]
+    index.update_chunk(chunk[0], chunk[1], moved)
+
+    remaining = [o for o in objects if (o["x"] // 100, o["y"] // 100) != chunk] + moved
+    assert sum(index.counts().values()) == len(remaining)
+    x, y = chunk[0] * 100 + 50, chunk[1] * 100 + 50
+    assert [d for d, _ in index.nearest(x, y, 10)] == pytest.approx(brute_force(remaining, x, y)[:10])
+    names = {point["name"] for point in index.iter_points()}
+    assert {o["name"] for o in moved} <= names
+    assert not {o["name"] for o in chunks[chunk][2:]} & names
+
+
+def test_save_and_load_round_trip(tmp_path, index_and_objects):
+    index, objects = index_and_objects
+    index.save(tmp_path)
+    loaded = SpatialIndex.load(tmp_path)
+    assert loaded.counts() == index.counts()
+    assert [d for d, _ in loaded.nearest(300, 700, 8)] == pytest.approx(brute_force(objects, 300, 700)[:8])
+    assert SpatialIndex.load(tmp_path / "missing") is None
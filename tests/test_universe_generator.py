@@ -0,0 +1,72 @@
+import math
+import random
+
+from orbit.modules.enums import StarType
+from orbit.modules.celestial_objects import Star
+from orbit.modules.universe_generator import UniverseGenerator, _ObjectGrid
+
+
+def overlapping_planets(generator):
+    """Planet pairs of different stars closer than the generator's overlap clearance"""
+    bodies = [generator.generate_strip(strip) for strip in range(generator.strip_count)]
+    planets = [planet for strip in bodies for planet in strip["planets"]]
+    stars = [star for strip in bodies for star in strip["stars"]]
+
+    grid = {}
+    for body in planets + stars:
+        grid.setdefault((int(body.x // 100), int(body.y // 100)), []).append(body)
+
+    pairs = []
+    for planet in planets:
+        cell_x, cell_y = int(planet.x // 100), int(planet.y // 100)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for other in grid.get((cell_x + dx, cell_y + dy), ()):
+                    if other is planet or getattr(other, 'star_id', None) == planet.star_id:
+                        continue
+                    if isinstance(other, type(planet)) and id(other) < id(planet):
+                        continue
+                    distance = math.hypot(planet.x - other.x, planet.y - other.y)
+                    if distance < (planet.radius + other.radius) * _ObjectGrid.CLEARANCE:
+                        pairs.append((planet, other))
+    return pairs
+
+
+def test_planets_of_different_strips_keep_their_clearance():
+    for seed in range(3):
+        generator = UniverseGenerator(1500, 1500, seed=seed)
+        assert generator.strip_count > 4
+        assert overlapping_planets(generator) == []
+
+
+def place_near_boundary(keep_clear):
+    """Planets of a star sitting on the upper end of its y range"""
+    generator = UniverseGenerator(1500, 1500, seed=1)
+    y_range = (400, 600)
+    planets = []
+    for seed in range(200):
+        star = Star(750, 599, StarType.G, 5, 0)
+        planets.extend(generator.place_planets_for_star(
+            star, _ObjectGrid(100), random.Random(seed), y_range, mean_planets=8, keep_clear=keep_clear))
+    return y_range, planets
+
+
+def test_keep_clear_keeps_planet_discs_inside_the_range():
+    y_range, planets = place_near_boundary(keep_clear=True)
+    assert planets
+    for planet in planets:
+        reach = planet.radius * _ObjectGrid.CLEARANCE
+        assert y_range[0] <= planet.y - reach and planet.y + reach < y_range[1]
+
+    # Without it, discs cross the range end shared with the next even strip
+    y_range, planets = place_near_boundary(keep_clear=False)
+    assert any(planet.y + planet.radius * _ObjectGrid.CLEARANCE >= y_range[1] for planet in planets)
+
+
+def test_generation_is_deterministic_per_strip():
+    # Generating strips in a different order (as shards do) must not change them
+    forward = UniverseGenerator(800, 800, seed=3)
+    backward = UniverseGenerator(800, 800, seed=3)
+    expected = [forward.strip_records(forward.generate_strip(strip)) for strip in range(forward.strip_count)]
+    for strip in reversed(range(backward.strip_count)):
+        assert backward.strip_records(backward.generate_strip(strip)) == expected[strip]